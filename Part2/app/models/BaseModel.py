@@ -1,17 +1,76 @@
 # app/models/BaseModel.py
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Naive timestamps are kept as integer microseconds since this naive epoch
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _now():
+    """Current local time, packed."""
+    return _pack(datetime.now())
+
+
+def _pack(value):
+    # Timezone-aware datetimes are kept as they are, with their tzinfo
+    return value if value.tzinfo is not None else (value - _EPOCH) // _MICROSECOND
+
+
+def _unpack(value):
+    return value if isinstance(value, datetime) else _EPOCH + value * _MICROSECOND
+
 
 class BaseModel:
+    """
+    Common identity and timestamps of the models.
+
+    Models declare __slots__ so that instances carry no __dict__: the id is
+    kept as the 16 raw bytes of the UUID (other ids as given) and naive
+    timestamps as integer microseconds since 1970-01-01. The id, created_at
+    and updated_at attributes still read and write the usual str and
+    datetime values.
+    """
+
+    __slots__ = ('_id', '_created_at', '_updated_at')
+
     def __init__(self):
-        self.id = str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self._id = uuid.uuid4().bytes
+        # One int shared by both timestamps until the first save
+        self._created_at = self._updated_at = _now()
+
+    @property
+    def id(self):
+        return str(uuid.UUID(bytes=self._id)) if isinstance(self._id, bytes) else self._id
+
+    @id.setter
+    def id(self, value):
+        try:
+            key = uuid.UUID(value)
+        except (AttributeError, TypeError, ValueError):
+            key = None
+        self._id = key.bytes if key is not None and str(key) == value else value
+
+    @property
+    def created_at(self):
+        return _unpack(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value):
+        self._created_at = _pack(value)
+
+    @property
+    def updated_at(self):
+        return _unpack(self._updated_at)
+
+    @updated_at.setter
+    def updated_at(self, value):
+        self._updated_at = _pack(value)
 
     def save(self):
         """Update the updated_at timestamp whenever the object is modified"""
-        self.updated_at = datetime.now()
+        self._updated_at = _now()
 
     def update(self, data):
         """Update the attributes of the object based on the provided dictionary"""
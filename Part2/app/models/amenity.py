@@ -5,6 +5,8 @@ from app.models.BaseModel import BaseModel
 class Amenity(BaseModel):
     """Class representing an Amenity in the HBnB application."""
 
+    __slots__ = ('name', '_places')
+
     def __init__(self, name):
         """
         Initialize a new Amenity instance.
@@ -24,7 +26,17 @@ class Amenity(BaseModel):
             raise ValueError("Amenity name cannot exceed 50 characters")
 
         self.name = name
-        self.places = []  # List of places that have this amenity
+        self._places = None  # List of places that have this amenity, allocated on first use
+
+    @property
+    def places(self):
+        if self._places is None:
+            self._places = []
+        return self._places
+
+    @places.setter
+    def places(self, value):
+        self._places = list(value)
 
     def add_place(self, place):
         """
@@ -41,7 +53,7 @@ class Amenity(BaseModel):
             raise ValueError("Place must be a Place instance")
 
         if place not in self.places:
-            self.places.append(place)
+            self._places.append(place)
             # Add this amenity to the place's amenities if not already present
             if self not in place.amenities:
                 place.add_amenity(self)
@@ -53,8 +65,8 @@ class Amenity(BaseModel):
         Args:
             place (Place): Place instance to remove
         """
-        if place in self.places:
-            self.places.remove(place)
+        if place in (self._places or ()):
+            self._places.remove(place)
             # Remove this amenity from the place's amenities if present
             if self in place.amenities:
                 place.remove_amenity(self)
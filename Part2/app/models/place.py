@@ -1,12 +1,102 @@
 # app/models/place.py
 
+import weakref
+from collections.abc import MutableSequence
 from app.models.BaseModel import BaseModel
 from app.models.user import User
 
 
+class _AmenitySet:
+    """Holder of an amenity tuple; tuples themselves cannot be weakly referenced."""
+
+    __slots__ = ('items', '__weakref__')
+
+    def __init__(self, items):
+        self.items = items
+
+
+# Amenity tuples shared by every place with the same amenities, in the same order.
+# An entry lives as long as a place holds it, so sets no place has any more,
+# such as the intermediate ones of successive add_amenity calls, are dropped.
+_AMENITY_SETS = weakref.WeakValueDictionary()
+
+
+def _intern_amenities(amenities):
+    amenities = tuple(amenities)
+    shared = _AMENITY_SETS.get(amenities)
+    if shared is None:
+        shared = _AMENITY_SETS[amenities] = _AmenitySet(amenities)
+    return shared
+
+
+class _AmenityList(MutableSequence):
+    """
+    List view of a place's amenities.
+
+    Built on the first read of Place.amenities and kept in the place's
+    _amenities slot in place of the interned set it wraps, so a place needs
+    no extra slot and repeated reads return the same view. Reads go to the
+    interned tuple; every change builds the new sequence and interns it again.
+    """
+
+    __slots__ = ('_shared',)
+
+    def __init__(self, shared):
+        self._shared = shared
+
+    def _items(self):
+        return self._shared.items
+
+    def _assign(self, items):
+        self._shared = _intern_amenities(items)
+
+    def __getitem__(self, index):
+        items = self._items()[index]
+        return list(items) if isinstance(index, slice) else items
+
+    def __len__(self):
+        return len(self._items())
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __contains__(self, amenity):
+        return amenity in self._items()
+
+    def __setitem__(self, index, value):
+        items = list(self._items())
+        items[index] = value
+        self._assign(items)
+
+    def __delitem__(self, index):
+        items = list(self._items())
+        del items[index]
+        self._assign(items)
+
+    def insert(self, index, value):
+        items = list(self._items())
+        items.insert(index, value)
+        self._assign(items)
+
+    def __eq__(self, other):
+        if isinstance(other, _AmenityList):
+            other = other._items()
+        if isinstance(other, (list, tuple)):
+            return list(self._items()) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self._items()))
+
+
 class Place(BaseModel):
     """Class representing a Place in the HBnB application."""
 
+    __slots__ = ('title', 'description', 'price', 'latitude', 'longitude', 'owner',
+                 '_reviews', '_amenities', '_rating_histogram')
+
     def __init__(self, title, description, price, latitude, longitude, owner):
         """
         Initialize a new Place instance.
@@ -62,35 +152,109 @@ class Place(BaseModel):
         self.latitude = latitude
         self.longitude = longitude
         self.owner = owner
-        self.reviews = []  # List to store related reviews
-        self.amenities = []  # List to store related amenities
+        self._reviews = None  # List of related reviews, allocated on first use
+        # Interned set of related amenities, replaced by its list view once read
+        self._amenities = _intern_amenities(())
+        # Rating aggregate, kept in sync with self.reviews; review_count and
+        # rating_sum are derived from it. None until the first review
+        self._rating_histogram = None  # rating_histogram[r - 1] counts ratings of r
 
         # Add this place to the owner's places
         owner.add_place(self)
 
+    @property
+    def reviews(self):
+        if self._reviews is None:
+            self._reviews = []
+        return self._reviews
+
+    @reviews.setter
+    def reviews(self, value):
+        self._reviews = list(value)
+
+    @property
+    def amenities(self):
+        if not isinstance(self._amenities, _AmenityList):
+            self._amenities = _AmenityList(self._amenities)
+        return self._amenities
+
+    @amenities.setter
+    def amenities(self, value):
+        self._set_amenities(_intern_amenities(value))
+
+    def _amenity_set(self):
+        """The interned amenity set, whether or not the list view was built."""
+        amenities = self._amenities
+        return amenities._shared if isinstance(amenities, _AmenityList) else amenities
+
+    def _set_amenities(self, shared):
+        if isinstance(self._amenities, _AmenityList):
+            self._amenities._shared = shared
+        else:
+            self._amenities = shared
+
+    @property
+    def rating_histogram(self):
+        if self._rating_histogram is None:
+            return [0] * 5
+        return self._rating_histogram
+
+    @property
+    def review_count(self):
+        return sum(self._rating_histogram) if self._rating_histogram else 0
+
+    @property
+    def rating_sum(self):
+        if self._rating_histogram is None:
+            return 0
+        return sum(rating * count for rating, count in enumerate(self._rating_histogram, 1))
+
     def add_review(self, review):
         """Add a review to the place."""
         self.reviews.append(review)
+        self._count_rating(review.rating, 1)
+
+    def remove_review(self, review):
+        """Remove a review from the place."""
+        if review in (self._reviews or ()):
+            self._reviews.remove(review)
+            self._count_rating(review.rating, -1)
+
+    def change_rating(self, old_rating, new_rating):
+        """Move one review of this place from old_rating to new_rating."""
+        self._count_rating(old_rating, -1)
+        self._count_rating(new_rating, 1)
+
+    def _count_rating(self, rating, step):
+        if self._rating_histogram is None:
+            self._rating_histogram = [0] * 5
+        self._rating_histogram[rating - 1] += step
+
+    def recompute_ratings(self):
+        """Rebuild the rating aggregates from self.reviews."""
+        self._rating_histogram = None
+        for review in self._reviews or ():
+            self._count_rating(review.rating, 1)
 
     def add_amenity(self, amenity):
         """Add an amenity to the place."""
-        if amenity not in self.amenities:
-            self.amenities.append(amenity)
+        items = self._amenity_set().items
+        if amenity not in items:
+            self._set_amenities(_intern_amenities(items + (amenity,)))
 
     def remove_amenity(self, amenity):
         """Remove an amenity from the place."""
-        if amenity in self.amenities:
-            self.amenities.remove(amenity)
+        items = self._amenity_set().items
+        if amenity in items:
+            self._set_amenities(_intern_amenities(a for a in items if a is not amenity))
 
     def get_average_rating(self):
         """
-        Calculate the average rating for this place.
+        Return the average rating for this place from its aggregates.
 
         Returns:
             float: Average rating or 0 if no reviews
         """
-        if not self.reviews:
+        if not self.review_count:
             return 0
-
-        total_rating = sum(review.rating for review in self.reviews)
-        return total_rating / len(self.reviews)
+        return self.rating_sum / self.review_count
@@ -7,6 +7,8 @@ from app.models.user import User
 class Review(BaseModel):
     """Class representing a Review in the HBnB application."""
 
+    __slots__ = ('text', 'rating', 'place', 'user')
+
     def __init__(self, text, rating, place, user):
         """
         Initialize a new Review instance.
@@ -50,6 +52,24 @@ class Review(BaseModel):
         # Add this review to the user's reviews
         user.add_review(self)
 
+    @property
+    def place_id(self):
+        return self.place.id
+
+    @place_id.setter
+    def place_id(self, value):
+        if value != self.place.id:
+            raise ValueError("A review cannot be moved to another place")
+
+    @property
+    def user_id(self):
+        return self.user.id
+
+    @user_id.setter
+    def user_id(self, value):
+        if value != self.user.id:
+            raise ValueError("A review cannot be given to another user")
+
     def update_rating(self, new_rating):
         """
         Update the review rating.
@@ -65,5 +85,6 @@ class Review(BaseModel):
         if new_rating < 1 or new_rating > 5:
             raise ValueError("Rating must be between 1 and 5")
 
-        self.rating = new_rating
+        old_rating, self.rating = self.rating, new_rating
+        self.place.change_rating(old_rating, new_rating)
         self.save()  # Update the updated_at timestamp
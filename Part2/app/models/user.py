@@ -6,6 +6,8 @@ from app.models.BaseModel import BaseModel
 class User(BaseModel):
     """Class representing a User in the HBnB application."""
 
+    __slots__ = ('first_name', 'last_name', 'email', 'is_admin', '_places', '_reviews')
+
     def __init__(self, first_name, last_name, email, is_admin=False):
         """
         Initialize a new User instance.
@@ -49,8 +51,29 @@ class User(BaseModel):
         self.last_name = last_name
         self.email = email
         self.is_admin = is_admin
-        self.places = []  # List to store places owned by the user
-        self.reviews = []  # List to store reviews written by the user
+        # Lists of owned places and written reviews, allocated on first use
+        self._places = None
+        self._reviews = None
+
+    @property
+    def places(self):
+        if self._places is None:
+            self._places = []
+        return self._places
+
+    @places.setter
+    def places(self, value):
+        self._places = list(value)
+
+    @property
+    def reviews(self):
+        if self._reviews is None:
+            self._reviews = []
+        return self._reviews
+
+    @reviews.setter
+    def reviews(self, value):
+        self._reviews = list(value)
 
     def add_place(self, place):
         """Add a place to the user's owned places."""
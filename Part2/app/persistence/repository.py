@@ -1,7 +1,28 @@
 #Part2/app/persistence/repository.py
 
+import uuid
 from abc import ABC, abstractmethod
 
+# Sentinel for objects that do not carry an indexed attribute
+_MISSING = object()
+
+
+def _key(obj_id):
+    """Storage key of an id: the 16 bytes of a canonical UUID string, other ids as they are."""
+    try:
+        key = uuid.UUID(obj_id)
+    except (AttributeError, TypeError, ValueError):
+        return obj_id
+    # Braced, URN or undashed spellings stay distinct ids, as they were as strings
+    return key.bytes if str(key) == obj_id else obj_id
+
+
+def _obj_key(obj):
+    # Compact models keep their UUID as bytes: the key is shared, not rebuilt
+    key = getattr(obj, '_id', None)
+    return key if key is not None else _key(obj.id)
+
+
 class Repository(ABC):
     @abstractmethod
     def add(self, obj):
@@ -27,16 +48,99 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def get_all_by_attribute(self, attr_name, attr_value):
+        pass
+
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    def __init__(self, indexes=(), unique_indexes=()):
+        """
+        Initialize the repository.
+
+        Args:
+            indexes (iterable): Attribute names to index (non-unique)
+            unique_indexes (iterable): Attribute names whose values must be unique
+        """
+        # Keyed by _key(obj.id) rather than the 36-char id string
         self._storage = {}
+        # attr_name -> {value -> {storage key -> obj}}
+        self._indexes = {}
+        self._unique = set()
+        for attr_name in unique_indexes:
+            self.add_index(attr_name, unique=True)
+        for attr_name in indexes:
+            self.add_index(attr_name)
+
+    def add_index(self, attr_name, unique=False):
+        """
+        Declare a hash index on an attribute and build it from the stored objects.
+
+        Lookups through get_by_attribute on an indexed attribute are O(1)
+        instead of a scan over the whole storage.
+
+        Raises:
+            ValueError: If unique is True and stored objects share a value
+        """
+        index = {}
+        for obj in self._storage.values():
+            value = getattr(obj, attr_name, _MISSING)
+            if value is _MISSING:
+                continue
+            bucket = index.setdefault(value, {})
+            if unique and bucket:
+                raise ValueError(f"Duplicate value for unique attribute '{attr_name}': {value!r}")
+            bucket[_obj_key(obj)] = obj
+        self._indexes[attr_name] = index
+        if unique:
+            self._unique.add(attr_name)
+
+    def _index_obj(self, obj):
+        key = _obj_key(obj)
+        for attr_name, index in self._indexes.items():
+            value = getattr(obj, attr_name, _MISSING)
+            if value is not _MISSING:
+                index.setdefault(value, {})[key] = obj
+
+    def _unindex_obj(self, obj, values):
+        key = _obj_key(obj)
+        for attr_name, value in values.items():
+            bucket = self._indexes[attr_name].get(value)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self._indexes[attr_name][value]
+
+    def _indexed_values(self, obj):
+        return {attr_name: getattr(obj, attr_name, _MISSING) for attr_name in self._indexes}
+
+    def _live(self, bucket):
+        """Yield indexed objects that are still held in the storage."""
+        for key, obj in bucket.items():
+            if self._storage.get(key) is obj:
+                yield obj
+
+    def _check_unique(self, key, values):
+        """Raise ValueError if any unique value is already held by another object than the one at key."""
+        for attr_name in self._unique:
+            value = values.get(attr_name, _MISSING)
+            if value is _MISSING:
+                continue
+            bucket = self._indexes[attr_name].get(value)
+            if bucket and any(_obj_key(other) != key for other in self._live(bucket)):
+                raise ValueError(f"Duplicate value for unique attribute '{attr_name}': {value!r}")
 
     def add(self, obj):
-        self._storage[obj.id] = obj
+        key = _obj_key(obj)
+        self._check_unique(key, self._indexed_values(obj))
+        previous = self._storage.get(key)
+        if previous is not None:
+            self._unindex_obj(previous, self._indexed_values(previous))
+        self._storage[key] = obj
+        self._index_obj(obj)
 
     def get(self, obj_id):
-        return self._storage.get(obj_id)
+        return self._storage.get(_key(obj_id))
 
     def get_all(self):
         return list(self._storage.values())
@@ -44,15 +148,37 @@ class InMemoryRepository(Repository):
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
-            obj.update(data)
+            old_values = self._indexed_values(obj)
+            self._check_unique(_obj_key(obj), {
+                attr_name: data[attr_name] for attr_name in self._unique
+                if attr_name in data and hasattr(obj, attr_name)
+            })
+            self._unindex_obj(obj, old_values)
+            try:
+                obj.update(data)
+            finally:
+                self._index_obj(obj)
             return obj
 
     def delete(self, obj_id):
-        if obj_id in self._storage:
-            del self._storage[obj_id]
+        key = _key(obj_id)
+        if key in self._storage:
+            obj = self._storage.pop(key)
+            self._unindex_obj(obj, self._indexed_values(obj))
 
     def get_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            bucket = index.get(attr_value)
+            return next(self._live(bucket), None) if bucket else None
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
-    
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            bucket = index.get(attr_value)
+            return list(self._live(bucket)) if bucket else []
+        return [obj for obj in self._storage.values() if getattr(obj, attr_name, _MISSING) == attr_value]
+
     def find_by_email(self, email):
         return self.get_by_attribute('email', email)
@@ -8,10 +8,10 @@ from app.models.amenity import Amenity
 
 class HBnBFacade:
     def __init__(self):
-        self.user_repo = InMemoryRepository()
+        self.user_repo = InMemoryRepository(unique_indexes=('email',))
         self.place_repo = InMemoryRepository()
-        self.review_repo = InMemoryRepository()
-        self.amenity_repo = InMemoryRepository()
+        self.review_repo = InMemoryRepository(indexes=('place_id',))
+        self.amenity_repo = InMemoryRepository(indexes=('name',))
 
     """
     User
@@ -102,12 +102,20 @@ class HBnBFacade:
         return self.review_repo.get_all()
 
     def get_reviews_by_place(self, place_id):
-        return self.review_repo.get_by_attribute('place_id', place_id)
+        return self.review_repo.get_all_by_attribute('place_id', place_id)
 
     def update_review(self, review_id, review_data):
+        review = self.review_repo.get(review_id)
+        if review and 'rating' in review_data:
+            # Goes through the model so the place's rating aggregates follow
+            review_data = dict(review_data)
+            review.update_rating(review_data.pop('rating'))
         self.review_repo.update(review_id, review_data)
         return self.review_repo.get(review_id)
 
     def delete_review(self, review_id):
+        review = self.review_repo.get(review_id)
+        if review:
+            review.place.remove_review(review)
         self.review_repo.delete(review_id)
         return self.review_repo.get_all()
@@ -0,0 +1,122 @@
+#Part2/benchmarks/bench_model_memory.py
+"""
+Benchmark the memory held by places, their owners and amenities in
+InMemoryRepository, for the compact models against the previous layout.
+
+Usage (from Part2/):
+    python -m benchmarks.bench_model_memory [sizes...]
+
+The previous layout is replicated below without validation: a __dict__
+per instance, a 36-char str id, two datetimes and a list per collection,
+stored under that id string.
+
+Each size is a number of places; there is one owner per 10 places, and
+each place gets 3 of 10 shared amenities. Memory is measured with
+tracemalloc, from empty to everything stored in the repositories.
+"""
+
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+from app.persistence.repository import InMemoryRepository
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+AMENITIES = 10
+PLACES_PER_OWNER = 10
+
+
+class LegacyRepository:
+    """InMemoryRepository.add without indexes, as it was: objects stored under their id string."""
+
+    def __init__(self):
+        self._storage = {}
+
+    def add(self, obj):
+        self._storage[obj.id] = obj
+
+
+class LegacyBase:
+    def __init__(self):
+        self.id = str(uuid.uuid4())
+        self.created_at = datetime.now()
+        self.updated_at = datetime.now()
+
+
+class LegacyUser(LegacyBase):
+    def __init__(self, first_name, last_name, email):
+        super().__init__()
+        self.first_name = first_name
+        self.last_name = last_name
+        self.email = email
+        self.is_admin = False
+        self.places = []
+        self.reviews = []
+
+
+class LegacyAmenity(LegacyBase):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.places = []
+
+
+class LegacyPlace(LegacyBase):
+    def __init__(self, title, description, price, latitude, longitude, owner):
+        super().__init__()
+        self.title = title
+        self.description = description
+        self.price = price
+        self.latitude = latitude
+        self.longitude = longitude
+        self.owner = owner
+        self.reviews = []
+        self.amenities = []
+        self.review_count = 0
+        self.rating_sum = 0
+        self.rating_histogram = [0] * 5
+        owner.places.append(self)
+
+    def add_amenity(self, amenity):
+        if amenity not in self.amenities:
+            self.amenities.append(amenity)
+
+
+def build(count, user_class, place_class, amenity_class, repository_class):
+    """Store count places, their owners and amenities; return the repositories and the bytes they hold."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    users, places, amenities = repository_class(), repository_class(), repository_class()
+    shared = [amenity_class(f"Amenity {i}") for i in range(AMENITIES)]
+    for amenity in shared:
+        amenities.add(amenity)
+    owner = None
+    for i in range(count):
+        if i % PLACES_PER_OWNER == 0:
+            owner = user_class("Owner", str(i), f"owner{i}@example.com")
+            users.add(owner)
+        place = place_class(f"Place {i}", None, 50 + i % 200, 48.8, 2.3, owner)
+        for k in range(3):
+            place.add_amenity(shared[(i + k * (i % 3 + 1)) % AMENITIES])
+        places.add(place)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return (users, places, amenities), used
+
+
+def main(sizes):
+    print(f"{'places':>10} {'previous (MB)':>14} {'compact (MB)':>13} {'B/place':>8} {'saved':>6}")
+    for count in sizes:
+        kept, before = build(count, LegacyUser, LegacyPlace, LegacyAmenity, LegacyRepository)
+        del kept
+        kept, after = build(count, User, Place, Amenity, InMemoryRepository)
+        del kept
+        print(f"{count:>10} {before / 2**20:>14.1f} {after / 2**20:>13.1f} {after / count:>8.0f} "
+              f"{1 - after / before:>6.0%}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
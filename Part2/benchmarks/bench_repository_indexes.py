@@ -0,0 +1,51 @@
+#Part2/benchmarks/bench_repository_indexes.py
+"""
+Benchmark email lookups on InMemoryRepository with and without the email index.
+
+Usage (from Part2/):
+    python -m benchmarks.bench_repository_indexes [sizes...]
+
+Indexed lookups should stay flat from 1k to 1M users while the
+linear scan grows with the number of stored users.
+"""
+
+import sys
+import time
+from app.persistence.repository import InMemoryRepository
+from app.models.user import User
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LOOKUPS = 1_000
+SCAN_LOOKUPS = 20
+
+
+def build_users(count):
+    return [User("User", str(i), f"user{i}@example.com") for i in range(count)]
+
+
+def time_lookups(repo, emails):
+    start = time.perf_counter()
+    for email in emails:
+        repo.find_by_email(email)
+    return (time.perf_counter() - start) / len(emails)
+
+
+def main(sizes):
+    print(f"{'users':>10} {'indexed (us)':>14} {'scan (us)':>12}")
+    for count in sizes:
+        users = build_users(count)
+        indexed = InMemoryRepository(unique_indexes=('email',))
+        scanned = InMemoryRepository()
+        for user in users:
+            indexed.add(user)
+            scanned.add(user)
+
+        step = max(1, count // LOOKUPS)
+        emails = [users[i].email for i in range(0, count, step)][:LOOKUPS]
+        indexed_time = time_lookups(indexed, emails)
+        scan_time = time_lookups(scanned, emails[-SCAN_LOOKUPS:])
+        print(f"{count:>10} {indexed_time * 1e6:>14.2f} {scan_time * 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
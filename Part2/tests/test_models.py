@@ -0,0 +1,130 @@
+#Part2/tests/test_models.py
+import gc
+import unittest
+from datetime import datetime, timezone, timedelta
+from app.persistence.repository import InMemoryRepository
+from app.models.user import User
+from app.models.place import _AMENITY_SETS, Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+
+
+class TestCompactModels(unittest.TestCase):
+    def setUp(self):
+        self.owner = User("John", "Doe", "john.doe@example.com")
+        self.guest = User("Jane", "Doe", "jane.doe@example.com")
+        self.place = Place("Beach House", None, 200, 34.05, -118.24, self.owner)
+
+    def test_no_instance_dict(self):
+        """Test that the models keep their attributes in slots."""
+        for obj in (self.owner, self.place, Amenity("WiFi")):
+            self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_id_and_timestamps_keep_their_types(self):
+        """Test that compact storage still reads as str ids and datetimes."""
+        self.assertEqual(len(self.place.id), 36)
+        self.assertEqual(len(self.place._id), 16)
+        self.assertIsInstance(self.place.created_at, datetime)
+        before = self.place.updated_at
+        self.place.update({'title': "Lake House"})
+        self.assertEqual(self.place.title, "Lake House")
+        self.assertGreaterEqual(self.place.updated_at, before)
+        stamp = datetime(2024, 5, 17, 12, 30, 15, 123456)
+        self.place.created_at = stamp
+        self.assertEqual(self.place.created_at, stamp)
+
+    def test_timestamps_before_1970_and_with_timezone(self):
+        """Test that timestamps round-trip exactly, whatever their era or tzinfo."""
+        stamp = datetime(1969, 12, 31, 23, 59, 59, 500000)
+        self.place.created_at = stamp
+        self.assertEqual(self.place.created_at, stamp)
+        aware = datetime(2024, 5, 17, 12, 30, tzinfo=timezone(timedelta(hours=2)))
+        self.place.updated_at = aware
+        self.assertEqual(self.place.updated_at.utcoffset(), timedelta(hours=2))
+        self.assertEqual(self.place.updated_at, aware)
+
+    def test_amenity_tuples_are_shared(self):
+        """Test that places with the same amenities share one tuple."""
+        wifi, pool = Amenity("WiFi"), Amenity("Pool")
+        other = Place("Lake House", None, 100, 45.0, 6.0, self.owner)
+        for place in (self.place, other):
+            place.add_amenity(wifi)
+            pool.add_place(place)
+        self.assertEqual(self.place.amenities, (wifi, pool))
+        self.assertIs(self.place._amenity_set(), other._amenity_set())
+        self.assertEqual(pool.places, [self.place, other])
+        pool.remove_place(other)
+        self.assertEqual(other.amenities, (wifi,))
+        self.assertEqual(self.place.amenities, (wifi, pool))
+
+    def test_unused_amenity_sets_are_dropped(self):
+        """Test that interned amenity sets only live while a place holds them."""
+        wifi, pool, sauna = Amenity("WiFi"), Amenity("Pool"), Amenity("Sauna")
+        for amenity in (wifi, pool, sauna):
+            self.place.add_amenity(amenity)
+        gc.collect()
+        self.assertNotIn((wifi,), _AMENITY_SETS)
+        self.assertNotIn((wifi, pool), _AMENITY_SETS)
+        self.assertIn((wifi, pool, sauna), _AMENITY_SETS)
+        self.place.remove_amenity(sauna)
+        gc.collect()
+        self.assertNotIn((wifi, pool, sauna), _AMENITY_SETS)
+        self.assertIs(_AMENITY_SETS[(wifi, pool)], self.place._amenity_set())
+
+    def test_collections_are_lists_whether_empty_or_not(self):
+        """Test that reviews and amenities take list operations in every state."""
+        wifi, pool = Amenity("WiFi"), Amenity("Pool")
+        other = Place("Lake House", None, 100, 45.0, 6.0, self.owner)
+        for place in (self.place, other):
+            self.assertEqual(place.reviews, [])
+            self.assertEqual(place.amenities, [])
+        other.add_amenity(wifi)
+        self.place.amenities.append(wifi)
+        self.assertIs(self.place._amenity_set(), other._amenity_set())
+        self.place.amenities.append(pool)
+        self.assertEqual(self.place.amenities, [wifi, pool])
+        self.assertEqual(other.amenities, [wifi])
+        self.place.amenities.remove(wifi)
+        self.assertEqual(self.place.amenities, [pool])
+        self.assertIs(self.place.amenities, self.place.amenities)
+        review = Review("Great stay", 4, other, self.guest)
+        self.place.reviews.append(review)
+        self.assertEqual(self.place.reviews, [review])
+        self.assertEqual(self.owner.reviews, [])
+        self.owner.reviews.append(review)
+        self.assertEqual(self.owner.reviews, [review])
+        self.assertEqual(wifi.places, [])
+
+    def test_review_aggregates_and_references(self):
+        """Test the derived rating aggregates and review ids."""
+        self.assertEqual((self.place.review_count, self.place.rating_sum), (0, 0))
+        self.assertEqual(self.place.reviews, [])
+        review = Review("Great stay", 4, self.place, self.guest)
+        Review("Fine", 2, self.place, self.owner)
+        self.assertEqual((self.place.review_count, self.place.rating_sum), (2, 6))
+        self.assertEqual(self.place.rating_histogram, [0, 1, 0, 1, 0])
+        self.assertEqual(review.place_id, self.place.id)
+        self.assertEqual(self.guest.reviews, [review])
+        with self.assertRaises(ValueError):
+            review.update({'place_id': self.guest.id})
+        review.update({'place_id': self.place.id, 'text': "Lovely"})
+        self.assertEqual(review.text, "Lovely")
+
+    def test_repository_lookups_by_str_id(self):
+        """Test that repositories keyed by raw UUIDs still take str ids."""
+        repo = InMemoryRepository(indexes=('place_id',))
+        review = Review("Great stay", 5, self.place, self.guest)
+        repo.add(review)
+        self.assertIs(repo.get(review.id), review)
+        self.assertIsNone(repo.get("not-a-uuid"))
+        # Only the canonical spelling of an id finds the object
+        for spelling in ('{%s}' % review.id, 'urn:uuid:' + review.id,
+                         review.id.replace('-', ''), review.id.upper()):
+            self.assertIsNone(repo.get(spelling))
+        self.assertEqual(repo.get_all_by_attribute('place_id', self.place.id), [review])
+        repo.delete(review.id)
+        self.assertIsNone(repo.get(review.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
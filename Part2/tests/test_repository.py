@@ -0,0 +1,70 @@
+#Part2/tests/test_repository.py
+import unittest
+from app.persistence.repository import InMemoryRepository
+from app.models.user import User
+from app.models.amenity import Amenity
+
+
+class TestInMemoryRepositoryIndexes(unittest.TestCase):
+    def setUp(self):
+        self.repo = InMemoryRepository(unique_indexes=('email',), indexes=('last_name',))
+        self.john = User("John", "Doe", "john.doe@example.com")
+        self.jane = User("Jane", "Doe", "jane.doe@example.com")
+        self.repo.add(self.john)
+        self.repo.add(self.jane)
+
+    def test_unique_index_lookup(self):
+        """Test that an indexed lookup returns the matching object."""
+        self.assertIs(self.repo.find_by_email("jane.doe@example.com"), self.jane)
+        self.assertIsNone(self.repo.find_by_email("nobody@example.com"))
+
+    def test_non_unique_index_lookup(self):
+        """Test that a non-unique index returns one of the matching objects."""
+        self.assertIn(self.repo.get_by_attribute('last_name', "Doe"), (self.john, self.jane))
+
+    def test_unique_index_rejects_duplicates(self):
+        """Test that adding a second object with the same unique value fails."""
+        with self.assertRaises(ValueError):
+            self.repo.add(User("Johnny", "Doe", "john.doe@example.com"))
+        self.assertEqual(len(self.repo.get_all()), 2)
+
+    def test_update_moves_index_entry(self):
+        """Test that updating an indexed attribute re-indexes the object."""
+        self.repo.update(self.john.id, {'email': "jonathan@example.com"})
+        self.assertIsNone(self.repo.find_by_email("john.doe@example.com"))
+        self.assertIs(self.repo.find_by_email("jonathan@example.com"), self.john)
+
+    def test_update_rejects_duplicate_unique_value(self):
+        """Test that an update cannot steal another object's unique value."""
+        with self.assertRaises(ValueError):
+            self.repo.update(self.john.id, {'email': "jane.doe@example.com"})
+        self.assertEqual(self.john.email, "john.doe@example.com")
+        self.assertIs(self.repo.find_by_email("john.doe@example.com"), self.john)
+
+    def test_delete_removes_index_entry(self):
+        """Test that deleting an object drops it from every index."""
+        self.repo.delete(self.jane.id)
+        self.assertIsNone(self.repo.find_by_email("jane.doe@example.com"))
+        self.assertIs(self.repo.get_by_attribute('last_name', "Doe"), self.john)
+
+    def test_add_index_on_existing_data(self):
+        """Test that an index declared later is built from stored objects."""
+        repo = InMemoryRepository()
+        wifi = Amenity("WiFi")
+        repo.add(wifi)
+        repo.add_index('name')
+        self.assertIs(repo.get_by_attribute('name', "WiFi"), wifi)
+
+    def test_get_all_by_attribute(self):
+        """Test that a non-unique index returns every matching object."""
+        self.assertCountEqual(self.repo.get_all_by_attribute('last_name', "Doe"), [self.john, self.jane])
+        self.assertEqual(self.repo.get_all_by_attribute('last_name', "Smith"), [])
+        self.assertEqual(self.repo.get_all_by_attribute('first_name', "Jane"), [self.jane])
+
+    def test_unindexed_attribute_falls_back_to_scan(self):
+        """Test that lookups on attributes without an index still work."""
+        self.assertIs(self.repo.get_by_attribute('first_name', "Jane"), self.jane)
+
+
+if __name__ == '__main__':
+    unittest.main()
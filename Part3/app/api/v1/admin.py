@@ -1,7 +1,7 @@
 #app/api/v1/admin.py
 
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
 
 api = Namespace('admin', description='Admin-only operations')
@@ -36,8 +36,8 @@ review_model = api.model('Review', {
 })
 
 def is_admin(user_id):
-    user = facade.get_user_by_id(user_id)
-    return user.is_admin if user else False
+    """Admin role of the token's user, from its claims and the permission snapshot."""
+    return facade.is_admin(user_id, claims=get_jwt())
 
 @api.route('/users')
 class AdminUserList(Resource):
@@ -1,7 +1,7 @@
 # app/api/v1/amenities.py
 
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
 
 api = Namespace('amenities', description='Amenity operations')
@@ -20,7 +20,7 @@ class AmenityList(Resource):
     def post(self):
         """Register a new amenity (Admin only)"""
         current_user = get_jwt()
-        if not current_user.get('is_admin'):
+        if not facade.is_admin(get_jwt_identity(), claims=current_user):
             return {'error': 'Admin privileges required'}, 403
         amenity_data = api.payload
         new_amenity = facade.create_amenity(amenity_data)
@@ -52,7 +52,7 @@ class AmenityResource(Resource):
     def put(self, amenity_id):
         """Update an amenity's information (Admin only)"""
         current_user = get_jwt()
-        if not current_user.get('is_admin'):
+        if not facade.is_admin(get_jwt_identity(), claims=current_user):
             return {'error': 'Admin privileges required'}, 403
         amenity_data = api.payload
         updated_amenity = facade.update_amenity(amenity_id, amenity_data)
@@ -24,5 +24,6 @@ class AuthLogin(Resource):
         if not user or not user.verify_password(auth_data['password']):
             return {'error': 'Invalid credentials'}, 401
 
-        access_token = create_access_token(identity=user.id)
+        # Role claims spare protected endpoints a user lookup
+        access_token = create_access_token(identity=user.id, additional_claims=facade.role_claims(user))
         return {'access_token': access_token}, 200
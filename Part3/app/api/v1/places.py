@@ -58,15 +58,15 @@ class PlaceResource(Resource):
     def put(self, place_id):
         """Update a Place (partial updates allowed)."""
         current_user = get_jwt()
-        is_admin = current_user.get('is_admin', False)
         user_id = current_user.get('id')
+        is_admin = facade.is_admin(user_id, claims=current_user)
         try:
             place = facade.get_place(place_id)
             if not place:
                 return {'message': 'Place not found'}, 404
             if not is_admin and place.owner_id != user_id:
                 return {'error': 'Unauthorized action'}, 403
-            updated_place = facade.update_place(place_id, api.payload, user_id=user_id)
+            updated_place = facade.update_place(place_id, api.payload, user_id=user_id, is_admin=is_admin)
             return {'message': 'Place updated successfully'}, 200
         except ValueError as e:
             return {'message': str(e)}, 400
@@ -76,8 +76,8 @@ class ReviewResource(Resource):
     def put(self, review_id):
         """Update a review"""
         current_user = get_jwt()
-        is_admin = current_user.get('is_admin', False)
         user_id = current_user.get('id')
+        is_admin = facade.is_admin(user_id, claims=current_user)
         review_update = api.payload
         try:
             review = facade.get_review(review_id)
@@ -86,7 +86,7 @@ class ReviewResource(Resource):
             if not is_admin and review.user_id != user_id:
                 return {"error": "Unauthorized action"}, 403
             validate_rating(review_update['rating'])
-            updated_review = facade.update_review(review_id, review_update, user_id=user_id)
+            updated_review = facade.update_review(review_id, review_update, user_id=user_id, is_admin=is_admin)
             return {
                 "message": "Review updated successfully",
                 "data": updated_review.to_dict()
@@ -101,15 +101,15 @@ class ReviewResource(Resource):
     def delete(self, review_id):
         """Delete a review"""
         current_user = get_jwt()
-        is_admin = current_user.get('is_admin', False)
         user_id = current_user.get('id')
+        is_admin = facade.is_admin(user_id, claims=current_user)
         try:
             review = facade.get_review(review_id)
             if not review:
                 return {"error": "Review not found"}, 404
             if not is_admin and review.user_id != user_id:
                 return {"error": "Unauthorized action"}, 403
-            facade.delete_review(review_id, user_id=user_id)
+            facade.delete_review(review_id, user_id=user_id, is_admin=is_admin)
             return {"message": "Review deleted successfully"}, 200
         except Exception as e:
             return {"error": "An unexpected error occurred."}, 500
@@ -23,7 +23,7 @@ class UserList(Resource):
     def post(self):
         """Register a new user (Admin only)"""
         current_user = get_jwt()
-        if not current_user.get('is_admin'):
+        if not facade.is_admin(get_jwt_identity(), claims=current_user):
             return {'error': 'Admin privileges required'}, 403
         user_data = api.payload
         existing_user = facade.get_user_by_email(user_data['email'])
@@ -66,7 +66,7 @@ class UserResource(Resource):
     def put(self, user_id):
         """Update user details by ID (Admin only)"""
         current_user = get_jwt()
-        if not current_user.get('is_admin'):
+        if not facade.is_admin(get_jwt_identity(), claims=current_user):
             return {'error': 'Admin privileges required'}, 403
         user_data = api.payload
         user = facade.get_user(user_id)
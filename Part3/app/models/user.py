@@ -48,6 +48,9 @@ class User(BaseModel):
         self.last_name = last_name
         self.email = email
         self.is_admin = is_admin
+        # Bumped on each role change, carried by tokens as "perm"; only kept across
+        # restarts once the model is mapped to users.role_version (see PermissionSnapshot)
+        self.role_version = 0
         self.password = None  # Placeholder for hashed password
         self.hash_password(password)  # Hash the password during initialization
         self.places = []  # List to store places owned by the user
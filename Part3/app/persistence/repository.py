@@ -4,6 +4,10 @@ from abc import ABC, abstractmethod
 from app.extensions import db  # Assuming you have set up SQLAlchemy in your Flask app
 from app.models import User, Place, Review, Amenity  # Import your models
 
+# Sentinel for objects that do not carry an indexed attribute
+_MISSING = object()
+
+
 class Repository(ABC):
     @abstractmethod
     def add(self, obj):
@@ -29,13 +33,92 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def get_all_by_attribute(self, attr_name, attr_value):
+        pass
+
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    def __init__(self, indexes=(), unique_indexes=()):
+        """
+        Initialize the repository.
+
+        Args:
+            indexes (iterable): Attribute names to index (non-unique)
+            unique_indexes (iterable): Attribute names whose values must be unique
+        """
         self._storage = {}
+        # attr_name -> {value -> {obj_id -> obj}}
+        self._indexes = {}
+        self._unique = set()
+        for attr_name in unique_indexes:
+            self.add_index(attr_name, unique=True)
+        for attr_name in indexes:
+            self.add_index(attr_name)
+
+    def add_index(self, attr_name, unique=False):
+        """
+        Declare a hash index on an attribute and build it from the stored objects.
+
+        Lookups through get_by_attribute on an indexed attribute are O(1)
+        instead of a scan over the whole storage.
+
+        Raises:
+            ValueError: If unique is True and stored objects share a value
+        """
+        index = {}
+        for obj in self._storage.values():
+            value = getattr(obj, attr_name, _MISSING)
+            if value is _MISSING:
+                continue
+            bucket = index.setdefault(value, {})
+            if unique and bucket:
+                raise ValueError(f"Duplicate value for unique attribute '{attr_name}': {value!r}")
+            bucket[obj.id] = obj
+        self._indexes[attr_name] = index
+        if unique:
+            self._unique.add(attr_name)
+
+    def _index_obj(self, obj):
+        for attr_name, index in self._indexes.items():
+            value = getattr(obj, attr_name, _MISSING)
+            if value is not _MISSING:
+                index.setdefault(value, {})[obj.id] = obj
+
+    def _unindex_obj(self, obj, values):
+        for attr_name, value in values.items():
+            bucket = self._indexes[attr_name].get(value)
+            if bucket is not None:
+                bucket.pop(obj.id, None)
+                if not bucket:
+                    del self._indexes[attr_name][value]
+
+    def _indexed_values(self, obj):
+        return {attr_name: getattr(obj, attr_name, _MISSING) for attr_name in self._indexes}
+
+    def _live(self, bucket):
+        """Yield indexed objects that are still held in the storage."""
+        for obj_id, obj in bucket.items():
+            if self._storage.get(obj_id) is obj:
+                yield obj
+
+    def _check_unique(self, obj_id, values):
+        """Raise ValueError if any unique value is already held by another object."""
+        for attr_name in self._unique:
+            value = values.get(attr_name, _MISSING)
+            if value is _MISSING:
+                continue
+            bucket = self._indexes[attr_name].get(value)
+            if bucket and any(other.id != obj_id for other in self._live(bucket)):
+                raise ValueError(f"Duplicate value for unique attribute '{attr_name}': {value!r}")
 
     def add(self, obj):
+        self._check_unique(obj.id, self._indexed_values(obj))
+        previous = self._storage.get(obj.id)
+        if previous is not None:
+            self._unindex_obj(previous, self._indexed_values(previous))
         self._storage[obj.id] = obj
+        self._index_obj(obj)
 
     def get(self, obj_id):
         return self._storage.get(obj_id)
@@ -46,16 +129,37 @@ class InMemoryRepository(Repository):
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
-            obj.update(data)
+            old_values = self._indexed_values(obj)
+            self._check_unique(obj_id, {
+                attr_name: data[attr_name] for attr_name in self._unique
+                if attr_name in data and hasattr(obj, attr_name)
+            })
+            self._unindex_obj(obj, old_values)
+            try:
+                obj.update(data)
+            finally:
+                self._index_obj(obj)
             return obj
 
     def delete(self, obj_id):
         if obj_id in self._storage:
-            del self._storage[obj_id]
+            obj = self._storage.pop(obj_id)
+            self._unindex_obj(obj, self._indexed_values(obj))
 
     def get_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            bucket = index.get(attr_value)
+            return next(self._live(bucket), None) if bucket else None
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
-    
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            bucket = index.get(attr_value)
+            return list(self._live(bucket)) if bucket else []
+        return [obj for obj in self._storage.values() if getattr(obj, attr_name, _MISSING) == attr_value]
+
     def find_by_email(self, email):
         return self.get_by_attribute('email', email)
 
@@ -88,6 +192,9 @@ class SQLAlchemyRepository(Repository):
 
     def get_by_attribute(self, attr_name, attr_value):
         return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        return self.model.query.filter(getattr(self.model, attr_name) == attr_value).all()
     
     def find_by_email(self, email):
         return self.model.query.filter_by(email=email).first()
@@ -0,0 +1,76 @@
+#app/services/permissions.py
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class PermissionSnapshot:
+    """
+    Recently checked roles of admin users, validated against their row's role version.
+
+    Every user row carries a role_version, bumped with each role change,
+    and tokens carry the version they were issued at (the "perm" claim).
+    A token claiming admin rights is only honoured while the user is an
+    admin at that same version. The row is read once, then kept until the
+    token expires or max_age seconds pass, whichever comes first; at most
+    maxsize users are kept. Tokens that do not claim admin rights never
+    grant them, without a lookup.
+
+    A role change or deletion drops the user's entry at once in the
+    process that made it; other processes read the new row when their
+    entry expires, so they lag by at most max_age seconds. The snapshot is
+    shared by the request threads; rows are loaded outside its lock.
+
+    Admin checks are therefore not free of queries: each admin costs one
+    row read per max_age seconds and process. Trusting the claims alone
+    would save it, but a demoted admin would keep their rights until the
+    token expires.
+
+    The role version must outlive the process for this to hold. The
+    users.role_version column of sql/schema.sql keeps it, but Part3's
+    models are not mapped to their tables: until they are, the version
+    lives in memory only, and after a restart tokens issued before a role
+    change match it again.
+    """
+
+    def __init__(self, maxsize=1024, max_age=60, clock=time.time):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._clock = clock
+        # user_id -> (expires, role_version, is_admin), least recently used first
+        self._roles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def claims(self, user):
+        """Return the role claims to put in a new token of user."""
+        return {'id': user.id, 'is_admin': user.is_admin, 'perm': user.role_version}
+
+    def forget(self, user_id):
+        """Drop what is known of a user whose role changed or who was deleted."""
+        with self._lock:
+            self._roles.pop(user_id, None)
+
+    def is_admin(self, user_id, claims, load):
+        """Return the admin role of a token's user; load(user_id) returns the user row, or None."""
+        if not claims.get('is_admin', False):
+            return False
+        now = self._clock()
+        with self._lock:
+            entry = self._roles.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._roles.move_to_end(user_id)
+        if entry is None or entry[0] <= now:
+            user = load(user_id)
+            if user is None:
+                self.forget(user_id)
+                return False
+            expires = min(claims.get('exp', now + self.max_age), now + self.max_age)
+            entry = (expires, user.role_version, bool(user.is_admin))
+            with self._lock:
+                self._roles[user_id] = entry
+                self._roles.move_to_end(user_id)
+                while len(self._roles) > self.maxsize:
+                    self._roles.popitem(last=False)
+        # A token issued before the last role change has lost its claims
+        return entry[2] and entry[1] == claims.get('perm')
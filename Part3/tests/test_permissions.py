@@ -0,0 +1,100 @@
+#Part3/tests/test_permissions.py
+import threading
+import unittest
+from app.services.permissions import PermissionSnapshot
+
+
+class Row:
+    def __init__(self, user_id, is_admin, role_version=0):
+        self.id = user_id
+        self.is_admin = is_admin
+        self.role_version = role_version
+
+
+class TestPermissionSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.now = 1_000.0
+        self.rows = {'admin': Row('admin', True)}
+        self.loads = 0
+        self.snapshot = PermissionSnapshot(maxsize=2, max_age=60, clock=lambda: self.now)
+        self.token = dict(self.snapshot.claims(self.rows['admin']), exp=self.now + 900)
+
+    def load(self, user_id):
+        self.loads += 1
+        return self.rows.get(user_id)
+
+    def check(self, claims=None, user_id='admin'):
+        return self.snapshot.is_admin(user_id, claims or self.token, self.load)
+
+    def test_admin_token_reads_the_row_once(self):
+        self.assertEqual(self.token['perm'], 0)
+        self.assertTrue(self.check())
+        self.assertTrue(self.check())
+        self.assertEqual(self.loads, 1)
+        self.assertFalse(self.check({'is_admin': False, 'perm': 0}, 'guest'))
+        self.assertEqual(self.loads, 1)
+
+    def test_demotion(self):
+        self.assertTrue(self.check())
+        self.rows['admin'] = Row('admin', False, role_version=1)
+        # Demoted by this process: dropped at once
+        self.snapshot.forget('admin')
+        self.assertFalse(self.check())
+
+    def test_demotion_in_another_process(self):
+        self.assertTrue(self.check())
+        self.rows['admin'] = Row('admin', False, role_version=1)
+        self.now += 59
+        self.assertTrue(self.check())
+        self.now += 1
+        self.assertFalse(self.check())
+
+    def test_deletion(self):
+        self.assertTrue(self.check())
+        del self.rows['admin']
+        self.snapshot.forget('admin')
+        self.assertFalse(self.check())
+
+    def test_token_from_before_a_role_change(self):
+        """Test that a token issued before a role change made elsewhere loses its claims."""
+        self.rows['admin'] = Row('admin', True, role_version=2)
+        self.assertFalse(self.check())
+        self.assertTrue(self.check(dict(self.token, perm=2)))
+
+    def test_entries_expire_with_the_token_and_are_bounded(self):
+        self.assertTrue(self.check(dict(self.token, exp=self.now + 10)))
+        self.now += 10
+        self.assertTrue(self.check())
+        self.assertEqual(self.loads, 2)
+        for user_id in ('a', 'b'):
+            self.rows[user_id] = Row(user_id, True)
+            self.check(user_id=user_id)
+        self.assertNotIn('admin', self.snapshot._roles)
+        self.assertEqual(len(self.snapshot._roles), 2)
+
+
+    def test_concurrent_checks_and_forgets(self):
+        """Test that request threads checking and dropping the same users never fail."""
+        self.snapshot.max_age = 0
+        errors = []
+
+        def check():
+            try:
+                for _ in range(2000):
+                    self.check()
+            except Exception as e:
+                errors.append(e)
+
+        def forget():
+            for _ in range(2000):
+                self.snapshot.forget('admin')
+
+        threads = [threading.Thread(target=target) for target in (check, check, forget, forget)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+if __name__ == '__main__':
+    unittest.main()
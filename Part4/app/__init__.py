@@ -1,20 +1,57 @@
 from flask import Flask
 from flask_restx import Api
+from flask_bcrypt import Bcrypt
+from flask_sqlalchemy import SQLAlchemy
+
+# Extensions are created before the namespaces are imported: the models import db from here
+# The session lives for one request (removed when the app context ends) and is its
+# identity map: objects stay loaded across commits instead of being re-read by
+# the next attribute access or primary-key lookup of the same request
+db = SQLAlchemy(session_options={'expire_on_commit': False})
+bcrypt = Bcrypt()
+
+from app.tokens import CachingJWTManager
+
+jwt = CachingJWTManager()
+
 from app.api.v1.users import api as users_ns
 from app.api.v1.places import api as places_ns
 from app.api.v1.reviews import api as reviews_ns
 from app.api.v1.amenities import api as amenities_ns
+from app.api.v1.auth import api as auth_ns
+from app.api.v1.search import api as search_ns
+from app.api.v1.export import api as export_ns
+from app.api.v1.serializers import output_json
+from app.assets import frontend
+from app.commands import build_assets_command, repair_ratings_command
+from app.compression import compress_response
+from app.passwords import init_password_hasher
 
-def create_app():
+def create_app(config_class="config.DevelopmentConfig"):
     app = Flask(__name__)
+    app.config.from_object(config_class)
+
+    db.init_app(app)
+    bcrypt.init_app(app)
+    jwt.init_app(app)
+    init_password_hasher(app)
+
     api = Api(app, version='1.0', title='HBnB API', description='HBnB Application API', doc='/api/v1/')
+    api.representation('application/json')(output_json)
 
-    # Placeholder for API namespaces (endpoints will be added later)
-    
     # Register the users namespace
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(places_ns, path='/api/v1/places')
     api.add_namespace(reviews_ns, path='/api/v1/reviews')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
-    
-    return app
\ No newline at end of file
+    api.add_namespace(auth_ns, path='/api/v1/auth')
+    api.add_namespace(search_ns, path='/api/v1/search')
+    api.add_namespace(export_ns, path='/api/v1/export')
+
+    app.register_blueprint(frontend, url_prefix=app.config.get('FRONTEND_URL_PREFIX', '/app'))
+    app.after_request(compress_response)
+
+    app.cli.add_command(repair_ratings_command)
+    app.cli.add_command(build_assets_command)
+
+    return app
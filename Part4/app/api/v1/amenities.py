@@ -1,5 +1,11 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import HBnBFacade
+from app.api.v1.pagination import pagination_parser, page_args, page_response
+from app.api.v1.bulk import bulk_create
+from app.api.v1.conditional import conditional, collection_validators, resource_validators
+from app.api.v1.streaming import wants_ndjson, ndjson_response
+from app.api.v1.serializers import ModelSerializer
+from flask import request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 api = Namespace('amenities', description='Amenity operations')
@@ -10,6 +16,15 @@ amenity_model = api.model('Amenity', {
 
 facade = HBnBFacade()
 
+
+amenity_serializer = ModelSerializer({'id': 'id', 'name': 'name'})
+serialize_amenity = amenity_serializer.compile()
+
+
+def amenity_validators(amenity_id):
+    amenity = facade.get_amenity(amenity_id)
+    return resource_validators(amenity) if amenity else None
+
 @api.route('/')
 class AmenityList(Resource):
     @api.expect(amenity_model)
@@ -29,38 +44,54 @@ class AmenityList(Resource):
             return {'message': 'Invalid input data'}, 400
         
         new_amenity = facade.create_amenity(amenity_data)
-        return {
-            'id': new_amenity.id,
-            'name': new_amenity.name
-        }, 201
+        return serialize_amenity(new_amenity), 201
         
         
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of amenities retrieved successfully')
+    @api.response(400, 'Invalid cursor')
+    @api.response(304, 'Not modified')
+    @conditional(lambda: collection_validators('amenities'))
     def get(self):
-        """Retrieve a list of all amenities"""
-        amenities = facade.get_all_amenities()
-        return [
-            {
-            'id': amenity.id,
-            'name': amenity.name
-            } for amenity in amenities
-        ]
+        """Retrieve one page of amenities, or stream them all with Accept: application/x-ndjson"""
+        after_id, limit = page_args()
+        try:
+            serialize = amenity_serializer.compile(amenity_serializer.parse_fields(request.args.get('fields')))
+            if wants_ndjson():
+                return ndjson_response(serialize(amenity) for amenity in facade.stream_amenities(after_id))
+            amenities, next_id = facade.get_amenities_page(after_id, limit)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response([serialize(amenity) for amenity in amenities], next_id), 200
+
+@api.route('/bulk')
+class AmenityBulk(Resource):
+    @api.expect([amenity_model])
+    @api.response(201, 'Amenities created, invalid items are listed in errors')
+    @api.response(400, 'No valid amenity in the request')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def post(self):
+        """Register many amenities from a JSON array or NDJSON body (Admin only)"""
+        current_user = get_jwt_identity()
+        if not current_user.get('is_admin', False):
+            return {'error': 'Admin privileges required'}, 403
+        return bulk_create(facade.create_amenities_bulk)
 
 @api.route('/<amenity_id>')
 class AmenityResource(Resource):
     @api.response(200, 'Amenity details retrieved successfully')
     @api.response(404, 'Amenity not found')
+    @api.response(304, 'Not modified')
+    @conditional(amenity_validators)
     def get(self, amenity_id):
         """Get amenity details by ID"""
         amenities_data = facade.get_amenity(amenity_id)
         
         if not amenities_data:
             return  {'message': 'Amenity not found'}, 404
-        return {
-            'id': amenities_data.id,
-            'name': amenities_data.name
-        }, 200
+        return serialize_amenity(amenities_data), 200
 
     @api.expect(amenity_model)
     @api.response(200, 'Amenity updated successfully')
@@ -81,6 +112,4 @@ class AmenityResource(Resource):
         updated_amenities = facade.update_amenity(amenity_id, amenity_data)
         if not updated_amenities:
             return {'message': 'Amenity not found'}, 404
-        return {
-            'name': updated_amenities.name
-        }
\ No newline at end of file
+        return serialize_amenity(updated_amenities), 200
\ No newline at end of file
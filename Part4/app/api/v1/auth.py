@@ -1,7 +1,11 @@
 from flask_restx import Namespace, Resource, fields, api
 from flask_jwt_extended import create_access_token
 from app.services.facade import HBnBFacade
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.passwords import PasswordPoolBusy
+from app.ratelimit import login_throttle
+from app.revocation import token_denylist
+from flask import current_app, request
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -14,17 +18,35 @@ login_model = api.model('Login', {
 
 @api.route('/login')
 class Login(Resource):
-    @api.expect(login_model)
+    @api.expect(login_model, validate=True)
+    @api.response(400, 'Invalid input data')
+    @api.response(429, 'Too many login attempts, or password pool saturated')
     def post(self):
         """Authenticate user and return a JWT token"""
         credentials = api.payload
-        user = facade.get_user_by_email(credentials['email'])
-        if not user or not user.verify_password(credentials['password']):
+        if current_app.config.get('LOGIN_LIMIT_ENABLED', True):
+            retry = login_throttle().check(credentials['email'], request.remote_addr)
+            if retry:
+                return {'error': 'Too many login attempts, retry later'}, 429, {'Retry-After': str(retry)}
+        try:
+            user = facade.authenticate(credentials['email'], credentials['password'])
+        except PasswordPoolBusy:
+            return {'error': 'Too many login attempts in progress, retry shortly'}, 429, {'Retry-After': '1'}
+        if not user:
             return {'error': 'Invalid credentials'}, 401
         access_token = create_access_token(identity={'id': str(user.id), 'is_admin': user.is_admin})
-        print(f"Generated JWT token for user {user.id}: {access_token}")
         return {'access_token': access_token}, 200
 
+@api.route('/logout')
+class Logout(Resource):
+    @api.response(200, 'Token revoked')
+    @jwt_required()
+    def post(self):
+        """Revoke the JWT token sent with the request"""
+        claims = get_jwt()
+        token_denylist().revoke(claims['jti'], claims.get('exp'))
+        return {'message': 'Successfully logged out'}, 200
+
 @api.route('/protected')
 class ProtectedResource(Resource):
     @jwt_required()
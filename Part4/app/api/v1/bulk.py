@@ -0,0 +1,61 @@
+import json
+from flask import request
+
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/jsonl')
+MAX_BULK_ITEMS = 50000
+
+
+def read_bulk_items():
+    """
+    Parse a bulk request body: a JSON array, or one JSON object per line (NDJSON).
+
+    Returns:
+        tuple: (items, errors) where items are (index, payload) pairs and errors
+        are {'index', 'error'} dicts for NDJSON lines that are not valid JSON
+
+    Raises:
+        ValueError: If a JSON body is not an array
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        items, errors = [], []
+        lines = (line for line in request.get_data(as_text=True).splitlines() if line.strip())
+        for index, line in enumerate(lines):
+            try:
+                items.append((index, json.loads(line)))
+            except ValueError as e:
+                errors.append({'index': index, 'error': f'Invalid JSON: {e}'})
+        return items, errors
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, list):
+        raise ValueError('Expected a JSON array or an NDJSON body')
+    return list(enumerate(payload)), []
+
+
+def bulk_create(create_many, **kwargs):
+    """
+    Run a facade bulk creation on the request body and build the API response.
+
+    Item errors are reported by their position in the body. The response is
+    201 when at least one item was created, 400 otherwise.
+    """
+    try:
+        parsed, errors = read_bulk_items()
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    if len(parsed) + len(errors) > MAX_BULK_ITEMS:
+        return {'error': f'Too many items, the limit is {MAX_BULK_ITEMS} per request'}, 413
+
+    positions = [index for index, _ in parsed]
+    try:
+        created_ids, item_errors = create_many([item for _, item in parsed], **kwargs)
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    errors.extend({'index': positions[error['index']], 'error': error['error']} for error in item_errors)
+    errors.sort(key=lambda error: error['index'])
+
+    return {
+        'created': len(created_ids),
+        'ids': created_ids,
+        'errors': errors
+    }, 201 if created_ids else 400
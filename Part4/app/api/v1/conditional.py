@@ -0,0 +1,84 @@
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import Response, request
+from flask_restx.utils import unpack
+from werkzeug.http import http_date, quote_etag
+from app.persistence.versions import collection_versions
+from app.compression import ETAG_SUFFIXES, negotiate_encoding
+
+
+def strong_etag(*parts):
+    """Hash the parts of a representation's version into an (unquoted) entity tag."""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()[:32]
+
+
+def resource_validators(obj, *tables):
+    """
+    Return (etag, last_modified) of one object from its updated_at.
+
+    tables lists the collections nested in the representation: their
+    versions join the ETag, and Last-Modified is left out since updated_at
+    no longer covers the whole body.
+    """
+    etag = strong_etag(obj.__tablename__, obj.id, obj.updated_at, collection_versions().token(tables))
+    return etag, None if tables else obj.updated_at
+
+
+def collection_validators(*tables):
+    """Return (etag, None) of a list response: the versions of its tables and the query string."""
+    return strong_etag(collection_versions().token(tables), request.full_path,
+                       request.headers.get('Accept', '')), None
+
+
+def conditional(validators):
+    """
+    Answer conditional GETs of a Resource method.
+
+    validators(**view_args) returns (etag, last_modified) without
+    serializing anything, or None when the request cannot be validated
+    (e.g. an unknown id). A matching If-None-Match, or If-Modified-Since
+    when no entity tag is sent, gets an empty 304 and the method is not
+    called; 200 responses carry the ETag and Last-Modified headers,
+    streamed ones included. Last-Modified is read as UTC, the clock of
+    utcnow() in app.models.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(resource, *args, **kwargs):
+            found = validators(*args, **kwargs)
+            if found is None:
+                return method(resource, *args, **kwargs)
+            etag, last_modified = found
+            headers = {'ETag': quote_etag(etag), 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+            if last_modified is not None:
+                # HTTP dates have a one second resolution
+                last_modified = last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+                headers['Last-Modified'] = http_date(last_modified)
+            if request.if_none_match:
+                # Clients send back the tag of the compressed body they received:
+                # the 304 carries that tag, the one negotiated for this client first
+                negotiated = ETAG_SUFFIXES.get(negotiate_encoding(), '')
+                for suffix in dict.fromkeys((negotiated, '', *ETAG_SUFFIXES.values())):
+                    if request.if_none_match.contains_weak(etag + suffix):
+                        headers['ETag'] = quote_etag(etag + suffix)
+                        if suffix:
+                            headers['Vary'] = 'Accept, Accept-Encoding'
+                        return Response(status=304, headers=headers)
+            elif last_modified is not None and request.if_modified_since is not None:
+                if last_modified <= request.if_modified_since:
+                    # Whether the body would be compressed depends on its size, so the
+                    # tag is left out rather than guessed: caches keep the one they hold
+                    del headers['ETag']
+                    return Response(status=304, headers=headers)
+            result = method(resource, *args, **kwargs)
+            if isinstance(result, Response):
+                if result.status_code == 200:
+                    result.headers.update(headers)
+                return result
+            data, code, extra = unpack(result)
+            if code == 200:
+                extra = dict(extra or {}, **headers)
+            return data, code, extra
+        return wrapper
+    return decorator
@@ -0,0 +1,38 @@
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.facade import HBnBFacade
+from app.api.v1.streaming import ndjson_response
+from app.api.v1.users import serialize_user
+from app.api.v1.places import serialize_place
+from app.api.v1.reviews import serialize_review
+from app.api.v1.amenities import serialize_amenity
+
+api = Namespace('export', description='Full collection exports (Admin only)')
+
+facade = HBnBFacade()
+
+# collection -> (facade stream, serializer)
+EXPORTS = {
+    'users': (facade.stream_users, serialize_user),
+    'places': (facade.stream_places, serialize_place),
+    'reviews': (facade.stream_reviews, serialize_review),
+    'amenities': (facade.stream_amenities, serialize_amenity),
+}
+
+
+@api.route('/<collection>')
+@api.param('collection', 'users, places, reviews or amenities')
+class Export(Resource):
+    @api.response(200, 'Every object of the collection, one JSON document per line (NDJSON)')
+    @api.response(403, 'Admin privileges required')
+    @api.response(404, 'Unknown collection')
+    @jwt_required()
+    def get(self, collection):
+        """Stream a whole collection as NDJSON (Admin only)"""
+        current_user = get_jwt_identity()
+        if not current_user.get('is_admin', False):
+            return {'error': 'Admin privileges required'}, 403
+        if collection not in EXPORTS:
+            return {'error': 'Unknown collection'}, 404
+        stream, serialize = EXPORTS[collection]
+        return ndjson_response(serialize(obj) for obj in stream())
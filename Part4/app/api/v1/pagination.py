@@ -0,0 +1,24 @@
+from flask_restx import reqparse
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+pagination_parser = reqparse.RequestParser()
+pagination_parser.add_argument('limit', type=int, default=DEFAULT_PAGE_SIZE, location='args',
+                               help='Maximum number of items to return (1-{})'.format(MAX_PAGE_SIZE))
+pagination_parser.add_argument('after', type=str, location='args',
+                               help='Cursor returned as "next" by the previous page')
+pagination_parser.add_argument('fields', type=str, location='args',
+                               help='Comma-separated fields to return in every item, e.g. id,title,price')
+
+
+def page_args(parser=pagination_parser):
+    """Return (after_id, limit) from the query string, with limit clamped to the allowed range."""
+    args = parser.parse_args()
+    limit = min(max(args['limit'], 1), MAX_PAGE_SIZE)
+    return args['after'], limit
+
+
+def page_response(items, next_id):
+    """Wrap one page of serialized items with the cursor of the next page."""
+    return {'data': items, 'next': next_id}
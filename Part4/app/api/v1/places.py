@@ -1,5 +1,11 @@
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, inputs, reqparse
 from app.services.facade import HBnBFacade
+from app.api.v1.pagination import pagination_parser, page_args, page_response
+from app.api.v1.bulk import bulk_create
+from app.api.v1.conditional import conditional, collection_validators, resource_validators
+from app.api.v1.streaming import wants_ndjson, ndjson_response
+from app.api.v1.serializers import ModelSerializer
+from app.persistence.spatial import parse_bbox, parse_point
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 api = Namespace('places', description='Place operations')
@@ -35,8 +41,98 @@ place_model = api.model('Place', {
     'amenities': fields.List(fields.String, required=True, description="List of amenities ID's")
 })
 
+place_list_parser = pagination_parser.copy()
+place_list_parser.add_argument('expand', type=inputs.boolean, default=False, location='args',
+                               help='Nest owner, amenities and reviews in every place')
+place_list_parser.add_argument('sort', type=str, default='id', choices=('id', 'rating', 'price'), location='args',
+                               help='Sort by id, by average rating (best first) or by price (cheapest first)')
+place_list_parser.add_argument('min_price', type=float, location='args', help='Minimum price per night')
+place_list_parser.add_argument('max_price', type=float, location='args', help='Maximum price per night')
+place_list_parser.add_argument('amenities', type=str, location='args',
+                               help='Comma-separated amenity ids the places must all have')
+place_list_parser.add_argument('near', type=str, location='args',
+                               help='Search around a point given as lat,lon (requires radius_km)')
+place_list_parser.add_argument('radius_km', type=float, location='args',
+                               help='Search radius in kilometres around near')
+place_list_parser.add_argument('bbox', type=str, location='args',
+                               help='Search inside min_lat,min_lon,max_lat,max_lon')
+
+MAX_RADIUS_KM = 20000
+
+# ?sort= value -> list_page order_by, served by an index on places
+SORT_ORDERS = {'id': 'id', 'rating': '-rating_avg', 'price': '_price'}
+
+nearest_parser = reqparse.RequestParser()
+nearest_parser.add_argument('lat', type=float, required=True, location='args', help='Latitude of the point')
+nearest_parser.add_argument('lon', type=float, required=True, location='args', help='Longitude of the point')
+nearest_parser.add_argument('k', type=int, default=10, location='args',
+                            help='Number of places to return (1-100)')
+nearest_parser.add_argument('expand', type=inputs.boolean, default=False, location='args',
+                            help='Nest owner, amenities and reviews in every place')
+
+MAX_NEAREST = 100
+
+place_search_parser = pagination_parser.copy()
+for argument in place_list_parser.args:
+    if argument.name in ('expand', 'min_price', 'max_price', 'amenities', 'near', 'radius_km', 'bbox'):
+        place_search_parser.add_argument(argument)
+place_search_parser.add_argument('min_rating', type=float, location='args', help='Minimum average rating (1-5)')
+place_search_parser.add_argument('price_bucket', type=float, default=50, location='args',
+                                 help='Width of the price histogram buckets')
+
+# Tables whose rows appear in place representations, nested ones included
+PLACE_TABLES = ('places', 'place_amenity', 'reviews', 'amenities', 'users')
+
 facade = HBnBFacade()
 
+
+def place_validators(place_id):
+    place = facade.get_place(place_id)
+    return resource_validators(place, *PLACE_TABLES) if place else None
+
+
+_serialize_owner = ModelSerializer({'id': 'id', 'first_name': 'first_name', 'last_name': 'last_name',
+                                    'email': 'email'}).compile()
+_serialize_amenity = ModelSerializer({'id': 'id', 'name': 'name'}).compile()
+_serialize_review = ModelSerializer({'id': 'id', 'text': 'text', 'rating': 'rating', 'user_id': 'user_id'}).compile()
+
+PLACE_COLUMNS = {
+    'id': 'id',
+    'title': '_title',
+    'description': '_description',
+    'price': '_price',
+    'latitude': 'latitude',
+    'longitude': 'longitude',
+    'owner_id': 'owner_id',
+    'rating': 'rating_avg',
+    'review_count': 'review_count'
+}
+
+place_serializer = ModelSerializer(PLACE_COLUMNS)
+place_detail_serializer = ModelSerializer(PLACE_COLUMNS, {
+    'owner': lambda place: _serialize_owner(place.owner) if place.owner else None,
+    'amenities': lambda place: [_serialize_amenity(amenity) for amenity in place.amenities],
+    'rating_histogram': lambda place: place.rating_histogram,
+    'reviews': lambda place: [_serialize_review(review) for review in place.reviews]
+})
+
+
+def place_to_dict(expand=False, fields=None):
+    """
+    Return the compiled serializer of places for ?expand= and ?fields=.
+
+    Raises:
+        ValueError: If fields names an unknown field
+    """
+    serializer = place_detail_serializer if expand else place_serializer
+    return serializer.compile(serializer.parse_fields(fields))
+
+
+def serialize_place(place, nested=False):
+    """Return the JSON representation of a place, with its relations when nested is True."""
+    return place_to_dict(nested)(place)
+
+
 @api.route('/')
 class PlaceList(Resource):
     @api.expect(place_model)
@@ -51,54 +147,158 @@ class PlaceList(Resource):
         
         if not place_data:
             return {'message': 'Invalid input data'}, 400
-        new_place = facade.create_place(place_data)
-        return {
-                    "id": new_place.id,
-                    "title": new_place.title,
-                    "description": new_place.description,
-                    "price": new_place.price,
-                    "latitude": new_place.latitude,
-                    "longitude": new_place.longitude,
-                    "owner_id": new_place.owner_id
-                }, 201
+        try:
+            new_place = facade.create_place(place_data)
+        except (ValueError, TypeError) as e:
+            return {'error': str(e)}, 400
+        return serialize_place(new_place), 201
         
 
+    @api.expect(place_list_parser)
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(400, 'Invalid cursor')
+    @api.response(304, 'Not modified')
+    @conditional(lambda: collection_validators(*PLACE_TABLES))
+    def get(self):
+        """Retrieve one page of places, or stream them all with Accept: application/x-ndjson"""
+        after_id, limit = page_args(place_list_parser)
+        args = place_list_parser.parse_args()
+        expand = args['expand']
+        profile = 'detail' if expand else 'summary'
+        try:
+            serialize = place_to_dict(expand, args['fields'])
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        if wants_ndjson():
+            filters = ('min_price', 'max_price', 'amenities', 'near', 'bbox')
+            if args['sort'] != 'id' or any(args[name] is not None for name in filters):
+                return {'error': 'NDJSON streams every place in id order and takes no filter or sort'}, 400
+            return ndjson_response(serialize(place) for place in facade.stream_places(after_id, profile=profile))
+        price_filter = args['min_price'] is not None or args['max_price'] is not None
+        if price_filter and args['sort'] == 'id':
+            # Price bounds are answered by the price index, in price order
+            args['sort'] = 'price'
+        if args['amenities'] and (args['near'] or args['bbox'] or args['sort'] != 'id'):
+            return {'error': 'amenities cannot be combined with near, bbox, sort or price filters'}, 400
+        if args['near'] or args['bbox']:
+            if price_filter:
+                return {'error': 'Price filters cannot be combined with near or bbox'}, 400
+            return search_places(args, limit, serialize)
+        try:
+            if args['amenities']:
+                amenity_ids = [amenity_id for amenity_id in args['amenities'].split(',') if amenity_id]
+                places, next_id = facade.get_places_with_amenities(amenity_ids, after_id, limit, profile=profile)
+            else:
+                places, next_id = facade.get_places_page(after_id, limit, SORT_ORDERS[args['sort']],
+                                                         profile=profile, min_price=args['min_price'],
+                                                         max_price=args['max_price'])
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response([serialize(place) for place in places], next_id), 200
+
+def search_places(args, limit, serialize):
+    """Answer a near/radius_km or bbox search; results are not paginated beyond limit."""
+    profile = 'detail' if args['expand'] else 'summary'
+    try:
+        if args['near']:
+            lat, lon = parse_point(args['near'])
+            radius_km = args['radius_km']
+            if radius_km is None or not 0 < radius_km <= MAX_RADIUS_KM:
+                raise ValueError("radius_km must be between 0 and {}".format(MAX_RADIUS_KM))
+            found = facade.find_places_near(lat, lon, radius_km, limit, profile=profile)
+            items = [dict(serialize(place), distance_km=round(distance, 3))
+                     for place, distance in found]
+        else:
+            places = facade.find_places_in_bbox(*parse_bbox(args['bbox']), limit=limit, profile=profile)
+            items = [serialize(place) for place in places]
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    return page_response(items, None), 200
+
+@api.route('/nearest')
+class PlaceNearest(Resource):
+    @api.expect(nearest_parser)
+    @api.response(200, 'Closest places retrieved successfully')
+    @api.response(400, 'Invalid coordinates')
+    def get(self):
+        """Retrieve the k places closest to a point, closest first"""
+        args = nearest_parser.parse_args()
+        lat, lon, k = args['lat'], args['lon'], min(max(args['k'], 1), MAX_NEAREST)
+        if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+            return {'error': "Coordinates of latitude and longitude aren't correct"}, 400
+        found = facade.get_nearest_places(lat, lon, k, profile='detail' if args['expand'] else 'summary')
+        return page_response([
+            dict(serialize_place(place, nested=args['expand']), distance_km=round(distance, 3))
+            for place, distance in found
+        ], None), 200
+
+@api.route('/search')
+class PlaceSearch(Resource):
+    @api.expect(place_search_parser)
+    @api.response(200, 'Matching places retrieved successfully, with facet counts')
+    @api.response(400, 'Invalid filters')
     def get(self):
-        """Retrieve a list of all places"""
-        places = facade.get_all_places()
-        return [
-            {
-                "id": place.id,
-                "title": place.title,
-                "description": place.description,
-                "price": place.price,
-                "latitude": place.latitude,
-                "longitude": place.longitude,
-                "owner_id": place.owner_id
-            } for place in places
-        ]
+        """Filter places by location, price, rating and amenities at once, with facet counts"""
+        after_id, limit = page_args(place_search_parser)
+        args = place_search_parser.parse_args()
+        try:
+            serialize = place_to_dict(args['expand'], args['fields'])
+            near = parse_point(args['near']) if args['near'] else None
+            if near is not None:
+                if args['radius_km'] is None or not 0 < args['radius_km'] <= MAX_RADIUS_KM:
+                    raise ValueError("radius_km must be between 0 and {}".format(MAX_RADIUS_KM))
+                if args['bbox']:
+                    raise ValueError("near and bbox cannot be combined")
+            bbox = parse_bbox(args['bbox']) if args['bbox'] else None
+            if args['price_bucket'] <= 0:
+                raise ValueError("price_bucket must be positive")
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        amenity_ids = [amenity_id for amenity_id in (args['amenities'] or '').split(',') if amenity_id]
+        result = facade.search_places(near=near, radius_km=args['radius_km'], bbox=bbox,
+                                      min_price=args['min_price'], max_price=args['max_price'],
+                                      min_rating=args['min_rating'], amenity_ids=amenity_ids,
+                                      after_id=after_id, limit=limit, price_bucket=args['price_bucket'],
+                                      profile='detail' if args['expand'] else 'summary')
+        bucket = args['price_bucket']
+        response = page_response([serialize(place) for place in result['places']], result['next'])
+        response['total'] = result['total']
+        response['facets'] = {
+            'amenities': [{'id': amenity_id, 'count': count}
+                          for amenity_id, count in sorted(result['facets']['amenities'].items())],
+            'price': [{'min': low, 'max': low + bucket, 'count': count}
+                      for low, count in result['facets']['price'].items()]
+        }
+        response['plan'] = result['plan']
+        return response, 200
+
+@api.route('/bulk')
+class PlaceBulk(Resource):
+    @api.expect([place_model])
+    @api.response(201, 'Places created, invalid items are listed in errors')
+    @api.response(400, 'No valid place in the request')
+    @jwt_required()
+    def post(self):
+        """Register many places from a JSON array or NDJSON body"""
+        current_user = get_jwt_identity()
+        # Admins may import places for any owner, other users only for themselves
+        owner_id = None if current_user.get('is_admin', False) else current_user['id']
+        return bulk_create(facade.create_places_bulk, owner_id=owner_id)
 
 @api.route('/<place_id>')
 class PlaceResource(Resource):
     @api.response(200, 'Place details retrieved successfully')
     @api.response(404, 'Place not found')
+    @api.response(304, 'Not modified')
     @jwt_required()
+    @conditional(place_validators)
     def get(self, place_id):
         """Get place details by ID"""
 
-        places_data = facade.get_place(place_id)
+        places_data = facade.get_place(place_id, profile='detail')
         if not places_data:
             return {'message': 'Place not found'}, 404
-        return {
-            "id": places_data.id,
-            "title": places_data.title,
-            "description": places_data.description,
-            "price": places_data.price,
-            "latitude": places_data.latitude,
-            "longitude": places_data.longitude,
-            "owner_id": places_data.owner_id
-            }, 200
+        return serialize_place(places_data, nested=True), 200
 
 
 
@@ -116,22 +316,17 @@ class PlaceResource(Resource):
         is_admin = current_user.get('is_admin', False)
         user_id = current_user.get('id')
 
+        if not place:
+            return {'message': 'Place not found'}, 404
         if not is_admin and place.owner_id != user_id:
             return {'error': 'Unauthorized action'}, 403
-        if place.owner_id != current_user:
-            return {'error': 'Unauthorized action'}, 403
         if not place_data:
             return {'message': 'Invalid input data'}, 400
     
-        updated_place = facade.update_place(place_id, place_data)
+        try:
+            updated_place = facade.update_place(place_id, place_data)
+        except (ValueError, TypeError) as e:
+            return {'error': str(e)}, 400
         if not updated_place:
             return {'message': 'Place not found'}, 404
-        
-        return {
-            "title": updated_place.title,
-            "description": updated_place.description,
-            "price": updated_place.price,
-            "latitude": updated_place.latitude,
-            "longitude": updated_place.longitude,
-            "owner_id": updated_place.owner_id
-            }, 200
\ No newline at end of file
+        return serialize_place(updated_place), 200
\ No newline at end of file
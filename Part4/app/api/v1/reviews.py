@@ -1,5 +1,11 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import HBnBFacade
+from app.api.v1.pagination import pagination_parser, page_args, page_response
+from app.api.v1.bulk import bulk_create
+from app.api.v1.conditional import conditional, collection_validators
+from app.api.v1.streaming import wants_ndjson, ndjson_response
+from app.api.v1.serializers import ModelSerializer
+from flask import request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 api = Namespace('reviews', description='Review operations')
@@ -13,6 +19,11 @@ review_model = api.model('Review', {
 
 facade = HBnBFacade()
 
+
+review_serializer = ModelSerializer({'id': 'id', 'text': 'text', 'rating': 'rating',
+                                     'user_id': 'user_id', 'place_id': 'place_id'})
+serialize_review = review_serializer.compile()
+
 @api.route('/')
 class ReviewList(Resource):
     @api.expect(review_model, validate=True)
@@ -40,28 +51,44 @@ class ReviewList(Resource):
                 return {'message': 'You have already reviewed this place'}, 400
         
         new_review = facade.create_review(review_data)
-        return {
-                'id': new_review.id,
-                'text': new_review.text,
-                'rating': new_review.rating,
-                'user_id': new_review.user_id,
-                'place_id': new_review.place_id,
-                'message': 'Review successfully created'
-            }, 201
+        return dict(serialize_review(new_review), message='Review successfully created'), 201
         
+    @api.expect(pagination_parser)
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(400, 'Invalid cursor')
+    @api.response(304, 'Not modified')
+    @conditional(lambda: collection_validators('reviews'))
     def get(self):
-        """Retrieve a list of all reviews"""
-        reviews = facade.get_all_reviews()
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user_id,
-                'place_id': review.place_id
-            } for review in reviews
-        ], 200
+        """Retrieve one page of reviews, or stream them all with Accept: application/x-ndjson"""
+        after_id, limit = page_args()
+        try:
+            serialize = review_serializer.compile(review_serializer.parse_fields(request.args.get('fields')))
+            if wants_ndjson():
+                return ndjson_response(serialize(review) for review in facade.stream_reviews(after_id))
+            reviews, next_id = facade.get_reviews_page(after_id, limit)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response([serialize(review) for review in reviews], next_id), 200
+
+@api.route('/bulk')
+class ReviewBulk(Resource):
+    @api.expect([review_model])
+    @api.response(201, 'Reviews created, invalid items are listed in errors')
+    @api.response(400, 'No valid review in the request')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def post(self):
+        """
+        Import many reviews from a JSON array or NDJSON body (Admin only)
+
+        Unlike a single review, the admin is not exempt from the review rules:
+        an item whose user owns the place, or has already reviewed it (earlier
+        items included), is rejected and listed in errors.
+        """
+        current_user = get_jwt_identity()
+        if not current_user.get('is_admin', False):
+            return {'error': 'Admin privileges required'}, 403
+        return bulk_create(facade.create_reviews_bulk)
 
 @api.route('/<review_id>')
 class ReviewResource(Resource):
@@ -72,16 +99,11 @@ class ReviewResource(Resource):
         review = facade.get_review(review_id)
         if not review:
             return {'error': 'Review not found'}, 404
-        return {
-            'id': review.id,
-            'text': review.text,
-            'rating': review.rating,
-            'user_id': review.user_id,
-            'place_id': review.place_id
-        }, 200
+        return serialize_review(review), 200
 
     @api.expect(review_model, validate=True)
     @api.response(200, 'Review successfully updated')
+    @api.response(400, 'Invalid input data')
     @api.response(404, 'Review not found')
     @api.response(403, 'Unauthorized action')
     @jwt_required()
@@ -98,15 +120,11 @@ class ReviewResource(Resource):
         if not is_admin and str(review.user_id) != str(current_user['id']):
             return {'error': 'Unauthorized action'}, 403
         
-        updated_review = facade.update_review(review_id, review_data)
-        return {
-            'id': updated_review.id,
-            'text': updated_review.text,
-            'rating': updated_review.rating,
-            'user_id': updated_review.user_id,
-            'place_id': updated_review.place_id,
-            'message': 'Review successfully updated'
-        }, 200
+        try:
+            updated_review = facade.update_review(review_id, review_data)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return dict(serialize_review(updated_review), message='Review successfully updated'), 200
 
     @api.response(200, 'Review successfully deleted')
     @api.response(404, 'Review not found')
@@ -136,17 +154,9 @@ class PlaceReviewList(Resource):
     def get(self, place_id):
         """Get all reviews for a specific place"""
         place_reviews = facade.get_reviews_by_place(place_id)
-        if not place_reviews:
+        if not place_reviews and not facade.get_place(place_id):
             return {'error': 'Place not found'}, 404
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user_id,
-                'place_id': review.place_id
-            } for review in place_reviews
-        ], 200
+        return [serialize_review(review) for review in place_reviews], 200
 
     @jwt_required()
     def put(self, place_id):
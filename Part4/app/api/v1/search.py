@@ -0,0 +1,36 @@
+from flask_restx import Namespace, Resource, inputs, reqparse
+from app.services.facade import HBnBFacade
+from app.api.v1.pagination import page_response
+from app.api.v1.places import serialize_place
+
+api = Namespace('search', description='Full-text search operations')
+
+MAX_SEARCH_RESULTS = 100
+
+search_parser = reqparse.RequestParser()
+search_parser.add_argument('q', type=str, required=True, location='args',
+                           help='Words to look for in place titles, descriptions and reviews')
+search_parser.add_argument('limit', type=int, default=20, location='args',
+                           help='Number of places to return (1-{})'.format(MAX_SEARCH_RESULTS))
+search_parser.add_argument('expand', type=inputs.boolean, default=False, location='args',
+                           help='Nest owner, amenities and reviews in every place')
+
+facade = HBnBFacade()
+
+
+@api.route('/')
+class Search(Resource):
+    @api.expect(search_parser)
+    @api.response(200, 'Matching places retrieved successfully, best match first')
+    @api.response(400, 'Missing query')
+    def get(self):
+        """Search places by the words of their title, description and reviews"""
+        args = search_parser.parse_args()
+        if not args['q'].strip():
+            return {'error': 'q must not be empty'}, 400
+        limit = min(max(args['limit'], 1), MAX_SEARCH_RESULTS)
+        found = facade.search_places_text(args['q'], limit, profile='detail' if args['expand'] else 'summary')
+        return page_response([
+            dict(serialize_place(place, nested=args['expand']), score=round(score, 4))
+            for place, score in found
+        ], None), 200
@@ -0,0 +1,92 @@
+import json
+from flask import make_response
+
+try:
+    import orjson
+except ImportError:  # optional: the standard library encoder is used instead
+    orjson = None
+
+
+def dumps(data):
+    """Encode data as compact JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def output_json(data, code, headers=None):
+    """flask-restx representation for application/json using the fast encoder."""
+    response = make_response(dumps(data), code)
+    response.mimetype = 'application/json'
+    response.headers.extend(headers or {})
+    return response
+
+
+class ModelSerializer:
+    """
+    Build the response dicts of one model from a table of output fields.
+
+    Columns are given as {output name: attribute key}, computed fields as
+    {output name: function(obj)}. compile() generates one function per
+    field set, the first time it is asked for: it reads loaded column
+    values straight from the instance __dict__, skipping the ORM
+    descriptors and property getters, and falls back to plain attribute
+    access for objects with an unloaded column.
+    """
+
+    def __init__(self, columns, computed=None):
+        self.columns = dict(columns)
+        self.computed = dict(computed or {})
+        self.names = tuple(self.columns) + tuple(self.computed)
+        self._compiled = {}
+        self.compile()
+
+    def parse_fields(self, value):
+        """
+        Turn a ?fields= value ("id,title,price") into a field set, in declaration order.
+
+        Returns None (every field) for an empty value.
+
+        Raises:
+            ValueError: If a field does not exist
+        """
+        if not value:
+            return None
+        wanted = {name.strip() for name in value.split(',') if name.strip()}
+        unknown = wanted.difference(self.names)
+        if unknown:
+            raise ValueError("Unknown fields: {}".format(', '.join(sorted(unknown))))
+        return tuple(name for name in self.names if name in wanted)
+
+    def compile(self, names=None):
+        """Return the to_dict function of a field set (every field when names is None)."""
+        names = self.names if names is None else tuple(names)
+        function = self._compiled.get(names)
+        if function is None:
+            function = self._compiled[names] = self._build(names)
+        return function
+
+    def _build(self, names):
+        namespace = {}
+        fast, slow = [], []
+        for position, name in enumerate(names):
+            if name in self.columns:
+                key = self.columns[name]
+                fast.append(f"{name!r}: state[{key!r}]")
+                slow.append(f"{name!r}: obj.{key}")
+            else:
+                namespace[f'_computed_{position}'] = self.computed[name]
+                fast.append(f"{name!r}: _computed_{position}(obj)")
+                slow.append(fast[-1])
+        source = (
+            "def _slow(obj):\n"
+            f"    return {{{', '.join(slow)}}}\n"
+            "def to_dict(obj):\n"
+            "    state = obj.__dict__\n"
+            "    try:\n"
+            f"        return {{{', '.join(fast)}}}\n"
+            "    except KeyError:\n"
+            "        return _slow(obj)\n"
+        )
+        exec(source, namespace)
+        return namespace['to_dict']
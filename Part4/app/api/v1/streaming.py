@@ -0,0 +1,24 @@
+from flask import Response, request, stream_with_context
+from app.api.v1.bulk import NDJSON_MIMETYPES
+from app.api.v1.serializers import dumps
+
+NDJSON_MIMETYPE = NDJSON_MIMETYPES[0]
+
+
+def wants_ndjson():
+    """Return True when the Accept header prefers NDJSON over JSON."""
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(items):
+    """
+    Stream items as one compact JSON document per line.
+
+    items is consumed lazily while the body is sent, inside the request
+    context, so a generator over a repository stream never holds more
+    than one batch of rows in memory.
+    """
+    def lines():
+        for item in items:
+            yield dumps(item) + b'\n'
+    return Response(stream_with_context(lines()), mimetype=NDJSON_MIMETYPE)
@@ -1,5 +1,10 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import HBnBFacade
+from app.api.v1.pagination import pagination_parser, page_args, page_response
+from app.api.v1.conditional import conditional, collection_validators, resource_validators
+from app.api.v1.streaming import wants_ndjson, ndjson_response
+from app.api.v1.serializers import ModelSerializer
+from app.passwords import PasswordPoolBusy
 from flask_jwt_extended import jwt_required, get_jwt_identity
 import re
 from flask import request
@@ -16,6 +21,15 @@ user_model = api.model('User', {
 
 facade = HBnBFacade()
 
+
+user_serializer = ModelSerializer({'id': 'id', 'first_name': 'first_name', 'last_name': 'last_name', 'email': 'email'})
+serialize_user = user_serializer.compile()
+
+
+def user_validators(user_id):
+    user = facade.get_user(user_id)
+    return resource_validators(user) if user else None
+
 @api.route('/')
 class UserList(Resource):
     @api.expect(user_model, validate=True)
@@ -23,6 +37,7 @@ class UserList(Resource):
     @api.response(400, 'Email already registered')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Admin privileges required')
+    @api.response(429, 'Password pool saturated')
     @jwt_required()
     def post(self):
         """Register a new user (Admin only)"""
@@ -45,40 +60,44 @@ class UserList(Resource):
         if not email or not re.match(r"[^@]+@[^@]+\.[^@]+", email):
             return {'error': 'Invalid email format'}, 400
 
-        new_user = facade.create_user(user_data)
-        return {'id': new_user.id, "message": 'User Successfully created'}, 201
+        try:
+            new_user = facade.create_user(user_data)
+        except PasswordPoolBusy:
+            return {'error': 'Too many password operations in progress, retry shortly'}, 429, {'Retry-After': '1'}
+        return dict(serialize_user(new_user), message='User Successfully created'), 201
     
         
 
+    @api.expect(pagination_parser)
     @api.response(200, "List of users successfully retrieved")
+    @api.response(400, 'Invalid cursor')
+    @api.response(304, 'Not modified')
+    @conditional(lambda: collection_validators('users'))
     def get(self):
-        """Retrieve list of users"""
-        users = facade.get_all_users()
-        return [
-            {
-                'id': user.id,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'email': user.email
-            } for user in users
-        ]
+        """Retrieve one page of users, or stream them all with Accept: application/x-ndjson"""
+        after_id, limit = page_args()
+        try:
+            serialize = user_serializer.compile(user_serializer.parse_fields(request.args.get('fields')))
+            if wants_ndjson():
+                return ndjson_response(serialize(user) for user in facade.stream_users(after_id))
+            users, next_id = facade.get_users_page(after_id, limit)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response([serialize(user) for user in users], next_id), 200
 
 
 @api.route('/<user_id>')
 class UserResource(Resource):
     @api.response(200, 'User details retrieved successfully')
     @api.response(404, 'User not found')
+    @api.response(304, 'Not modified')
+    @conditional(user_validators)
     def get(self, user_id):
         """Get user details by ID"""
         user = facade.get_user(user_id)
         if not user:
             return {'error': 'User not found'}, 404
-        return {
-            'id': user.id,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'email': user.email
-        }, 200
+        return serialize_user(user), 200
 
     @api.expect(user_model)
     @api.response(200, 'User successfully updated')
@@ -110,10 +129,4 @@ class UserResource(Resource):
                 return {'error': 'Email already registered'}, 400
 
         updated_user = facade.update_user(user_id, user_data)
-        return {
-            'id': updated_user.id,
-            'first_name': updated_user.first_name,
-            'last_name': updated_user.last_name,
-            'email': updated_user.email,
-            'message': 'User successfully updated'
-        }, 200
\ No newline at end of file
+        return dict(serialize_user(updated_user), message='User successfully updated'), 200
\ No newline at end of file
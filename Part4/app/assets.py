@@ -0,0 +1,120 @@
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+from flask import Blueprint, abort, current_app, send_from_directory
+from werkzeug.security import safe_join
+from app.compression import ENCODING_SUFFIXES, brotli, compress, negotiate_encoding
+
+TEXT_EXTENSIONS = {'.css', '.html', '.js', '.json', '.svg', '.txt'}
+MANIFEST_NAME = 'manifest.json'
+# Hashed files never change under their name: browsers may keep them for a year
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+_HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.\w+$')
+# Quoted or url(...) relative references, in any of the TEXT_EXTENSIONS files
+_REFERENCE = re.compile(r'''(?<=["'(])([\w./-]+)(?=["')])''')
+
+frontend = Blueprint('frontend', __name__)
+
+
+def hashed_name(path, data):
+    """Insert the first 12 hex digits of the content's SHA-256 before the extension."""
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}"
+
+
+def _rewrite(text, directory, manifest):
+    """Point the quoted or url(...) references of a text file (CSS, HTML, JS, JSON, SVG, TXT) at hashed names."""
+    def replace(match):
+        target = os.path.normpath(os.path.join(directory, match.group(1))).replace(os.sep, '/')
+        if target not in manifest:
+            return match.group(1)
+        return os.path.relpath(manifest[target], directory or '.').replace(os.sep, '/')
+    return _REFERENCE.sub(replace, text)
+
+
+def _write(path, data, level):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    if os.path.splitext(path)[1] not in TEXT_EXTENSIONS:
+        return
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        if encoding == 'br' and brotli is None:
+            continue
+        packed = compress(data, encoding, level)
+        if len(packed) < len(data):
+            with open(path + suffix, 'wb') as f:
+                f.write(packed)
+
+
+_BINARY, _TEXT, _PAGE = range(3)
+
+
+def _stage(path):
+    extension = os.path.splitext(path)[1]
+    if extension == '.html':
+        return _PAGE
+    return _TEXT if extension in TEXT_EXTENSIONS else _BINARY
+
+
+def build_assets(source, target, level=9):
+    """
+    Build the frontend for production into target.
+
+    Every file but the HTML pages is renamed after a hash of its content,
+    references in text files (TEXT_EXTENSIONS: CSS, HTML, but also scripts,
+    JSON, SVG and plain text) are rewritten to the hashed names, and text
+    files get .gz (and .br when brotli is installed) siblings. Binaries are
+    hashed first, then stylesheets and scripts, then pages, so each file is
+    hashed after the references it contains were rewritten.
+
+    Returns:
+        dict: {source path: built path}, also written to manifest.json
+    """
+    files = sorted(
+        os.path.relpath(os.path.join(root, name), source).replace(os.sep, '/')
+        for root, _, names in os.walk(source) for name in names
+    )
+    stage = {path: _stage(path) for path in files}
+    shutil.rmtree(target, ignore_errors=True)
+    manifest = {}
+    for path in sorted(files, key=stage.get):
+        with open(os.path.join(source, path), 'rb') as f:
+            data = f.read()
+        if stage[path] > _BINARY:
+            data = _rewrite(data.decode('utf-8'), os.path.dirname(path), manifest).encode('utf-8')
+        built = path if stage[path] == _PAGE else hashed_name(path, data)
+        manifest[path] = built
+        _write(os.path.join(target, built), data, level)
+    _write(os.path.join(target, MANIFEST_NAME), json.dumps(manifest, indent=2).encode(), level)
+    return manifest
+
+
+def build_dir():
+    return os.path.join(current_app.root_path, os.pardir, current_app.config.get('FRONTEND_BUILD_DIR', 'build/frontend'))
+
+
+@frontend.route('/', defaults={'filename': 'index.html'})
+@frontend.route('/<path:filename>')
+def serve_asset(filename):
+    """Serve a built frontend file, precompressed when the client accepts it."""
+    root = os.path.abspath(build_dir())
+    path = safe_join(root, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    encodings = [encoding for encoding, suffix in ENCODING_SUFFIXES.items() if os.path.isfile(path + suffix)]
+    encoding = negotiate_encoding(encodings) if encodings else None
+    if encoding is None:
+        response = send_from_directory(root, filename)
+    else:
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response = send_from_directory(root, filename + ENCODING_SUFFIXES[encoding], mimetype=mimetype)
+        response.headers['Content-Encoding'] = encoding
+    if encodings:
+        response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = IMMUTABLE if _HASHED_NAME.search(filename) else 'no-cache'
+    return response
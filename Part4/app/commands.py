@@ -0,0 +1,22 @@
+import os
+import click
+from flask import current_app
+from app.assets import build_assets
+from app.services import facade
+
+
+@click.command('repair-ratings')
+def repair_ratings_command():
+    """Recompute the rating aggregates of every place from its reviews."""
+    repaired = facade.repair_rating_aggregates()
+    click.echo(f"Repaired rating aggregates of {repaired} place(s)")
+
+
+@click.command('build-assets')
+def build_assets_command():
+    """Hash and precompress the frontend files for production."""
+    root = os.path.join(current_app.root_path, os.pardir)
+    source = os.path.join(root, current_app.config['FRONTEND_SOURCE_DIR'])
+    target = os.path.join(root, current_app.config['FRONTEND_BUILD_DIR'])
+    manifest = build_assets(source, target)
+    click.echo(f"Built {len(manifest)} asset(s) into {os.path.normpath(target)}")
@@ -0,0 +1,57 @@
+import gzip
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # optional: responses are then only gzip-compressed
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/x-ndjson', 'application/javascript', 'image/svg+xml',
+    'text/css', 'text/html', 'text/javascript', 'text/plain',
+}
+
+# Content-Encoding -> suffix of the precompressed file and of the compressed ETag
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+ETAG_SUFFIXES = {'br': '-br', 'gzip': '-gzip'}
+
+
+def negotiate_encoding(available=('br', 'gzip')):
+    """Return the preferred Content-Encoding among available, or None to send the body as is."""
+    if not request.accept_encodings:
+        return None
+    choices = [encoding for encoding in available if encoding != 'br' or brotli is not None]
+    return request.accept_encodings.best_match(choices)
+
+
+def compress(data, encoding, level=6):
+    if encoding == 'br':
+        return brotli.compress(data, quality=min(level, 11))
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def compress_response(response):
+    """
+    after_request hook compressing text bodies of at least COMPRESS_MIN_SIZE bytes.
+
+    Streamed and file responses are left alone, as are bodies that already
+    have a Content-Encoding. A compressed body gets its own ETag (suffixed
+    like "-gzip"), which conditional requests still recognize.
+    """
+    config = current_app.config
+    if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    data = response.get_data()
+    if len(data) < config.get('COMPRESS_MIN_SIZE', 1024):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+    response.set_data(compress(data, encoding, config.get('COMPRESS_LEVEL', 6)))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(etag + ETAG_SUFFIXES[encoding], weak)
+    return response
@@ -1,25 +1,28 @@
 import uuid
-from datetime import datetime
-from flask_bcrypt import Bcrypt
+from datetime import datetime, timezone
 from app import db
 
-bcrypt = Bcrypt()
+
+def utcnow():
+    """Return the current UTC time, naive like the values the DateTime columns store."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 class BaseModel(db.Model):
 
     __abstract__ = True
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow)
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
 
     def __init__(self):
         self.id = str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = utcnow()
+        self.updated_at = utcnow()
 
     def save(self):
-        self.updated_at = datetime.now()
+        self.updated_at = utcnow()
 
     def update(self, data):
         for key, value in data.items():
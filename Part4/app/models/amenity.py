@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from app.models.__init__ import db
+from app.models.__init__ import db, utcnow
 
 
 class Amenity(db.Model):
@@ -9,19 +8,30 @@ class Amenity(db.Model):
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = db.Column(db.String(50), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow)
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
 
     def __init__(self, name):
         if not name or len(name) > 50:
             raise ValueError("Amenity name is required and must be at most 50 characters long.")
         self.name = name
         self.id = str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = utcnow()
+        self.updated_at = utcnow()
+
+    @classmethod
+    def bulk_mapping(cls, data):
+        """Validate an amenity payload and return its column mapping for bulk inserts."""
+        if not isinstance(data, dict):
+            raise TypeError("Amenity must be a JSON object")
+        name = data.get('name')
+        if not name or not isinstance(name, str) or len(name) > 50:
+            raise ValueError("Amenity name is required and must be at most 50 characters long.")
+        now = utcnow()
+        return {'id': str(uuid.uuid4()), 'name': name, 'created_at': now, 'updated_at': now}
 
     def save(self):
-        self.updated_at = datetime.now()
+        self.updated_at = utcnow()
 
     def dict(self):
         return {
@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from app.models.__init__ import BaseModel, db
+from app.models.__init__ import BaseModel, db, utcnow
 
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(36), db.ForeignKey('places.id'), primary_key=True),
@@ -10,31 +9,50 @@ place_amenity = db.Table('place_amenity',
 class Place(BaseModel):
 
     __tablename__ = 'places'
+    # Serve the latitude/longitude range predicates of bbox and radius searches,
+    # and the keyset pagination of places sorted (and filtered) by rating or price
+    __table_args__ = (
+        db.Index('idx_places_lat_lon', 'latitude', 'longitude'),
+        db.Index('idx_places_rating_avg', 'rating_avg', 'id'),
+        db.Index('idx_places_price', '_price', 'id'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     _title = db.Column(db.String(50), nullable=False)
     _description = db.Column(db.String(50), nullable=False)
-    _price = db.Column(db.String(120), nullable=False, unique=True)
+    _price = db.Column(db.Numeric(10, 2, asdecimal=False), nullable=False)
     latitude = db.Column(db.Float, default=False)
     longitude = db.Column(db.Float, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow)
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
     owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
 
+    # Rating aggregates, updated by HBnBFacade with every review write
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+    rating_avg = db.Column(db.Float, nullable=False, default=0.0)
+
+    # Both load lazily; HBnBFacade picks eager-loading options per endpoint (see place_profile)
     reviews = db.relationship('Review', backref='place', lazy=True)
-    amenities = db.relationship('Amenity', secondary=place_amenity, lazy='subquery',
+    amenities = db.relationship('Amenity', secondary=place_amenity, lazy=True,
                               backref=db.backref('places', lazy=True))
 
-    def __init__(self, title='', description='', price='', latitude=0.0, longitude=0.0, owner_id=''):
+    def __init__(self, title='', description='', price=0.0, latitude=0.0, longitude=0.0, owner_id=''):
         self.id = str(uuid.uuid4())
         self._title = title
         self._description = description
-        self._price = price
+        self.price = price
         self.latitude = latitude
         self.longitude = longitude
         self.owner_id = owner_id
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = utcnow()
+        self.updated_at = utcnow()
+        self.set_rating_aggregates([0] * 5)
 
     @property
     def title(self):
@@ -60,10 +78,65 @@ class Place(BaseModel):
 
     @price.setter
     def price(self, value):
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise TypeError("Price must be a number")
         if value < 0:
             raise ValueError("Price can't be negative")
         self._price = value
 
+    @classmethod
+    def bulk_mapping(cls, data):
+        """
+        Validate a place payload and return its column mapping for bulk inserts.
+
+        Applies the same rules as the property setters and set_coordinates
+        without building an ORM instance.
+        """
+        if not isinstance(data, dict):
+            raise TypeError("Place must be a JSON object")
+        title = data.get('title')
+        if not title or not isinstance(title, str) or len(title) > 100:
+            raise TypeError("Error: title is invalid")
+        description = data.get('description') or ''
+        if not isinstance(description, str):
+            raise TypeError("Error: description is invalid")
+        price = data.get('price')
+        if not isinstance(price, (int, float)) or isinstance(price, bool):
+            raise TypeError("Price must be a number")
+        if price < 0:
+            raise ValueError("Price can't be negative")
+        latitude, longitude = data.get('latitude'), data.get('longitude')
+        if (not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float))
+                or not -90 <= latitude <= 90 or not -180 <= longitude <= 180):
+            raise ValueError("Coordinates of latitude and longitude aren't correct")
+        if not isinstance(data.get('owner_id'), str):
+            raise ValueError("Invalid Owner ID")
+        now = utcnow()
+        return {'id': str(uuid.uuid4()), '_title': title, '_description': description,
+                '_price': price, 'latitude': latitude, 'longitude': longitude,
+                'owner_id': data['owner_id'], 'created_at': now, 'updated_at': now}
+
+    @property
+    def rating_histogram(self):
+        """Number of reviews per rating, from 1 to 5."""
+        return [getattr(self, f'rating_{rating}') for rating in range(1, 6)]
+
+    def set_rating_aggregates(self, histogram):
+        """Set every rating aggregate from a histogram of the 5 rating counts."""
+        for rating, count in enumerate(histogram, start=1):
+            setattr(self, f'rating_{rating}', count)
+        self.review_count = sum(histogram)
+        self.rating_sum = sum(rating * count for rating, count in enumerate(histogram, start=1))
+        self.rating_avg = self.rating_sum / self.review_count if self.review_count else 0.0
+
+    def count_rating(self, rating, step=1):
+        """Add (step=1) or remove (step=-1) one rating from the aggregates."""
+        if rating not in range(1, 6):
+            raise ValueError("Rating must be between 1 and 5")
+        histogram = self.rating_histogram
+        histogram[rating - 1] += step
+        self.set_rating_aggregates(histogram)
+
     def set_coordinates(self, latitude, longitude):
         if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
             raise ValueError("Coordinates of latitude and longitude aren't correct")
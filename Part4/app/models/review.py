@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from app.models.__init__ import BaseModel, db
+from app.models.__init__ import BaseModel, db, utcnow
 
 class Review(db.Model):
 
@@ -9,7 +8,7 @@ class Review(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     text = db.Column(db.String(1024), nullable=False)
     rating = db.Column(db.Integer, nullable=False)
-    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False)
+    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False, index=True)
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
 
     def __init__(self, text, rating, place_id, user_id, id=None):
@@ -30,11 +29,29 @@ class Review(db.Model):
         self.user_id = user_id
 
         self.id = id or str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = utcnow()
+        self.updated_at = utcnow()
+
+    @classmethod
+    def bulk_mapping(cls, data):
+        """Validate a review payload and return its column mapping for bulk inserts."""
+        if not isinstance(data, dict):
+            raise TypeError("Review must be a JSON object")
+        text = data.get('text')
+        if not text or not isinstance(text, str):
+            raise ValueError("Review text is required")
+        rating = data.get('rating')
+        if not isinstance(rating, int) or isinstance(rating, bool) or rating < 1 or rating > 5:
+            raise ValueError("Rating must be between 1 and 5")
+        if not isinstance(data.get('place_id'), str):
+            raise ValueError("Invalid Place ID")
+        if not isinstance(data.get('user_id'), str):
+            raise ValueError("Invalid User ID")
+        return {'id': str(uuid.uuid4()), 'text': text, 'rating': rating,
+                'place_id': data['place_id'], 'user_id': data['user_id']}
 
     def save(self):
-        self.updated_at = datetime.now()
+        self.updated_at = utcnow()
 
     def dict(self):
         return {
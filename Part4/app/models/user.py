@@ -1,6 +1,6 @@
 import uuid
-from datetime import datetime
-from .__init__ import BaseModel, db, bcrypt
+from .__init__ import BaseModel, db, utcnow
+from app.passwords import password_hasher
 
 
 class User(BaseModel):
@@ -13,8 +13,8 @@ class User(BaseModel):
     email = db.Column(db.String(120), nullable=False, unique=True)
     is_admin = db.Column(db.Boolean, default=False)
     password = db.Column(db.String(100), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow)
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
 
     places = db.relationship('Place', backref='owner', lazy=True)
     reviews = db.relationship('Review', backref='author', lazy=True)
@@ -26,10 +26,10 @@ class User(BaseModel):
         self.last_name = last_name
         self.email = email
         self.is_admin = is_admin
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = utcnow()
+        self.updated_at = utcnow()
         self.place = []
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.hash_password(password)
 
     def validation(self, first_name, last_name, is_admin):
             if len(self.first_name) > 50 or len(self.last_name) > 50:
@@ -42,16 +42,16 @@ class User(BaseModel):
 
     def save(self):
         """Update the updated_at timestamp whenever the object is modified."""
-        self.updated_at = datetime.now()
+        self.updated_at = utcnow()
 
     def add_place(self, place):
         """Add a review to the place."""
         self.place.append(place)
         
     def hash_password(self, password):
-        """Hash the password before storing it."""
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        """Hash the password before storing it, in the application's password pool."""
+        self.password = password_hasher().hash(password)
 
     def verify_password(self, password):
-        """Verify the hashed password."""
-        return bcrypt.check_password_hash(self.password, password)
\ No newline at end of file
+        """Verify the hashed password, in the application's password pool."""
+        return password_hasher().verify(password, self.password)
\ No newline at end of file
@@ -0,0 +1,136 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import bcrypt
+from flask import current_app, has_app_context
+
+# Key of the per-application PasswordHasher in app.extensions
+PASSWORD_HASHER_KEY = 'hbnb_password_hasher'
+
+
+class PasswordPoolBusy(Exception):
+    """Every slot of the password pool is taken: the caller should answer 429."""
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _check(password, hashed):
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+def hash_rounds(hashed):
+    """Return the cost factor of a bcrypt hash ("$2b$12$..." -> 12), or None if it is not one."""
+    parts = hashed.split('$')
+    return int(parts[2]) if len(parts) > 3 and parts[2].isdigit() else None
+
+
+class PasswordHasher:
+    """
+    Run bcrypt in a bounded pool of worker processes.
+
+    Hashing costs a CPU core for a few hundred milliseconds. Off the request
+    threads, it no longer holds the GIL they share, and at most `workers`
+    hashes run at once. At most `max_pending` calls may be running or queued:
+    beyond that, PasswordPoolBusy is raised right away instead of letting a
+    burst of logins queue up behind each other. With no workers, bcrypt runs
+    in the calling thread under the same bound. A pool broken by a crashed
+    worker is replaced, and the call retried once on the new one.
+
+    The pool is created on first use, in the process that uses it: a worker
+    forked by a pre-forking server after that gets a pool of its own rather
+    than the parent's.
+    """
+
+    def __init__(self, workers=2, max_pending=16, rounds=12):
+        self.workers = workers
+        self.rounds = rounds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        # Process that created the pool; a forked child must not submit to it
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _run(self, function, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolBusy("Too many password operations in progress")
+        if not self.workers:
+            try:
+                return function(*args)
+            finally:
+                self._slots.release()
+        try:
+            for attempt in (1, 2):
+                executor = self.start()
+                try:
+                    return executor.submit(function, *args).result()
+                except BrokenProcessPool:
+                    self._replace(executor)
+                    if attempt == 2:
+                        raise
+        finally:
+            self._slots.release()
+
+    def start(self):
+        """Create the worker pool of the current process if needed and return it."""
+        with self._lock:
+            if self._executor is not None and self._pid != os.getpid():
+                # Inherited through fork: the pool's processes belong to the parent
+                self._executor = None
+            if self._executor is None and self.workers:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._pid = os.getpid()
+            return self._executor
+
+    def _replace(self, broken):
+        # Only the first caller to see the broken pool replaces it
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def hash(self, password):
+        # Like flask_bcrypt, which hashed passwords before the pool
+        if not password:
+            raise ValueError("Password must be non-empty.")
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password, hashed):
+        return self._run(_check, password, hashed)
+
+    def needs_rehash(self, hashed):
+        """Whether a hash was made with another cost factor than the configured one."""
+        return hash_rounds(hashed) != self.rounds
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                if self._pid == os.getpid():
+                    self._executor.shutdown()
+                self._executor = None
+
+
+# Used outside an application context, e.g. models built in plain unit tests or scripts
+_INLINE_HASHER = PasswordHasher(workers=0, max_pending=64)
+
+
+def init_password_hasher(app):
+    """Build the application's PasswordHasher from its configuration; its pool starts on first use."""
+    config = app.config
+    hasher = PasswordHasher(workers=config.get('PASSWORD_POOL_WORKERS', 2),
+                            max_pending=config.get('PASSWORD_POOL_MAX_PENDING', 16),
+                            rounds=config.get('BCRYPT_LOG_ROUNDS', 12))
+    app.extensions[PASSWORD_HASHER_KEY] = hasher
+    return hasher
+
+
+def password_hasher():
+    """Return the application's PasswordHasher, or an inline bcrypt hasher outside an application."""
+    if not has_app_context():
+        return _INLINE_HASHER
+    hasher = current_app.extensions.get(PASSWORD_HASHER_KEY)
+    if hasher is None:
+        hasher = init_password_hasher(current_app)
+    return hasher
@@ -0,0 +1,144 @@
+import heapq
+from functools import reduce
+
+# Ordinals per container: bitsets are split in chunks of this many bits, like roaring bitmaps
+CHUNK_BITS = 1 << 16
+_CHUNK_MASK = CHUNK_BITS - 1
+
+
+class BitmapIndex:
+    """
+    One bitset per key over dense ordinals given to the indexed objects.
+
+    Each bitset is a dict of {chunk number: int}, so sparse keys only keep
+    the chunks they use. Intersecting keys ANDs the chunks present in all
+    of them, a machine word at a time inside Python's big integers.
+    """
+
+    def __init__(self):
+        # obj_id -> ordinal, and ordinal -> obj_id
+        self._ordinals = {}
+        self._ids = []
+        # key -> {chunk number -> bits}
+        self._bitmaps = {}
+
+    def __contains__(self, obj_id):
+        return obj_id in self._ordinals
+
+    def _ordinal(self, obj_id):
+        ordinal = self._ordinals.get(obj_id)
+        if ordinal is None:
+            ordinal = self._ordinals[obj_id] = len(self._ids)
+            self._ids.append(obj_id)
+        return ordinal
+
+    def add(self, key, obj_id):
+        ordinal = self._ordinal(obj_id)
+        chunks = self._bitmaps.setdefault(key, {})
+        chunk = ordinal // CHUNK_BITS
+        chunks[chunk] = chunks.get(chunk, 0) | (1 << (ordinal & _CHUNK_MASK))
+
+    def discard(self, key, obj_id):
+        ordinal = self._ordinals.get(obj_id)
+        if ordinal is not None:
+            self._clear(key, ordinal)
+
+    def remove(self, obj_id):
+        """Clear obj_id under every key and drop its ordinal, e.g. once the object is deleted."""
+        ordinal = self._ordinals.pop(obj_id, None)
+        if ordinal is None:
+            return
+        # The ordinal is not reused: its slot stays empty and its bits cleared
+        self._ids[ordinal] = None
+        for key in list(self._bitmaps):
+            self._clear(key, ordinal)
+
+    def _clear(self, key, ordinal):
+        chunks = self._bitmaps.get(key)
+        if chunks is None:
+            return
+        chunk = ordinal // CHUNK_BITS
+        bits = chunks.get(chunk, 0) & ~(1 << (ordinal & _CHUNK_MASK))
+        if bits:
+            chunks[chunk] = bits
+        else:
+            chunks.pop(chunk, None)
+            if not chunks:
+                del self._bitmaps[key]
+
+    def _intersection(self, keys):
+        """Yield (chunk number, bits) of the objects present under every key."""
+        bitmaps = [self._bitmaps.get(key) for key in set(keys)]
+        if not bitmaps or not all(bitmaps):
+            return
+        smallest = min(bitmaps, key=len)
+        for chunk in sorted(smallest):
+            bits = reduce(lambda acc, chunks: acc & chunks.get(chunk, 0), bitmaps, smallest[chunk])
+            if bits:
+                yield chunk, bits
+
+    def _members(self, keys):
+        """Yield the objects present under every key, in ordinal order."""
+        for chunk, bits in self._intersection(keys):
+            base = chunk * CHUNK_BITS
+            while bits:
+                low = bits & -bits
+                yield self._ids[base + low.bit_length() - 1]
+                bits ^= low
+
+    def page(self, keys, after_id=None, limit=50):
+        """
+        Return the objects present under every key, in id order.
+
+        Ordinals depend on the order objects reached this index, so pages
+        follow the ids instead: a cursor from another process, or from
+        before a rebuild, picks up at the same place.
+
+        Args:
+            keys (iterable): Keys that must all be set
+            after_id (str, optional): Last object of the previous page, indexed or not
+            limit (int): Maximum number of objects to return
+
+        Returns:
+            tuple: (obj_ids, next_id) where next_id is None on the last page
+        """
+        members = self._members(keys)
+        if after_id is not None:
+            members = (obj_id for obj_id in members if obj_id > after_id)
+        found = heapq.nsmallest(limit + 1, members)
+        next_id = found[limit - 1] if len(found) > limit else None
+        return found[:limit], next_id
+
+    def count(self, keys):
+        """Return how many objects are present under every key."""
+        return sum(bits.bit_count() for _, bits in self._intersection(keys))
+
+    def filter(self, keys, obj_ids):
+        """Return the obj_ids, in the given order, that are present under every key."""
+        bitmaps = [self._bitmaps.get(key) for key in set(keys)]
+        if not all(bitmaps):
+            return []
+        found = []
+        for obj_id in obj_ids:
+            ordinal = self._ordinals.get(obj_id)
+            if ordinal is None:
+                continue
+            chunk, bit = ordinal // CHUNK_BITS, 1 << (ordinal & _CHUNK_MASK)
+            if all(chunks.get(chunk, 0) & bit for chunks in bitmaps):
+                found.append(obj_id)
+        return found
+
+    def counts(self, obj_ids):
+        """Return {key: number of obj_ids present under key} for the keys set on any of them."""
+        selected = {}
+        for obj_id in obj_ids:
+            ordinal = self._ordinals.get(obj_id)
+            if ordinal is not None:
+                chunk = ordinal // CHUNK_BITS
+                selected[chunk] = selected.get(chunk, 0) | (1 << (ordinal & _CHUNK_MASK))
+        counts = {}
+        for key, chunks in self._bitmaps.items():
+            count = sum((bits & chunks.get(chunk, 0)).bit_count() for chunk, bits in selected.items())
+            if count:
+                counts[key] = count
+        return counts
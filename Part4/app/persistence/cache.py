@@ -0,0 +1,257 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from app import db
+
+# Key of the per-application ObjectCache in app.extensions
+OBJECT_CACHE_KEY = 'hbnb_object_cache'
+
+# Key in session.info collecting the cache keys written by the transaction
+_PENDING_INVALIDATIONS = 'hbnb_pending_cache_invalidations'
+
+# Models read through a CachedRepository; their writes invalidate their entries
+_CACHED_MODELS = set()
+
+# Column python types that JSON lacks, rebuilt from their string form on load
+_DECODERS = {datetime: datetime.fromisoformat, date: date.fromisoformat, Decimal: Decimal}
+
+# model -> {column key: decoder} of the model's columns of those types
+_COLUMN_DECODERS = {}
+
+
+def _encode(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Cannot cache a {type(value).__name__} column value")
+
+
+def _column_decoders(model):
+    decoders = _COLUMN_DECODERS.get(model)
+    if decoders is None:
+        decoders = {}
+        for attr in inspect(model).column_attrs:
+            try:
+                python_type = attr.columns[0].type.python_type
+            except NotImplementedError:
+                continue
+            if python_type in _DECODERS:
+                decoders[attr.key] = _DECODERS[python_type]
+        _COLUMN_DECODERS[model] = decoders
+    return decoders
+
+
+class LocalCache:
+    """
+    In-process LRU store with a time-to-live per entry.
+
+    Speaks the subset of the Redis client API used by ObjectCache, so a
+    redis.Redis instance can replace it without other changes:
+    get(key), set(key, value, ex=seconds), delete(*keys), incr(key) and
+    expire(key, seconds), values as bytes or counters as int. Entries live
+    in one process: a write in another worker does not reach them, so it is
+    only suitable for a single-process deployment.
+    """
+
+    def __init__(self, maxsize=1024, clock=time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        # key -> (expiry or None, value), least recently used first
+        self._entries = OrderedDict()
+        # incr reads then writes; the lock makes it atomic like Redis INCR
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, ex=None):
+        self._entries[key] = (self._clock() + ex if ex else None, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return True
+
+    def delete(self, *keys):
+        return sum(self._entries.pop(key, None) is not None for key in keys)
+
+    def incr(self, key, amount=1):
+        """Add amount to a counter, created at 0; keeps the counter's expiry like Redis does."""
+        with self._lock:
+            value = self.get(key)
+            expires = self._entries[key][0] if value is not None else None
+            value = int(value or 0) + amount
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+    def expire(self, key, seconds):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        self._entries[key] = (self._clock() + seconds, entry[1])
+        return True
+
+
+class ObjectCache:
+    """
+    Read-through store of committed ORM objects for one application.
+
+    The loaded column values of an object, minus the excluded ones, are
+    stored as JSON in the backend under "<table>:<id>", so that a shared
+    backend holds data rather than anything executable; a hit rebuilds the object
+    and merges it into the current session without a query, excluded
+    columns loading on first access. Any flushed update or delete of a
+    cached model drops its key once the transaction commits, in the backend
+    of the committing process: workers only see each other's invalidations
+    through a shared backend such as Redis.
+    """
+
+    def __init__(self, backend, ttl=300, prefix='hbnb:'):
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, model, obj_id):
+        return f"{self.prefix}{model.__tablename__}:{obj_id}"
+
+    def load(self, model, obj_id):
+        """Return the cached object attached to the current session, or None on a miss."""
+        value = self.backend.get(self.key(model, obj_id))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        obj = inspect(model).class_manager.new_instance()
+        decoders = _column_decoders(model)
+        for key, column_value in json.loads(value).items():
+            if column_value is not None and key in decoders:
+                column_value = decoders[key](column_value)
+            set_committed_value(obj, key, column_value)
+        # Detached with its identity; the columns left out stay unloaded
+        make_transient_to_detached(obj)
+        return db.session.merge(obj, load=False)
+
+    def store(self, model, obj, exclude=()):
+        """Cache the loaded columns of obj, leaving out the column keys in exclude."""
+        loaded = inspect(obj).dict
+        values = {attr.key: loaded[attr.key] for attr in inspect(model).column_attrs
+                  if attr.key in loaded and attr.key not in exclude}
+        self.backend.set(self.key(model, obj.id), json.dumps(values, default=_encode).encode(), ex=self.ttl)
+
+    def invalidate(self, *keys):
+        if keys:
+            self.backend.delete(*keys)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_ratio': self.hits / total if total else 0.0}
+
+
+def object_cache_enabled():
+    """
+    Whether the application reads through the object cache.
+
+    OBJECT_CACHE_ENABLED None (the default) turns the cache on only with a
+    shared OBJECT_CACHE_BACKEND: the in-process LRU misses the other workers'
+    invalidations, so it needs an explicit OBJECT_CACHE_ENABLED = True, meant
+    for single-process deployments.
+    """
+    config = current_app.config
+    enabled = config.get('OBJECT_CACHE_ENABLED')
+    if enabled is None:
+        return config.get('OBJECT_CACHE_BACKEND') is not None
+    return bool(enabled)
+
+
+def object_cache():
+    """Return the application's ObjectCache, built from its configuration on first use."""
+    cache = current_app.extensions.get(OBJECT_CACHE_KEY)
+    if cache is None:
+        config = current_app.config
+        backend = config.get('OBJECT_CACHE_BACKEND')
+        if backend is None:
+            backend = LocalCache(config.get('OBJECT_CACHE_SIZE', 1024))
+        cache = ObjectCache(backend, ttl=config.get('OBJECT_CACHE_TTL', 300))
+        current_app.extensions[OBJECT_CACHE_KEY] = cache
+    return cache
+
+
+class CachedRepository:
+    """
+    Read-through cache in front of a SQLAlchemyRepository.
+
+    get() looks in the session, then in the application's ObjectCache, then
+    in the database; every other method goes straight to the wrapped
+    repository. Lookups with loader options or a row lock skip the cache.
+    Columns named in exclude (e.g. secrets) are never written to the cache.
+    """
+
+    def __init__(self, repository, exclude=()):
+        self.repository = repository
+        self.model = repository.model
+        self.exclude = frozenset(exclude)
+        _CACHED_MODELS.add(self.model)
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    def get(self, obj_id, options=(), lock=False):
+        if options or lock or not object_cache_enabled():
+            return self.repository.get(obj_id, options=options, lock=lock)
+        obj_id = str(obj_id)
+        loaded = db.session.identity_map.get(db.session.identity_key(self.model, obj_id))
+        if loaded is not None:
+            return loaded
+        cache = object_cache()
+        obj = cache.load(self.model, obj_id)
+        if obj is None:
+            obj = self.repository.get(obj_id)
+            if obj is not None and not db.session.is_modified(obj):
+                cache.store(self.model, obj, self.exclude)
+        return obj
+
+
+# Registered once for every model; only those read through a CachedRepository record a key
+@event.listens_for(db.Model, 'after_update', propagate=True)
+@event.listens_for(db.Model, 'after_delete', propagate=True)
+def _written(mapper, connection, obj):
+    if mapper.class_ not in _CACHED_MODELS:
+        return
+    if has_app_context() and object_cache_enabled():
+        key = object_cache().key(mapper.class_, mapper.primary_key_from_instance(obj)[0])
+        db.session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(key)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _apply_invalidations(session):
+    keys = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if keys and has_app_context():
+        object_cache().invalidate(*keys)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _drop_invalidations(session):
+    session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -1,6 +1,45 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
 from app.models import user, place, review, amenity
-from Part4.app import db
+from math import cos, pi, radians, sin
+from app.persistence.spatial import EARTH_RADIUS_KM, GridIndex, haversine_km, lon_ranges, radius_bbox
+from app.persistence.versions import record_write
+from sqlalchemy import and_, func, inspect, or_, select
+from sqlalchemy.exc import IntegrityError
+from app import db
+
+# Sentinel for objects that do not carry an indexed attribute
+_MISSING = object()
+
+# Key in session.info counting the units of work currently open on the session
+_UOW_DEPTH = 'hbnb_unit_of_work_depth'
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Group repository writes into a single transaction.
+
+    SQLAlchemyRepository methods called inside the block skip their own
+    commit; the outermost block commits once on exit, or rolls back if
+    the block raises. Nested blocks join the enclosing transaction.
+    """
+    session = db.session
+    depth = session.info.get(_UOW_DEPTH, 0)
+    session.info[_UOW_DEPTH] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except Exception:
+        if depth == 0:
+            session.rollback()
+        raise
+    finally:
+        session.info[_UOW_DEPTH] = depth
+
 
 class Repository(ABC):
     @abstractmethod
@@ -27,14 +66,202 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def get_all_by_attribute(self, attr_name, attr_value):
+        pass
+
+    @abstractmethod
+    def list_page(self, after_id=None, limit=50, order_by='id', options=(), lower=None, upper=None):
+        """
+        Return one page of objects using keyset pagination.
+
+        Args:
+            after_id (str, optional): Id of the last object of the previous page
+            limit (int): Maximum number of objects to return
+            order_by (str): Attribute to sort on, prefixed with '-' for descending order
+            options (tuple): Loader options applied by SQL backends, ignored in memory
+            lower (optional): Inclusive lower bound on the order_by attribute
+            upper (optional): Inclusive upper bound on the order_by attribute
+
+        Returns:
+            tuple: (objects, next_id) where next_id is None on the last page
+
+        Raises:
+            ValueError: If after_id does not refer to an existing object
+        """
+        pass
+
+    @abstractmethod
+    def stream(self, after_id=None, options=(), batch_size=1000):
+        """
+        Yield every object after after_id in id order, without loading them all at once.
+
+        Meant for read-only exports: consumers must not keep the objects around.
+        """
+        pass
+
+    @abstractmethod
+    def find_in_bbox(self, min_lat, min_lon, max_lat, max_lon, limit=None, options=()):
+        """
+        Return up to limit objects whose coordinates fall inside a bounding box.
+
+        With a limit, the objects are the first ones in id order, so repeated
+        calls return the same rows. A box with min_lon > max_lon crosses the
+        antimeridian.
+        """
+        pass
+
+    @abstractmethod
+    def find_near(self, lat, lon, radius_km, limit=None, options=()):
+        """
+        Return up to limit objects within radius_km of a point.
+
+        Returns:
+            list: (obj, distance_km) tuples sorted by distance
+        """
+        pass
+
 class InMemoryRepository(Repository):
-    def __init__(self):
+    def __init__(self, indexes=(), unique_indexes=()):
+        """
+        Initialize the repository.
+
+        Args:
+            indexes (iterable): Attribute names to index (non-unique)
+            unique_indexes (iterable): Attribute names whose values must be unique
+        """
         self._storage = {}
+        # attr_name -> {value -> {obj_id -> obj}}
+        self._indexes = {}
+        self._unique = set()
+        # attr_name -> sorted list of (value, obj_id)
+        self._sorted = {}
+        # (lat_attr, lon_attr, GridIndex) once add_spatial_index is called
+        self._spatial = None
+        self.add_sorted_index('id')
+        for attr_name in unique_indexes:
+            self.add_index(attr_name, unique=True)
+        for attr_name in indexes:
+            self.add_index(attr_name)
+
+    def add_index(self, attr_name, unique=False):
+        """
+        Declare a hash index on an attribute and build it from the stored objects.
+
+        Lookups through get_by_attribute on an indexed attribute are O(1)
+        instead of a scan over the whole storage.
+
+        Raises:
+            ValueError: If unique is True and stored objects share a value
+        """
+        index = {}
+        for obj in self._storage.values():
+            value = getattr(obj, attr_name, _MISSING)
+            if value is _MISSING:
+                continue
+            bucket = index.setdefault(value, {})
+            if unique and bucket:
+                raise ValueError(f"Duplicate value for unique attribute '{attr_name}': {value!r}")
+            bucket[obj.id] = obj
+        self._indexes[attr_name] = index
+        if unique:
+            self._unique.add(attr_name)
+
+    def add_sorted_index(self, attr_name):
+        """
+        Declare a sorted index on an attribute and build it from the stored objects.
+
+        Sorted indexes serve list_page ordered on that attribute without
+        sorting the whole storage on every call. Objects whose value is
+        missing or None are left out of the index.
+        """
+        keys = []
+        for obj in self._storage.values():
+            value = getattr(obj, attr_name, None)
+            if value is not None:
+                keys.append((value, obj.id))
+        keys.sort()
+        self._sorted[attr_name] = keys
+
+    def add_spatial_index(self, lat_attr='latitude', lon_attr='longitude', cell_deg=0.1):
+        """
+        Declare a grid index on a pair of coordinate attributes.
+
+        find_in_bbox and find_near only visit the grid cells overlapping
+        the searched area instead of scanning the whole storage.
+        """
+        grid = GridIndex(cell_deg)
+        for obj in self._storage.values():
+            lat, lon = getattr(obj, lat_attr, None), getattr(obj, lon_attr, None)
+            if lat is not None and lon is not None:
+                grid.add(obj.id, lat, lon)
+        self._spatial = (lat_attr, lon_attr, grid)
+
+    def _index_obj(self, obj):
+        for attr_name, index in self._indexes.items():
+            value = getattr(obj, attr_name, _MISSING)
+            if value is not _MISSING:
+                index.setdefault(value, {})[obj.id] = obj
+        for attr_name, keys in self._sorted.items():
+            value = getattr(obj, attr_name, None)
+            if value is not None:
+                insort(keys, (value, obj.id))
+        if self._spatial:
+            lat_attr, lon_attr, grid = self._spatial
+            lat, lon = getattr(obj, lat_attr, None), getattr(obj, lon_attr, None)
+            if lat is not None and lon is not None:
+                grid.add(obj.id, lat, lon)
+
+    def _unindex_obj(self, obj, values):
+        for attr_name, value in values.items():
+            if attr_name in self._indexes:
+                bucket = self._indexes[attr_name].get(value)
+                if bucket is not None:
+                    bucket.pop(obj.id, None)
+                    if not bucket:
+                        del self._indexes[attr_name][value]
+            if attr_name in self._sorted and value not in (None, _MISSING):
+                keys = self._sorted[attr_name]
+                pos = bisect_left(keys, (value, obj.id))
+                if pos < len(keys) and keys[pos] == (value, obj.id):
+                    del keys[pos]
+        if self._spatial:
+            lat_attr, lon_attr, grid = self._spatial
+            lat, lon = values.get(lat_attr), values.get(lon_attr)
+            if lat not in (None, _MISSING) and lon not in (None, _MISSING):
+                grid.remove(obj.id, lat, lon)
+
+    def _indexed_values(self, obj):
+        attr_names = self._indexes.keys() | self._sorted.keys()
+        if self._spatial:
+            attr_names |= set(self._spatial[:2])
+        return {attr_name: getattr(obj, attr_name, _MISSING) for attr_name in attr_names}
+
+    def _live(self, bucket):
+        """Yield indexed objects that are still held in the storage."""
+        for obj_id, obj in bucket.items():
+            if self._storage.get(obj_id) is obj:
+                yield obj
+
+    def _check_unique(self, obj_id, values):
+        """Raise ValueError if any unique value is already held by another object."""
+        for attr_name in self._unique:
+            value = values.get(attr_name, _MISSING)
+            if value is _MISSING:
+                continue
+            bucket = self._indexes[attr_name].get(value)
+            if bucket and any(other.id != obj_id for other in self._live(bucket)):
+                raise ValueError(f"Duplicate value for unique attribute '{attr_name}': {value!r}")
 
     def add(self, obj):
+        self._check_unique(obj.id, self._indexed_values(obj))
+        previous = self._storage.get(obj.id)
+        if previous is not None:
+            self._unindex_obj(previous, self._indexed_values(previous))
         self._storage[obj.id] = obj
+        self._index_obj(obj)
 
-    def get(self, obj_id):
+    def get(self, obj_id, options=(), lock=False):
         return self._storage.get(obj_id)
 
     def get_all(self):
@@ -43,26 +270,165 @@ class InMemoryRepository(Repository):
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
-            obj.update(data)
+            old_values = self._indexed_values(obj)
+            self._check_unique(obj_id, {
+                attr_name: data[attr_name] for attr_name in self._unique
+                if attr_name in data and hasattr(obj, attr_name)
+            })
+            self._unindex_obj(obj, old_values)
+            try:
+                obj.update(data)
+            finally:
+                self._index_obj(obj)
 
     def delete(self, obj_id):
         if obj_id in self._storage:
-            del self._storage[obj_id]
+            obj = self._storage.pop(obj_id)
+            self._unindex_obj(obj, self._indexed_values(obj))
 
     def get_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            bucket = index.get(attr_value)
+            return next(self._live(bucket), None) if bucket else None
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
 
+    def get_all_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            bucket = index.get(attr_value)
+            return list(self._live(bucket)) if bucket else []
+        return [obj for obj in self._storage.values() if getattr(obj, attr_name, _MISSING) == attr_value]
+
+    def existing_ids(self, ids):
+        return {obj_id for obj_id in ids if obj_id in self._storage}
+
+    def get_many(self, ids, options=()):
+        return {obj_id: self._storage[obj_id] for obj_id in ids if obj_id in self._storage}
+
+    def list_page(self, after_id=None, limit=50, order_by='id', options=(), lower=None, upper=None):
+        descending = order_by.startswith('-')
+        attr_name = order_by.lstrip('-')
+        keys = self._sorted.get(attr_name)
+        if keys is None:
+            keys = sorted((getattr(obj, attr_name), obj.id) for obj in self._storage.values()
+                          if getattr(obj, attr_name, None) is not None)
+        # Positions [first, end) of the keys within the bounds, found by bisection
+        first = 0 if lower is None else bisect_left(keys, lower, key=itemgetter(0))
+        end = len(keys) if upper is None else bisect_right(keys, upper, key=itemgetter(0))
+
+        if after_id is None:
+            start = end - 1 if descending else first
+        else:
+            anchor_obj = self._storage.get(after_id)
+            if anchor_obj is None:
+                raise ValueError("Invalid cursor")
+            anchor = (getattr(anchor_obj, attr_name), after_id)
+            start = bisect_left(keys, anchor) - 1 if descending else bisect_right(keys, anchor)
+
+        step = -1 if descending else 1
+        page = []
+        pos = max(start, first) if not descending else min(start, end - 1)
+        while first <= pos < end and len(page) <= limit:
+            obj = self._storage.get(keys[pos][1])
+            if obj is not None:
+                page.append(obj)
+            pos += step
+        next_id = page[limit - 1].id if len(page) > limit else None
+        return page[:limit], next_id
+
+    def stream(self, after_id=None, options=(), batch_size=1000):
+        for obj_id in sorted(self._storage):
+            if after_id is None or obj_id > after_id:
+                yield self._storage[obj_id]
+
+    def find_in_bbox(self, min_lat, min_lon, max_lat, max_lon, limit=None, options=()):
+        if self._spatial is None:
+            found = [obj for obj in self._storage.values()
+                     if min_lat <= obj.latitude <= max_lat
+                     and any(lo <= obj.longitude <= hi for lo, hi in lon_ranges(min_lon, max_lon))]
+        else:
+            grid = self._spatial[2]
+            found = [self._storage[obj_id] for obj_id, _, _ in grid.query_bbox(min_lat, min_lon, max_lat, max_lon)
+                     if obj_id in self._storage]
+        if limit is not None:
+            found.sort(key=lambda obj: obj.id)
+        return found[:limit]
+
+    def find_near(self, lat, lon, radius_km, limit=None, options=()):
+        if self._spatial is None:
+            found = [(obj, haversine_km(lat, lon, obj.latitude, obj.longitude))
+                     for obj in self.find_in_bbox(*radius_bbox(lat, lon, radius_km))]
+            found = [(obj, distance) for obj, distance in found if distance <= radius_km]
+        else:
+            grid = self._spatial[2]
+            found = [(self._storage[obj_id], distance) for obj_id, distance in grid.query_radius(lat, lon, radius_km)
+                     if obj_id in self._storage]
+        found.sort(key=lambda pair: pair[1])
+        return found[:limit]
+
 class SQLAlchemyRepository(Repository):
     def __init__(self, model):
         self.model = model
 
+    def _commit(self):
+        """Commit now, unless an enclosing unit_of_work will commit for us."""
+        if not db.session.info.get(_UOW_DEPTH):
+            db.session.commit()
+
     def add(self, obj):
         db.session.add(obj)
-        db.session.commit()
+        self._commit()
 
-    def get(self, obj_id):
+    def bulk_add(self, mappings, links=None):
+        """
+        Insert many rows with one executemany per table, in a single transaction.
+
+        Args:
+            mappings (list): Column mappings, as returned by the model's bulk_mapping
+            links (dict, optional): {table: rows} inserted in the same transaction,
+                e.g. association table rows for the new objects
+
+        Raises:
+            ValueError: If the database rejects the batch; nothing is inserted
+        """
+        try:
+            with unit_of_work() as session:
+                session.bulk_insert_mappings(self.model, mappings)
+                record_write(self.model.__tablename__)
+                for table, rows in (links or {}).items():
+                    if rows:
+                        session.execute(table.insert(), rows)
+                        record_write(table.name)
+        except IntegrityError as e:
+            raise ValueError(f"Bulk insert rejected by the database: {e.orig}")
+
+    def existing_ids(self, ids, chunk_size=500):
+        """Return the subset of ids that exist in the table, querying in chunks."""
+        ids = list(set(ids))
+        found = set()
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            found.update(row[0] for row in db.session.query(self.model.id).filter(self.model.id.in_(chunk)))
+        return found
+
+    def get_many(self, ids, options=()):
+        """Return {id: obj} for the ids that exist, loaded with a single query."""
+        ids = [str(obj_id) for obj_id in ids]
+        if not ids:
+            return {}
+        return {obj.id: obj for obj in self.model.query.options(*options).filter(self.model.id.in_(ids))}
+
+    def get(self, obj_id, options=(), lock=False):
+        """
+        Return the object, locking its row until the transaction ends when lock is True.
+
+        Objects already loaded by the session are returned without a query,
+        except under lock where the row is read again to see committed changes.
+        """
         obj_id = str(obj_id)
-        return self.model.query.get(obj_id)
+        return db.session.get(self.model, obj_id, options=options, with_for_update=lock or None,
+                              populate_existing=lock or None)
 
     def get_all(self):
         return self.model.query.all()
@@ -72,13 +438,94 @@ class SQLAlchemyRepository(Repository):
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+            self._commit()
 
     def delete(self, obj_id):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            self._commit()
 
     def get_by_attribute(self, attr_name, attr_value):
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
\ No newline at end of file
+        return self.model.query.filter_by(**{attr_name: attr_value}).first()
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        return self.model.query.filter_by(**{attr_name: attr_value}).all()
+
+    def list_page(self, after_id=None, limit=50, order_by='id', options=(), lower=None, upper=None):
+        descending = order_by.startswith('-')
+        column = getattr(self.model, order_by.lstrip('-'))
+        pk = self.model.id
+        query = self.model.query.options(*options)
+        if lower is not None:
+            query = query.filter(column >= lower)
+        if upper is not None:
+            query = query.filter(column <= upper)
+
+        if after_id is not None:
+            anchor = db.session.query(column).filter(pk == after_id).first()
+            if anchor is None:
+                raise ValueError("Invalid cursor")
+            if column is pk:
+                query = query.filter(pk < after_id if descending else pk > after_id)
+            else:
+                anchor = anchor[0]
+                if descending:
+                    query = query.filter(or_(column < anchor, and_(column == anchor, pk < after_id)))
+                else:
+                    query = query.filter(or_(column > anchor, and_(column == anchor, pk > after_id)))
+
+        if descending:
+            query = query.order_by(column.desc(), pk.desc())
+        else:
+            query = query.order_by(column, pk)
+        page = query.limit(limit + 1).all()
+        next_id = page[limit - 1].id if len(page) > limit else None
+        return page[:limit], next_id
+
+    def stream(self, after_id=None, options=(), batch_size=1000):
+        """
+        Yield every object after after_id in id order, batch_size rows per fetch.
+
+        The rows come from a streaming cursor (yield_per) and each batch is
+        expunged once consumed, so memory stays bounded by batch_size
+        whatever the size of the table. Objects the session held before the
+        stream started, and anything else loaded meanwhile, stay attached.
+        """
+        query = select(self.model).options(*options).order_by(self.model.id)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        session = db.session
+        held = set(session.identity_map.keys())
+        result = session.execute(query.execution_options(yield_per=batch_size))
+        for batch in result.scalars().partitions():
+            yield from batch
+            for obj in batch:
+                if obj in session and inspect(obj).identity_key not in held:
+                    session.expunge(obj)
+
+    def _bbox_query(self, min_lat, min_lon, max_lat, max_lon, options=()):
+        # Range predicates on the (latitude, longitude) index; two ranges across the antimeridian
+        lat, lon = self.model.latitude, self.model.longitude
+        return self.model.query.options(*options).filter(
+            lat.between(min_lat, max_lat),
+            or_(*(lon.between(lo, hi) for lo, hi in lon_ranges(min_lon, max_lon)))
+        )
+
+    def find_in_bbox(self, min_lat, min_lon, max_lat, max_lon, limit=None, options=()):
+        query = self._bbox_query(min_lat, min_lon, max_lat, max_lon, options)
+        return query.order_by(self.model.id).limit(limit).all()
+
+    def find_near(self, lat, lon, radius_km, limit=None, options=()):
+        # The box prefilter uses the index; the database filters and orders on the
+        # haversine term a, which grows with the distance, so only limit rows are read.
+        # Needs sin and cos in SQL: MySQL, or SQLite built with its math functions
+        half = pi / 360  # degrees to half-angle radians
+        sin_lat = func.sin((self.model.latitude - lat) * half)
+        sin_lon = func.sin((self.model.longitude - lon) * half)
+        a = sin_lat * sin_lat + cos(radians(lat)) * func.cos(self.model.latitude * (pi / 180)) * sin_lon * sin_lon
+        max_a = sin(min(radius_km / EARTH_RADIUS_KM, pi) / 2) ** 2
+        candidates = self._bbox_query(*radius_bbox(lat, lon, radius_km), options=options).filter(
+            a <= max_a).order_by(a, self.model.id).limit(limit).all()
+        found = [(obj, haversine_km(lat, lon, obj.latitude, obj.longitude)) for obj in candidates]
+        return [(obj, distance) for obj, distance in found if distance <= radius_km]
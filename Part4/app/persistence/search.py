@@ -0,0 +1,211 @@
+import heapq
+import re
+from collections import Counter
+from math import log
+from sqlalchemy import DDL, case, event, func, select, text, union_all
+from app.models.place import Place
+from app.models.review import Review
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(value):
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(value.lower()) if value else []
+
+
+def fts_match_expression(query):
+    """
+    Turn free text into an FTS5 MATCH expression: any of the words, each quoted.
+
+    Returns None when the query has no word to search for.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return ' OR '.join('"{}"'.format(token) for token in dict.fromkeys(tokens))
+
+
+class InvertedIndex:
+    """
+    Term -> document postings scored with Okapi BM25.
+
+    A document is built from several parts (a place's title and description,
+    each of its reviews). Parts can be replaced or removed on their own; the
+    document's term frequencies and length follow.
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {doc_id -> term frequency}
+        self._postings = {}
+        self._doc_len = {}
+        self._total_len = 0
+        # part_id -> (doc_id, Counter of its terms)
+        self._parts = {}
+
+    def __len__(self):
+        return len(self._doc_len)
+
+    def set_part(self, part_id, doc_id, value):
+        """Index value as part_id of doc_id, replacing what part_id held before."""
+        self.remove_part(part_id)
+        terms = Counter(tokenize(value))
+        if not terms:
+            return
+        self._parts[part_id] = (doc_id, terms)
+        for term, count in terms.items():
+            postings = self._postings.setdefault(term, {})
+            postings[doc_id] = postings.get(doc_id, 0) + count
+        length = sum(terms.values())
+        self._doc_len[doc_id] = self._doc_len.get(doc_id, 0) + length
+        self._total_len += length
+
+    def remove_part(self, part_id):
+        entry = self._parts.pop(part_id, None)
+        if entry is None:
+            return
+        doc_id, terms = entry
+        for term, count in terms.items():
+            postings = self._postings[term]
+            postings[doc_id] -= count
+            if not postings[doc_id]:
+                del postings[doc_id]
+                if not postings:
+                    del self._postings[term]
+        length = sum(terms.values())
+        self._total_len -= length
+        self._doc_len[doc_id] -= length
+        if not self._doc_len[doc_id]:
+            del self._doc_len[doc_id]
+
+    def search(self, query, limit=20):
+        """
+        Return up to limit (doc_id, score) pairs, best first.
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._doc_len:
+            return []
+        doc_count = len(self._doc_len)
+        avg_len = self._total_len / doc_count
+        k1, b = self.k1, self.b
+        doc_len = self._doc_len
+        scores = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                norm = k1 * (1 - b + b * doc_len[doc_id] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+# SQLite FTS5 tables mirroring places and reviews (external content: the text
+# is read back from the base tables), kept in sync by triggers on those tables.
+# Rating and location updates do not touch the indexed columns and skip them.
+# The implicit rowid of a table with a string primary key may change on VACUUM,
+# so the FTS rows are keyed on a search_rowid column numbered by the insert trigger.
+_PLACES_FTS = [
+    "ALTER TABLE places ADD COLUMN search_rowid INTEGER",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_places_search_rowid ON places (search_rowid)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5("
+    "_title, _description, content='places', content_rowid='search_rowid')",
+    "CREATE TRIGGER IF NOT EXISTS places_fts_insert AFTER INSERT ON places BEGIN "
+    "UPDATE places SET search_rowid = (SELECT COALESCE(MAX(search_rowid), 0) + 1 FROM places) "
+    "WHERE id = new.id; "
+    "INSERT INTO places_fts(rowid, _title, _description) "
+    "SELECT search_rowid, _title, _description FROM places WHERE id = new.id; END",
+    "CREATE TRIGGER IF NOT EXISTS places_fts_delete AFTER DELETE ON places BEGIN "
+    "INSERT INTO places_fts(places_fts, rowid, _title, _description) "
+    "VALUES ('delete', old.search_rowid, old._title, old._description); END",
+    "CREATE TRIGGER IF NOT EXISTS places_fts_update AFTER UPDATE OF _title, _description ON places BEGIN "
+    "INSERT INTO places_fts(places_fts, rowid, _title, _description) "
+    "VALUES ('delete', old.search_rowid, old._title, old._description); "
+    "INSERT INTO places_fts(rowid, _title, _description) "
+    "VALUES (new.search_rowid, new._title, new._description); END",
+]
+
+_REVIEWS_FTS = [
+    "ALTER TABLE reviews ADD COLUMN search_rowid INTEGER",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_reviews_search_rowid ON reviews (search_rowid)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5("
+    "text, content='reviews', content_rowid='search_rowid')",
+    "CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN "
+    "UPDATE reviews SET search_rowid = (SELECT COALESCE(MAX(search_rowid), 0) + 1 FROM reviews) "
+    "WHERE id = new.id; "
+    "INSERT INTO reviews_fts(rowid, text) SELECT search_rowid, text FROM reviews WHERE id = new.id; END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN "
+    "INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.search_rowid, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF text ON reviews BEGIN "
+    "INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.search_rowid, old.text); "
+    "INSERT INTO reviews_fts(rowid, text) VALUES (new.search_rowid, new.text); END",
+]
+
+for _table, _statements, _fts in ((Place.__table__, _PLACES_FTS, 'places_fts'),
+                                  (Review.__table__, _REVIEWS_FTS, 'reviews_fts')):
+    for _statement in _statements:
+        event.listen(_table, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+    event.listen(_table, 'before_drop', DDL(f"DROP TABLE IF EXISTS {_fts}").execute_if(dialect='sqlite'))
+
+# Places matching on their own text or through their reviews; bm25() is lower
+# for better matches, titles weigh twice the description and reviews half.
+_FTS_SEARCH = text("""
+    SELECT place_id, SUM(score) AS score FROM (
+        SELECT places.id AS place_id, bm25(places_fts, 2.0, 1.0) AS score
+        FROM places_fts JOIN places ON places.search_rowid = places_fts.rowid
+        WHERE places_fts MATCH :query
+        UNION ALL
+        SELECT reviews.place_id AS place_id, 0.5 * bm25(reviews_fts) AS score
+        FROM reviews_fts JOIN reviews ON reviews.search_rowid = reviews_fts.rowid
+        WHERE reviews_fts MATCH :query
+    ) GROUP BY place_id ORDER BY score LIMIT :limit
+""")
+
+
+def fts_search(session, query, limit=20):
+    """
+    Rank places with the SQLite FTS5 tables.
+
+    Returns:
+        list: (place_id, score) pairs, best first, with higher scores for better matches
+    """
+    expression = fts_match_expression(query)
+    if expression is None:
+        return []
+    rows = session.execute(_FTS_SEARCH, {'query': expression, 'limit': limit})
+    return [(place_id, -score) for place_id, score in rows]
+
+
+def like_search(session, query, limit=20):
+    """
+    Rank places with LIKE matches, for databases without the FTS5 tables.
+
+    Every query word found scores 2 in a title, 1 in a description and 0.5
+    in each review, the weights of the FTS search; each search scans the
+    places and reviews.
+
+    Returns:
+        list: (place_id, score) pairs, best first
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return []
+
+    def score(weighted):
+        return sum(case((func.lower(column).contains(token, autoescape=True), weight), else_=0.0)
+                   for column, weight in weighted for token in tokens)
+
+    place_score = score([(Place._title, 2.0), (Place._description, 1.0)])
+    review_score = score([(Review.text, 0.5)])
+    matches = union_all(
+        select(Place.id.label('place_id'), place_score.label('score')).where(place_score > 0),
+        select(Review.place_id.label('place_id'), review_score.label('score')).where(review_score > 0),
+    ).subquery()
+    total = func.sum(matches.c.score)
+    rows = session.execute(select(matches.c.place_id, total).group_by(matches.c.place_id).order_by(
+        total.desc(), matches.c.place_id).limit(limit))
+    return [(place_id, float(total_score)) for place_id, total_score in rows]
@@ -0,0 +1,310 @@
+import heapq
+from math import asin, cos, floor, log2, radians, sin, sqrt, degrees
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Return the great-circle distance in kilometres between two points given in degrees."""
+    lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def lon_ranges(min_lon, max_lon):
+    """
+    Split a longitude interval into plain ranges.
+
+    A box crossing the antimeridian is given with min_lon > max_lon and
+    comes back as two ranges, one on each side of 180 degrees.
+    """
+    if min_lon <= max_lon:
+        return [(min_lon, max_lon)]
+    return [(min_lon, 180.0), (-180.0, max_lon)]
+
+
+def radius_bbox(lat, lon, radius_km):
+    """
+    Return (min_lat, min_lon, max_lat, max_lon) enclosing every point within radius_km.
+
+    The box is a prefilter only: callers still check the exact distance.
+    Longitudes wrap across the antimeridian (min_lon > max_lon) and cover
+    the whole globe when the circle reaches a pole.
+    """
+    delta_lat = degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = lat - delta_lat, lat + delta_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+    delta_lon = degrees(asin(min(1.0, sin(radius_km / EARTH_RADIUS_KM) / cos(radians(lat)))))
+    if delta_lon >= 180:
+        return min_lat, -180.0, max_lat, 180.0
+    min_lon, max_lon = lon - delta_lon, lon + delta_lon
+    if min_lon < -180:
+        min_lon += 360
+    if max_lon > 180:
+        max_lon -= 360
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def parse_bbox(value):
+    """
+    Parse "min_lat,min_lon,max_lat,max_lon" into floats.
+
+    Raises:
+        ValueError: If the value is malformed or out of range
+    """
+    try:
+        min_lat, min_lon, max_lat, max_lon = (float(part) for part in value.split(','))
+    except (AttributeError, ValueError):
+        raise ValueError("bbox must be min_lat,min_lon,max_lat,max_lon")
+    if not -90 <= min_lat <= max_lat <= 90 or not -180 <= min_lon <= 180 or not -180 <= max_lon <= 180:
+        raise ValueError("bbox coordinates are out of range")
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def parse_point(value):
+    """
+    Parse "lat,lon" into floats.
+
+    Raises:
+        ValueError: If the value is malformed or out of range
+    """
+    try:
+        lat, lon = (float(part) for part in value.split(','))
+    except (AttributeError, ValueError):
+        raise ValueError("near must be lat,lon")
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        raise ValueError("Coordinates of latitude and longitude aren't correct")
+    return lat, lon
+
+
+class GridIndex:
+    """
+    Bucket points into fixed-size latitude/longitude cells.
+
+    A box query only visits the cells it overlaps, so its cost depends on
+    the size of the box and the number of points inside it, not on the
+    total number of points stored.
+    """
+
+    def __init__(self, cell_deg=0.1):
+        self.cell_deg = cell_deg
+        # (row, col) -> {obj_id -> (lat, lon)}
+        self._cells = {}
+
+    def _cell(self, lat, lon):
+        return floor(lat / self.cell_deg), floor(lon / self.cell_deg)
+
+    def __len__(self):
+        return sum(len(cell) for cell in self._cells.values())
+
+    def add(self, obj_id, lat, lon):
+        self._cells.setdefault(self._cell(lat, lon), {})[obj_id] = (lat, lon)
+
+    def remove(self, obj_id, lat, lon):
+        key = self._cell(lat, lon)
+        cell = self._cells.get(key)
+        if cell is not None:
+            cell.pop(obj_id, None)
+            if not cell:
+                del self._cells[key]
+
+    def query_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """Yield (obj_id, lat, lon) for every point inside the box (wraps if min_lon > max_lon)."""
+        for lo_lon, hi_lon in lon_ranges(min_lon, max_lon):
+            first_row, first_col = self._cell(min_lat, lo_lon)
+            last_row, last_col = self._cell(max_lat, hi_lon)
+            span = (last_row - first_row + 1) * (last_col - first_col + 1)
+            if span > len(self._cells):
+                # Large boxes: walking the occupied cells is cheaper than the empty ones
+                keys = [key for key in self._cells
+                        if first_row <= key[0] <= last_row and first_col <= key[1] <= last_col]
+            else:
+                keys = [(row, col) for row in range(first_row, last_row + 1)
+                        for col in range(first_col, last_col + 1)]
+            for key in keys:
+                for obj_id, (lat, lon) in self._cells.get(key, {}).items():
+                    if min_lat <= lat <= max_lat and lo_lon <= lon <= hi_lon:
+                        yield obj_id, lat, lon
+
+    def query_radius(self, lat, lon, radius_km):
+        """Yield (obj_id, distance_km) for every point within radius_km of (lat, lon)."""
+        for obj_id, point_lat, point_lon in self.query_bbox(*radius_bbox(lat, lon, radius_km)):
+            distance = haversine_km(lat, lon, point_lat, point_lon)
+            if distance <= radius_km:
+                yield obj_id, distance
+
+
+def to_unit_vector(lat, lon):
+    """Map a latitude/longitude in degrees to a point on the unit sphere."""
+    lat, lon = radians(lat), radians(lon)
+    return cos(lat) * cos(lon), cos(lat) * sin(lon), sin(lat)
+
+
+def chord_to_km(chord):
+    """Convert a straight-line distance between unit vectors to a great-circle distance."""
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, chord / 2))
+
+
+class _KDNode:
+    __slots__ = ('obj_id', 'point', 'axis', 'left', 'right', 'alive', 'size')
+
+    def __init__(self, obj_id, point, axis):
+        self.obj_id = obj_id
+        self.point = point
+        self.axis = axis
+        self.left = None
+        self.right = None
+        self.alive = True
+        # Nodes in this subtree, dead ones included
+        self.size = 1
+
+
+class KDTree:
+    """
+    k-nearest-neighbour index over coordinates, maintained incrementally.
+
+    Points are stored as 3D unit vectors, so the straight-line distance
+    orders neighbours exactly like the great-circle distance, without
+    special cases at the poles or across the antimeridian.
+
+    Inserts descend the tree and, like a scapegoat tree, rebuild the
+    smallest unbalanced subtree when they land too deep. Removals only
+    mark the node dead; the whole tree is rebuilt once dead nodes
+    outnumber live ones. nearest() therefore stays close to O(log n + k).
+    """
+
+    # A child holding more than this share of its parent's subtree is unbalanced
+    BALANCE = 0.7
+
+    def __init__(self, points=()):
+        """
+        Args:
+            points (iterable): (obj_id, lat, lon) tuples to bulk-load
+        """
+        self._nodes = {}
+        self._dead = 0
+        self._root = None
+        self._rebuild((obj_id, to_unit_vector(lat, lon)) for obj_id, lat, lon in points)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, obj_id):
+        return obj_id in self._nodes
+
+    def _rebuild(self, entries):
+        self._nodes = {}
+        self._dead = 0
+        self._root = self._build(list(entries), 0)
+
+    def _build(self, entries, depth):
+        if not entries:
+            return None
+        axis = depth % 3
+        entries.sort(key=lambda entry: entry[1][axis])
+        # Ties may land on either side: searches only rely on left <= split <= right
+        middle = len(entries) // 2
+        obj_id, point = entries[middle]
+        node = _KDNode(obj_id, point, axis)
+        self._nodes[obj_id] = node
+        node.left = self._build(entries[:middle], depth + 1)
+        node.right = self._build(entries[middle + 1:], depth + 1)
+        node.size = len(entries)
+        return node
+
+    @staticmethod
+    def _subtree(node):
+        stack, found = [node], []
+        while stack:
+            node = stack.pop()
+            if node is not None:
+                found.append(node)
+                stack.append(node.left)
+                stack.append(node.right)
+        return found
+
+    def _rebuild_subtree(self, path, depth):
+        """Rebuild path[depth] balanced, dropping its dead nodes."""
+        nodes = self._subtree(path[depth])
+        live = [(node.obj_id, node.point) for node in nodes if node.alive]
+        dropped = len(nodes) - len(live)
+        self._dead -= dropped
+        for ancestor in path[:depth]:
+            ancestor.size -= dropped
+        subtree = self._build(live, depth)
+        if depth == 0:
+            self._root = subtree
+        elif path[depth - 1].left is path[depth]:
+            path[depth - 1].left = subtree
+        else:
+            path[depth - 1].right = subtree
+
+    def insert(self, obj_id, lat, lon):
+        """Add a point, replacing any previous point with the same obj_id."""
+        self.remove(obj_id)
+        point = to_unit_vector(lat, lon)
+        path = []
+        node = self._root
+        while node is not None:
+            path.append(node)
+            node.size += 1
+            node = node.left if point[node.axis] < node.point[node.axis] else node.right
+        leaf = _KDNode(obj_id, point, len(path) % 3)
+        self._nodes[obj_id] = leaf
+        if not path:
+            self._root = leaf
+            return
+        parent = path[-1]
+        if point[parent.axis] < parent.point[parent.axis]:
+            parent.left = leaf
+        else:
+            parent.right = leaf
+        path.append(leaf)
+
+        total = self._root.size
+        if len(path) - 1 > log2(total) / log2(1 / self.BALANCE) + 1:
+            for depth in range(len(path) - 2, -1, -1):
+                if path[depth + 1].size > self.BALANCE * path[depth].size:
+                    self._rebuild_subtree(path, depth)
+                    break
+
+    def remove(self, obj_id):
+        node = self._nodes.pop(obj_id, None)
+        if node is not None:
+            node.alive = False
+            self._dead += 1
+            if self._dead > len(self._nodes):
+                self._rebuild((live.obj_id, live.point) for live in self._nodes.values())
+
+    def nearest(self, lat, lon, k):
+        """
+        Return up to k (obj_id, distance_km) pairs, closest first.
+        """
+        if k <= 0 or self._root is None:
+            return []
+        target = to_unit_vector(lat, lon)
+        tx, ty, tz = target
+        # Max-heap of the k best candidates as (-squared distance, obj_id)
+        best = []
+        # (squared distance to the splitting plane, subtree) still to visit
+        stack = [(0.0, self._root)]
+        while stack:
+            gap, node = stack.pop()
+            if node is None or (len(best) == k and gap >= -best[0][0]):
+                continue
+            if node.alive:
+                x, y, z = node.point
+                dist2 = (x - tx) ** 2 + (y - ty) ** 2 + (z - tz) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-dist2, node.obj_id))
+                elif dist2 < -best[0][0]:
+                    heapq.heapreplace(best, (-dist2, node.obj_id))
+            diff = target[node.axis] - node.point[node.axis]
+            if diff < 0:
+                stack.append((diff * diff, node.right))
+                stack.append((0.0, node.left))
+            else:
+                stack.append((diff * diff, node.left))
+                stack.append((0.0, node.right))
+        return [(obj_id, chord_to_km(sqrt(-neg))) for neg, obj_id in sorted(best, reverse=True)]
@@ -0,0 +1,124 @@
+from collections import Counter
+from itertools import chain
+from flask import current_app
+from sqlalchemy import event, select, update
+from app import db
+
+# Key of the per-application CollectionVersions in app.extensions
+COLLECTION_VERSIONS_KEY = 'hbnb_collection_versions'
+
+# Key in session.info counting the bumps of each table in the current transaction
+_PENDING_BUMPS = 'hbnb_pending_version_bumps'
+
+# One counter per table, in the database so that every worker reads the same versions
+collection_versions_table = db.Table('collection_versions',
+    db.Column('table_name', db.String(64), primary_key=True),
+    db.Column('version', db.Integer, nullable=False, default=0)
+)
+
+
+class CollectionVersions:
+    """
+    One counter per table, bumped by the transaction writing to the table.
+
+    The counters live in the collection_versions table and are incremented
+    in the same transaction as the write, so they change exactly when the
+    write commits, and validators built from them hold across workers and
+    restarts. A table without a counter row reads as version 0.
+    """
+
+    def get(self, table):
+        return self.versions([table])[table]
+
+    def versions(self, tables):
+        """Return {table: version} of the given tables, as seen by the current session."""
+        if not tables:
+            return {}
+        rows = db.session.execute(select(collection_versions_table).where(
+            collection_versions_table.c.table_name.in_(tables)))
+        found = dict(rows.all())
+        return {table: found.get(table, 0) for table in tables}
+
+    def bump(self, tables, session=None):
+        """Increment the counters of tables in the current transaction of session."""
+        session = session or db.session
+        session.execute(update(collection_versions_table).where(
+            collection_versions_table.c.table_name.in_(sorted(tables))).values(
+            version=collection_versions_table.c.version + 1))
+        session.info.setdefault(_PENDING_BUMPS, Counter()).update(set(tables))
+
+    def token(self, tables):
+        """Return a string that changes whenever one of the tables is written."""
+        versions = self.versions(tables)
+        return ','.join(f"{table}.{versions[table]}" for table in tables)
+
+
+class VersionedState:
+    """
+    A per-process structure built from some tables, with the versions it reflects.
+
+    get() reads the versions of the tables and rebuilds the structure when
+    they moved since it was built, i.e. when a transaction of any worker
+    wrote to them. The process that commits a write applies it to the
+    structure itself and calls committed(), so its own writes do not force
+    a rebuild; if another worker wrote in between, the versions still
+    differ and the next get() rebuilds.
+    """
+
+    def __init__(self, tables, build):
+        self.tables = tuple(tables)
+        self._build = build
+        self.value = None
+        self._versions = None
+
+    def get(self):
+        versions = collection_versions().versions(self.tables)
+        if self.value is None or versions != self._versions:
+            # Read in the same transaction as the rows the build reads
+            self._versions = versions
+            self.value = self._build()
+        return self.value
+
+    def committed(self, bumps):
+        """Account for the version bumps of a commit already applied to the structure."""
+        if self._versions is not None:
+            for table in self.tables:
+                self._versions[table] += bumps.get(table, 0)
+
+
+def committed_bumps(session):
+    """Return {table: bumps} of the transaction session just committed, for after_commit listeners."""
+    return session.info.get(_PENDING_BUMPS, {})
+
+
+def collection_versions():
+    versions = current_app.extensions.get(COLLECTION_VERSIONS_KEY)
+    if versions is None:
+        versions = current_app.extensions[COLLECTION_VERSIONS_KEY] = CollectionVersions()
+    return versions
+
+
+def record_write(*tables):
+    """Bump the versions of tables in the current transaction; for writes that bypass the ORM unit of work."""
+    collection_versions().bump(tables)
+
+
+@event.listens_for(collection_versions_table, 'after_create')
+def _seed_versions(table, connection, **kw):
+    # A counter row for every table of the application, created alongside it
+    connection.execute(table.insert(), [{'table_name': name, 'version': 0}
+                                        for name in table.metadata.tables if name != table.name])
+
+
+@event.listens_for(db.session, 'after_flush')
+def _record_flushed(session, flush_context):
+    # Dirty objects include those whose collections changed, e.g. place.amenities
+    tables = {obj.__table__.name for obj in chain(session.new, session.dirty, session.deleted)}
+    if tables:
+        CollectionVersions().bump(tables, session)
+
+
+@event.listens_for(db.session, 'after_begin')
+@event.listens_for(db.session, 'after_rollback')
+def _reset_bumps(session, *args):
+    session.info.pop(_PENDING_BUMPS, None)
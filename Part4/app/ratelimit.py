@@ -0,0 +1,124 @@
+import math
+import time
+from flask import current_app
+from app.persistence.cache import LocalCache
+
+# Key of the per-application LoginThrottle in app.extensions
+LOGIN_THROTTLE_KEY = 'hbnb_login_throttle'
+
+
+class SlidingWindowLimiter:
+    """
+    Allow `limit` hits per `window` seconds and identity, in constant time and memory.
+
+    Hits are counted in fixed windows; the rate is estimated as the current
+    window's count plus the previous one's, weighted by how much of it still
+    overlaps the sliding window. That is one increment and one read per hit
+    and two counters per identity, whatever the limit. Counters live in a
+    backend with the Redis get/incr/expire API (LocalCache or redis.Redis),
+    so workers sharing a Redis also share their limits. Keys are
+    "<prefix><identity>:<window number>".
+    """
+
+    def __init__(self, backend, limit, window=60, prefix='hbnb:limit:', clock=time.time):
+        self.backend = backend
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+        self._clock = clock
+
+    def _key(self, identity, number):
+        return f"{self.prefix}{identity}:{number}"
+
+    def _wait(self, current, previous, elapsed):
+        """Return 0 if one more hit fits next to the counts, else the seconds until it does."""
+        remaining = self.window - elapsed
+        if current + previous * remaining / self.window < self.limit:
+            return 0
+        if current >= self.limit:
+            wait = remaining
+        else:
+            # Time for the previous window's weight to drop under the room left
+            wait = remaining - (self.limit - current) * self.window / previous
+        return max(1, math.ceil(wait))
+
+    def retry_after(self, identity, now=None):
+        """Return 0 if identity may hit now, else the seconds to wait before it may."""
+        now = self._clock() if now is None else now
+        number, elapsed = divmod(now, self.window)
+        number = int(number)
+        current = int(self.backend.get(self._key(identity, number)) or 0)
+        previous = int(self.backend.get(self._key(identity, number - 1)) or 0)
+        return self._wait(current, previous, elapsed)
+
+    def hit(self, identity, now=None):
+        """
+        Count one hit and return 0 if it fits in the limit, else the Retry-After seconds.
+
+        The counter is incremented before it is compared to the limit, so
+        concurrent hits each see their own count and no more than the limit
+        of them get through, within one process or across a shared Redis.
+        """
+        now = self._clock() if now is None else now
+        number, elapsed = divmod(now, self.window)
+        number = int(number)
+        key = self._key(identity, number)
+        current = self.backend.incr(key)
+        if current == 1:
+            # Kept through the next window, where it is the previous count
+            self.backend.expire(key, math.ceil(self.window * 2))
+        previous = int(self.backend.get(self._key(identity, number - 1)) or 0)
+        return self._wait(current - 1, previous, elapsed)
+
+    def release(self, identity, now):
+        """Take back a hit counted at now, e.g. one that another limiter refused."""
+        self.backend.incr(self._key(identity, int(now // self.window)), -1)
+
+
+class LoginThrottle:
+    """
+    Limit login attempts per (email, client address) pair, per address and per email.
+
+    The tight limit is on the pair, so that guessing at someone's password
+    from one address does not lock them out of every other address; the
+    per-email limit is a much looser ceiling against guesses spread over
+    many addresses. check() runs before any database or bcrypt work and
+    counts the attempt on every limiter first; an attempt that any of them
+    refuses is then taken back from all three, so refused attempts do not
+    count against the limits.
+    """
+
+    def __init__(self, per_pair, per_address, per_email):
+        self.per_pair = per_pair
+        self.per_address = per_address
+        self.per_email = per_email
+
+    def check(self, email, address):
+        """Count one attempt and return 0, or return the Retry-After seconds without counting it."""
+        now = self.per_pair._clock()
+        email = (email or '').strip().lower()
+        address = address or 'unknown'
+        keys = ((self.per_pair, f"pair:{email}|{address}"), (self.per_address, f"ip:{address}"),
+                (self.per_email, f"email:{email}"))
+        retry = max([limiter.hit(key, now) for limiter, key in keys])
+        if retry:
+            for limiter, key in keys:
+                limiter.release(key, now)
+        return retry
+
+
+def login_throttle():
+    """Return the application's LoginThrottle, built from its configuration on first use."""
+    throttle = current_app.extensions.get(LOGIN_THROTTLE_KEY)
+    if throttle is None:
+        config = current_app.config
+        backend = config.get('LOGIN_LIMIT_BACKEND')
+        if backend is None:
+            backend = LocalCache(config.get('LOGIN_LIMIT_SIZE', 10_000))
+        window = config.get('LOGIN_LIMIT_WINDOW', 60)
+        throttle = LoginThrottle(
+            SlidingWindowLimiter(backend, config.get('LOGIN_LIMIT_PER_PAIR', 5), window),
+            SlidingWindowLimiter(backend, config.get('LOGIN_LIMIT_PER_ADDRESS', 20), window),
+            SlidingWindowLimiter(backend, config.get('LOGIN_LIMIT_PER_EMAIL', 100), window))
+        current_app.extensions[LOGIN_THROTTLE_KEY] = throttle
+    return throttle
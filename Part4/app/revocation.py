@@ -0,0 +1,78 @@
+import heapq
+import math
+import time
+from flask import current_app
+from app import jwt
+
+# Key of the per-application Denylist in app.extensions
+DENYLIST_KEY = 'hbnb_token_denylist'
+
+
+class Denylist:
+    """
+    Identifiers (jti) of revoked tokens, each kept until the token expires.
+
+    Lookups are one dict membership test, whatever the number of entries.
+    Expired entries are dropped when tokens are revoked, oldest first from a
+    heap, so the dict only holds tokens that could still be accepted. With
+    a backend (any client with Redis' get/set, e.g. redis.Redis),
+    revocations are also written there with the same TTL and tokens unknown
+    to this process are looked up in it, so every worker sees every logout.
+    """
+
+    def __init__(self, backend=None, prefix='hbnb:revoked:', clock=time.time):
+        self.backend = backend
+        self.prefix = prefix
+        self._clock = clock
+        self._expiries = {}
+        self._heap = []
+
+    def __len__(self):
+        return len(self._expiries)
+
+    def revoke(self, jti, expires=None):
+        """Deny the token until expires (a timestamp; None for a token that never expires)."""
+        now = self._clock()
+        expires = math.inf if expires is None else expires
+        if expires <= now:
+            return
+        self._purge(now)
+        self._expiries[jti] = expires
+        heapq.heappush(self._heap, (expires, jti))
+        if self.backend is not None:
+            self.backend.set(self.prefix + jti, b'1', ex=None if expires == math.inf else math.ceil(expires - now))
+
+    def _purge(self, now):
+        while self._heap and self._heap[0][0] <= now:
+            _, jti = heapq.heappop(self._heap)
+            if self._expiries.get(jti, math.inf) <= now:
+                del self._expiries[jti]
+
+    def is_revoked(self, jti):
+        """
+        Return True if the token was revoked and has not expired yet.
+
+        Without a backend this is one dict lookup. With one, a token not
+        revoked in this process, i.e. nearly every request, costs a backend
+        GET: a process-local prefilter such as a Bloom filter would only know
+        this worker's logouts and let other workers' revoked tokens through,
+        so the round trip is the price of seeing every logout at once.
+        benchmarks/bench_denylist.py measures both paths.
+        """
+        if jti in self._expiries:
+            return True
+        return self.backend is not None and self.backend.get(self.prefix + jti) is not None
+
+
+def token_denylist():
+    """Return the application's Denylist, built from its configuration on first use."""
+    denylist = current_app.extensions.get(DENYLIST_KEY)
+    if denylist is None:
+        denylist = current_app.extensions[DENYLIST_KEY] = Denylist(current_app.config.get('JWT_DENYLIST_BACKEND'))
+    return denylist
+
+
+@jwt.token_in_blocklist_loader
+def _token_revoked(jwt_header, jwt_payload):
+    jti = jwt_payload.get('jti')
+    return jti is not None and token_denylist().is_revoked(jti)
@@ -1,16 +1,220 @@
-from app.persistence.repository import SQLAlchemyRepository
+from bisect import bisect_right
+from collections import Counter
+from math import floor
+from flask import current_app, has_app_context
+from sqlalchemy import and_, event, func, or_, tuple_
+from sqlalchemy.orm import joinedload, selectinload
+from app import db
+from app.passwords import password_hasher
+from app.persistence.repository import SQLAlchemyRepository, unit_of_work
+from app.persistence.cache import CachedRepository
+from app.persistence.bitmap import BitmapIndex
+from app.persistence.search import InvertedIndex, fts_search, like_search
+from app.persistence.spatial import KDTree, haversine_km, lon_ranges, radius_bbox
+from app.persistence.versions import VersionedState, committed_bumps
 from app.models.user import User
 from app.models.amenity import Amenity
-from app.models.place import Place
+from app.models.place import Place, place_amenity
 from app.models.review import Review
 
+# Loader options per place endpoint. 'summary' serializes columns only;
+# 'detail' nests owner, amenities and reviews with one extra statement per
+# collection, whatever the number of places in the page.
+_PLACE_PROFILES = {}
+
+
+def place_profile(name):
+    """Return the loader options of a place profile, built once the backrefs exist."""
+    if not _PLACE_PROFILES:
+        _PLACE_PROFILES.update({
+            'summary': (),
+            'detail': (
+                joinedload(Place.owner),
+                selectinload(Place.amenities),
+                selectinload(Place.reviews),
+            ),
+        })
+    return _PLACE_PROFILES[name]
+
+
+# Key of the per-application KDTree of place coordinates in app.extensions, held in a
+# VersionedState of the places table like the amenity bitmaps
+PLACE_TREE_KEY = 'hbnb_place_tree'
+
+# Key of the per-application BitmapIndex of amenity id -> places in app.extensions, held
+# in a VersionedState: each worker keeps its own and rebuilds it once another one writes
+AMENITY_BITMAPS_KEY = 'hbnb_amenity_bitmaps'
+
+# Tables the amenity bitmaps are built from; ORM link changes bump places
+_AMENITY_BITMAP_TABLES = ('places', 'place_amenity')
+
+# Key of the per-application InvertedIndex of place and review text in app.extensions,
+# used with SEARCH_BACKEND='memory' only, held in a VersionedState like the amenity bitmaps
+SEARCH_INDEX_KEY = 'hbnb_search_index'
+
+# Keys in session.info collecting index changes until the transaction ends:
+# (place_id, amenity_id or None for every amenity of a deleted place, linked),
+# (part_id, place_id, text or None to remove)
+# and (place_id, latitude, longitude), None coordinates removing the point
+_PENDING_LINKS = 'hbnb_pending_amenity_links'
+_PENDING_TEXT = 'hbnb_pending_search_text'
+_PENDING_POINTS = 'hbnb_pending_place_points'
+
+
+def _record_link(place_id, amenity_id, linked):
+    db.session.info.setdefault(_PENDING_LINKS, []).append((place_id, amenity_id, linked))
+
+
+def _record_text(part_id, place_id, value):
+    db.session.info.setdefault(_PENDING_TEXT, []).append((part_id, place_id, value))
+
+
+def _record_point(place_id, latitude, longitude):
+    db.session.info.setdefault(_PENDING_POINTS, []).append((place_id, latitude, longitude))
+
+
+def _place_text(title, description):
+    return f"{title} {description or ''}"
+
+
+@event.listens_for(Place.amenities, 'append')
+def _amenity_linked(place, amenity, initiator):
+    _record_link(place.id, amenity.id, True)
+
+
+@event.listens_for(Place.amenities, 'remove')
+def _amenity_unlinked(place, amenity, initiator):
+    _record_link(place.id, amenity.id, False)
+
+
+@event.listens_for(Place, 'after_insert')
+@event.listens_for(Place, 'after_update')
+def _place_text_changed(mapper, connection, place):
+    _record_text(('place', place.id), place.id, _place_text(place.title, place.description))
+
+
+@event.listens_for(Place, 'after_insert')
+@event.listens_for(Place, 'after_update')
+def _place_point_changed(mapper, connection, place):
+    _record_point(place.id, place.latitude, place.longitude)
+
+
+@event.listens_for(Place, 'after_delete')
+def _place_point_deleted(mapper, connection, place):
+    _record_point(place.id, None, None)
+
+
+@event.listens_for(Place, 'after_delete')
+def _place_links_deleted(mapper, connection, place):
+    _record_link(place.id, None, False)
+
+
+@event.listens_for(Review, 'after_insert')
+@event.listens_for(Review, 'after_update')
+def _review_text_changed(mapper, connection, review):
+    _record_text(('review', review.id), review.place_id, review.text)
+
+
+@event.listens_for(Review, 'after_delete')
+def _review_text_deleted(mapper, connection, review):
+    _record_text(('review', review.id), None, None)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _apply_pending_changes(session):
+    # Only committed changes reach the indexes; an index not loaded yet reads them later
+    links = session.info.pop(_PENDING_LINKS, None)
+    texts = session.info.pop(_PENDING_TEXT, None)
+    points = session.info.pop(_PENDING_POINTS, None)
+    if not has_app_context():
+        return
+    bumps = committed_bumps(session)
+    state = current_app.extensions.get(AMENITY_BITMAPS_KEY)
+    if state is not None and state.value is not None:
+        for place_id, amenity_id, linked in links or ():
+            if linked:
+                state.value.add(amenity_id, place_id)
+            elif amenity_id is None:
+                state.value.remove(place_id)
+            else:
+                state.value.discard(amenity_id, place_id)
+        state.committed(bumps)
+    state = current_app.extensions.get(SEARCH_INDEX_KEY)
+    if state is not None and state.value is not None:
+        for part_id, place_id, value in texts or ():
+            if value is None:
+                state.value.remove_part(part_id)
+            else:
+                state.value.set_part(part_id, place_id, value)
+        state.committed(bumps)
+    state = current_app.extensions.get(PLACE_TREE_KEY)
+    if state is not None and state.value is not None:
+        for place_id, latitude, longitude in points or ():
+            if latitude is None or longitude is None:
+                state.value.remove(place_id)
+            else:
+                state.value.insert(place_id, latitude, longitude)
+        state.committed(bumps)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _drop_pending_changes(session):
+    session.info.pop(_PENDING_LINKS, None)
+    session.info.pop(_PENDING_TEXT, None)
+    session.info.pop(_PENDING_POINTS, None)
+
 
 class HBnBFacade:
     def __init__(self):
-        self.user_repo = SQLAlchemyRepository(User)
-        self.place_repo = SQLAlchemyRepository(Place)
+        # Users, places and amenities are read far more often than written
+        self.user_repo = CachedRepository(SQLAlchemyRepository(User), exclude=('password',))
+        self.place_repo = CachedRepository(SQLAlchemyRepository(Place))
         self.review_repo = SQLAlchemyRepository(Review)
-        self.amenity_repo = SQLAlchemyRepository(Amenity)
+        self.amenity_repo = CachedRepository(SQLAlchemyRepository(Amenity))
+
+    def transaction(self):
+        """
+        Run several facade calls as one unit of work.
+
+        Usage:
+            with facade.transaction():
+                facade.create_amenity(...)
+                facade.create_place(...)
+
+        Writes are committed once when the block exits and rolled back
+        if it raises.
+        """
+        return unit_of_work()
+
+    @staticmethod
+    def _validate_bulk(items, build):
+        """
+        Run build on every item and split the results into valid mappings and errors.
+
+        Returns:
+            tuple: (positions, mappings, errors) where positions[i] is the index
+            in items of mappings[i] and errors are {'index', 'error'} dicts
+        """
+        positions, mappings, errors = [], [], []
+        for index, item in enumerate(items):
+            try:
+                mappings.append(build(item))
+                positions.append(index)
+            except (ValueError, TypeError) as e:
+                errors.append({'index': index, 'error': str(e)})
+        return positions, mappings, errors
+
+    @staticmethod
+    def _reject_missing(positions, mappings, errors, key, existing, message):
+        """Move mappings whose `key` is not in `existing` to errors."""
+        kept_positions, kept = [], []
+        for index, mapping in zip(positions, mappings):
+            if mapping[key] in existing:
+                kept_positions.append(index)
+                kept.append(mapping)
+            else:
+                errors.append({'index': index, 'error': message})
+        return kept_positions, kept
 
     def create_user(self, user_data):
         user = User(**user_data)
@@ -23,9 +227,33 @@ class HBnBFacade:
     def get_user_by_email(self, email):
         return User.query.filter_by(email=email).first()
 
+    def authenticate(self, email, password):
+        """
+        Return the user with these credentials, or None.
+
+        A hash made with another cost factor than BCRYPT_LOG_ROUNDS is
+        replaced while the plain password is at hand.
+
+        Raises:
+            PasswordPoolBusy: If the password pool is saturated
+        """
+        user = self.get_user_by_email(email)
+        if user is None or not user.verify_password(password):
+            return None
+        if password_hasher().needs_rehash(user.password):
+            with unit_of_work():
+                user.hash_password(password)
+        return user
+
     def get_all_users(self):
         return self.user_repo.get_all()
 
+    def stream_users(self, after_id=None, batch_size=1000):
+        return self.user_repo.stream(after_id, batch_size=batch_size)
+
+    def get_users_page(self, after_id=None, limit=50):
+        return self.user_repo.list_page(after_id, limit)
+
     def updated_user(self, user_id, user_data):
         # Fetch the user by their ID
         user = self.user_repo.get(user_id)
@@ -40,6 +268,18 @@ class HBnBFacade:
         self.amenity_repo.add(amenity)
         return amenity
 
+    def create_amenities_bulk(self, items):
+        """
+        Validate and insert many amenities in one transaction.
+
+        Returns:
+            tuple: (created_ids, errors), errors being {'index', 'error'} dicts
+        """
+        _, mappings, errors = self._validate_bulk(items, Amenity.bulk_mapping)
+        if mappings:
+            self.amenity_repo.bulk_add(mappings)
+        return [mapping['id'] for mapping in mappings], errors
+
     def get_amenity(self, amenity_id):
         # Placeholder for logic to retrieve an amenity by ID
         return self.amenity_repo.get(amenity_id)
@@ -48,6 +288,12 @@ class HBnBFacade:
         # Placeholder for logic to retrieve all amenities
         return self.amenity_repo.get_all()
 
+    def stream_amenities(self, after_id=None, batch_size=1000):
+        return self.amenity_repo.stream(after_id, batch_size=batch_size)
+
+    def get_amenities_page(self, after_id=None, limit=50):
+        return self.amenity_repo.list_page(after_id, limit)
+
     def update_amenity(self, amenity_id, amenity_data):
         # Placeholder for logic to update an amenity
         amenity = self.amenity_repo.get(amenity_id)
@@ -57,45 +303,392 @@ class HBnBFacade:
         return None
 
 
+    def _place_tree(self):
+        """Return the nearest-neighbour index of the places, reloaded from the database when another worker wrote."""
+        state = current_app.extensions.get(PLACE_TREE_KEY)
+        if state is None:
+            state = current_app.extensions[PLACE_TREE_KEY] = VersionedState(('places',), self._load_place_tree)
+        return state.get()
+
+    @staticmethod
+    def _load_place_tree():
+        return KDTree(Place.query.with_entities(Place.id, Place.latitude, Place.longitude).filter(
+            Place.latitude.isnot(None), Place.longitude.isnot(None)))
+
+    def _amenity_bitmaps(self):
+        """Return the amenity bitmaps of the places, reloaded from place_amenity when another worker wrote."""
+        state = current_app.extensions.get(AMENITY_BITMAPS_KEY)
+        if state is None:
+            state = current_app.extensions[AMENITY_BITMAPS_KEY] = VersionedState(
+                _AMENITY_BITMAP_TABLES, self._load_amenity_bitmaps)
+        return state.get()
+
+    @staticmethod
+    def _load_amenity_bitmaps():
+        bitmaps = BitmapIndex()
+        for place_id, amenity_id in db.session.execute(place_amenity.select()):
+            bitmaps.add(amenity_id, place_id)
+        return bitmaps
+
+    def get_places_with_amenities(self, amenity_ids, after_id=None, limit=50, profile='summary'):
+        """
+        Return one page of the places linked to every amenity in amenity_ids, in id order.
+
+        Returns:
+            tuple: (places, next_id) where next_id is None on the last page
+        """
+        place_ids, next_id = self._amenity_bitmaps().page(amenity_ids, after_id, limit)
+        places = self.place_repo.get_many(place_ids, options=place_profile(profile))
+        return [places[place_id] for place_id in place_ids if place_id in places], next_id
+
+    def _search_backend(self):
+        """Return 'memory' only when configured; otherwise 'fts5' on SQLite and 'like' elsewhere."""
+        backend = current_app.config.get('SEARCH_BACKEND', 'fts5')
+        if backend == 'fts5' and db.engine.dialect.name != 'sqlite':
+            return 'like'
+        return backend
+
+    def _search_index(self):
+        """Return the in-memory text index of places and reviews, reloaded when another worker wrote."""
+        state = current_app.extensions.get(SEARCH_INDEX_KEY)
+        if state is None:
+            state = current_app.extensions[SEARCH_INDEX_KEY] = VersionedState(
+                ('places', 'reviews'), self._load_search_index)
+        return state.get()
+
+    @staticmethod
+    def _load_search_index():
+        search_index = InvertedIndex()
+        for place_id, title, description in Place.query.with_entities(Place.id, Place._title, Place._description):
+            search_index.set_part(('place', place_id), place_id, _place_text(title, description))
+        for review_id, place_id, value in Review.query.with_entities(Review.id, Review.place_id, Review.text):
+            search_index.set_part(('review', review_id), place_id, value)
+        return search_index
+
+    def search_places_text(self, query, limit=20, profile='summary'):
+        """
+        Rank places by their title, description and review text.
+
+        Uses the SQLite FTS5 tables, a LIKE scan on other databases, or the
+        in-memory BM25 index when SEARCH_BACKEND is 'memory'.
+
+        Returns:
+            list: (place, score) pairs, best first
+        """
+        backend = self._search_backend()
+        if backend == 'memory':
+            found = self._search_index().search(query, limit)
+        elif backend == 'like':
+            found = like_search(db.session, query, limit)
+        else:
+            found = fts_search(db.session, query, limit)
+        places = self.place_repo.get_many([place_id for place_id, _ in found], options=place_profile(profile))
+        return [(places[place_id], score) for place_id, score in found if place_id in places]
+
     def create_place(self, place_data):
     # Placeholder for logic to create a place, including validation for price, latitude, and longitude
+        place_data = dict(place_data)
+        amenity_ids = place_data.pop('amenities', None) or []
         place = Place(**place_data)
+        amenities = self.amenity_repo.get_many(amenity_ids)
+        if len(amenities) != len(set(amenity_ids)):
+            raise ValueError("Amenity not found")
+        place.amenities.extend(amenities.values())
         self.place_repo.add(place)
         return place
 
-    def get_place(self, place_id):
-        # Placeholder for logic to retrieve a place by ID, including associated owner and amenities
-        return self.place_repo.get(place_id)
+    def create_places_bulk(self, items, owner_id=None):
+        """
+        Validate and insert many places, and their amenity links, in one transaction.
+
+        Args:
+            items (list): Place payloads; 'amenities' may list amenity ids
+            owner_id (str, optional): Forces the owner of every place
+
+        Returns:
+            tuple: (created_ids, errors), errors being {'index', 'error'} dicts
+        """
+        def build(item):
+            if owner_id and isinstance(item, dict):
+                item = dict(item, owner_id=owner_id)
+            mapping = Place.bulk_mapping(item)
+            amenity_ids = item.get('amenities') or []
+            if not isinstance(amenity_ids, list) or not all(isinstance(a, str) for a in amenity_ids):
+                raise ValueError("Amenities must be a list of amenity IDs")
+            return mapping, amenity_ids
+
+        positions, built, errors = self._validate_bulk(items, build)
+        owners = self.user_repo.existing_ids(mapping['owner_id'] for mapping, _ in built)
+        amenities = self.amenity_repo.existing_ids(a for _, amenity_ids in built for a in amenity_ids)
+
+        mappings, links = [], []
+        for index, (mapping, amenity_ids) in zip(positions, built):
+            if mapping['owner_id'] not in owners:
+                errors.append({'index': index, 'error': "Owner not found"})
+            elif not amenities.issuperset(amenity_ids):
+                errors.append({'index': index, 'error': "Invalid amenities: {}".format(
+                    sorted(set(amenity_ids) - amenities))})
+            else:
+                mappings.append(mapping)
+                links.extend({'place_id': mapping['id'], 'amenity_id': amenity_id}
+                             for amenity_id in set(amenity_ids))
+        if mappings:
+            for link in links:
+                _record_link(link['place_id'], link['amenity_id'], True)
+            for mapping in mappings:
+                _record_text(('place', mapping['id']), mapping['id'],
+                             _place_text(mapping['_title'], mapping['_description']))
+                _record_point(mapping['id'], mapping['latitude'], mapping['longitude'])
+            self.place_repo.bulk_add(mappings, links={place_amenity: links})
+        errors.sort(key=lambda error: error['index'])
+        return [mapping['id'] for mapping in mappings], errors
+
+    def get_place(self, place_id, profile='summary'):
+        # Retrieve a place by ID; the 'detail' profile also loads owner, amenities and reviews
+        return self.place_repo.get(place_id, options=place_profile(profile))
 
     def get_all_places(self):
         # Placeholder for logic to retrieve all places
         return self.place_repo.get_all()
 
+    def _count_ratings(self, place_id, ratings, step=1):
+        """Add (step=1) or remove (step=-1) ratings from a place's aggregates, locking its row."""
+        place = self.place_repo.get(place_id, lock=True)
+        if place:
+            for rating in ratings:
+                place.count_rating(rating, step)
+
+    def repair_rating_aggregates(self):
+        """
+        Recompute the rating aggregates of every place from its reviews.
+
+        Returns:
+            int: Number of places whose aggregates were wrong
+        """
+        histograms = {}
+        rows = Review.query.with_entities(Review.place_id, Review.rating, func.count()).group_by(
+            Review.place_id, Review.rating)
+        for place_id, rating, count in rows:
+            if 1 <= rating <= 5:
+                histograms.setdefault(place_id, [0] * 5)[rating - 1] = count
+        repaired = 0
+        with unit_of_work():
+            for place in Place.query.yield_per(500):
+                before = (place.rating_histogram, place.review_count, place.rating_sum, place.rating_avg)
+                place.set_rating_aggregates(histograms.get(place.id, [0] * 5))
+                if before != (place.rating_histogram, place.review_count, place.rating_sum, place.rating_avg):
+                    repaired += 1
+        return repaired
+
+    def stream_places(self, after_id=None, profile='summary', batch_size=1000):
+        """Yield every place after after_id in id order, batch_size rows at a time."""
+        return self.place_repo.stream(after_id, options=place_profile(profile), batch_size=batch_size)
+
+    def get_places_page(self, after_id=None, limit=50, order_by='id', profile='summary',
+                        min_price=None, max_price=None):
+        """
+        Return one page of places; price bounds are served by the price index and need order_by='_price'.
+        """
+        if (min_price is not None or max_price is not None) and order_by.lstrip('-') != '_price':
+            raise ValueError("Price filters require sorting by price")
+        return self.place_repo.list_page(after_id, limit, order_by, options=place_profile(profile),
+                                         lower=min_price, upper=max_price)
+
+    def find_places_in_bbox(self, min_lat, min_lon, max_lat, max_lon, limit=None, profile='summary'):
+        return self.place_repo.find_in_bbox(min_lat, min_lon, max_lat, max_lon, limit,
+                                            options=place_profile(profile))
+
+    def find_places_near(self, lat, lon, radius_km, limit=None, profile='summary'):
+        """Return (place, distance_km) pairs within radius_km of a point, closest first."""
+        return self.place_repo.find_near(lat, lon, radius_km, limit, options=place_profile(profile))
+
+    def get_nearest_places(self, lat, lon, k, profile='summary'):
+        """
+        Return the k places closest to a point as (place, distance_km) pairs, closest first.
+        """
+        tree = self._place_tree()
+        while True:
+            found = tree.nearest(lat, lon, k)
+            places = self.place_repo.get_many([place_id for place_id, _ in found],
+                                              options=place_profile(profile))
+            missing = [place_id for place_id, _ in found if place_id not in places]
+            if not missing:
+                return [(places[place_id], distance) for place_id, distance in found]
+            # Rows deleted behind the tree's back: forget them and search again
+            for place_id in missing:
+                tree.remove(place_id)
+
+    def search_places(self, near=None, radius_km=None, bbox=None, min_price=None, max_price=None,
+                      min_rating=None, amenity_ids=(), after_id=None, limit=50, price_bucket=50,
+                      profile='summary'):
+        """
+        Filter places on any combination of location, price, minimum rating and amenities.
+
+        Every predicate is first sized cheaply: a count over its index for
+        columns, a popcount of the bitmaps for amenities. When the amenities
+        keep the fewest places, their ids drive the search and the column
+        predicates are checked on those ids only; otherwise the column
+        predicates run as one indexed query and its rows are checked against
+        the bitmaps. Facets are counted on the final set in the same pass.
+
+        Args:
+            near (tuple, optional): (lat, lon) searched within radius_km
+            bbox (tuple, optional): (min_lat, min_lon, max_lat, max_lon), ignored with near
+            amenity_ids (iterable): Amenities the places must all have
+            after_id (str, optional): Last place id of the previous page
+            price_bucket (float): Width of the price histogram buckets
+
+        Returns:
+            dict: places and next (the page, in id order), total, facets with
+            'amenities' ({amenity_id: count}) and 'price' ({bucket start: count}),
+            and plan (predicate names, most selective first)
+        """
+        clauses = {}
+        if near is not None:
+            bbox = radius_bbox(near[0], near[1], radius_km)
+        if bbox is not None:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            clauses['geo'] = and_(
+                Place.latitude.between(min_lat, max_lat),
+                or_(*(Place.longitude.between(lo, hi) for lo, hi in lon_ranges(min_lon, max_lon))))
+        if min_price is not None or max_price is not None:
+            bounds = []
+            if min_price is not None:
+                bounds.append(Place._price >= min_price)
+            if max_price is not None:
+                bounds.append(Place._price <= max_price)
+            clauses['price'] = and_(*bounds)
+        if min_rating is not None:
+            clauses['rating'] = Place.rating_avg >= min_rating
+
+        estimates = {name: db.session.query(func.count(Place.id)).filter(clause).scalar()
+                     for name, clause in clauses.items()}
+        amenity_ids = list(dict.fromkeys(amenity_ids))
+        bitmaps = self._amenity_bitmaps()
+        if amenity_ids:
+            estimates['amenities'] = bitmaps.count(amenity_ids)
+        plan = sorted(estimates, key=estimates.get)
+
+        columns = (Place.id, Place._price, Place.latitude, Place.longitude)
+        if plan and estimates[plan[0]] == 0:
+            rows = []
+        elif plan and plan[0] == 'amenities':
+            candidates, _ = bitmaps.page(amenity_ids, None, estimates['amenities'])
+            rows = []
+            for start in range(0, len(candidates), 500):
+                rows.extend(db.session.query(*columns).filter(
+                    Place.id.in_(candidates[start:start + 500]), *clauses.values()))
+        else:
+            rows = db.session.query(*columns).filter(*clauses.values()).all()
+            if amenity_ids:
+                kept = set(bitmaps.filter(amenity_ids, [row[0] for row in rows]))
+                rows = [row for row in rows if row[0] in kept]
+        if near is not None:
+            rows = [row for row in rows if row[2] is not None and row[3] is not None
+                    and haversine_km(near[0], near[1], row[2], row[3]) <= radius_km]
+
+        place_ids = sorted(row[0] for row in rows)
+        facets = {
+            'amenities': bitmaps.counts(place_ids),
+            'price': dict(sorted(Counter(floor(row[1] / price_bucket) * price_bucket for row in rows).items()))
+        }
+        start = bisect_right(place_ids, after_id) if after_id is not None else 0
+        page_ids = place_ids[start:start + limit]
+        next_id = page_ids[-1] if start + limit < len(place_ids) else None
+        places = self.place_repo.get_many(page_ids, options=place_profile(profile))
+        return {
+            'places': [places[place_id] for place_id in page_ids if place_id in places],
+            'next': next_id,
+            'total': len(place_ids),
+            'facets': facets,
+            'plan': plan
+        }
+
     def update_place(self, place_id, place_data):
         # Placeholder for logic to update a place
         place = self.place_repo.get(place_id)
         if place:
-            if 'title' in place_data:
-                place.title = place_data['title']
-            if 'description' in place_data:
-                place.description = place_data['description']
-            if 'price' in place_data:
-                place.price = place_data['price']
-            if 'latitude' in place_data:
-                place.latitude = place_data['latitude']
-            if 'longitude' in place_data:
-                place.longitude = place_data['longitude']
-            if 'owner_id' in place_data:
-                place.owner_id = place_data['owner_id']
-            self.place_repo.update(place, place_data)
+            # The owner is not editable: a listing cannot be handed to another user
+            changes = {key: place_data[key] for key in
+                       ('title', 'description', 'price', 'latitude', 'longitude') if key in place_data}
+            # A setter rejecting a value rolls back the ones already applied
+            with unit_of_work():
+                self.place_repo.update(place_id, changes)
         return place
     
     def create_review(self, review_data):
     # Placeholder for logic to create a review, including validation for user_id, place_id, and rating
         review = Review(**review_data)
-        self.review_repo.add(review)
+        with unit_of_work():
+            self.review_repo.add(review)
+            self._count_ratings(review.place_id, [review.rating])
         return review
 
+    def create_reviews_bulk(self, items):
+        """
+        Validate and insert many reviews in one transaction.
+
+        The rules of a single review hold for each item's user_id: nobody
+        reviews their own place, and a user reviews a place at most once,
+        counting reviews already stored and earlier items of the batch.
+        Unlike POST /reviews, which lets an admin skip them, these rules
+        bind the admins running the import: the items are written on behalf
+        of their users, not of the admin.
+
+        Returns:
+            tuple: (created_ids, errors), errors being {'index', 'error'} dicts
+        """
+        positions, mappings, errors = self._validate_bulk(items, Review.bulk_mapping)
+        owners = self._place_owners({mapping['place_id'] for mapping in mappings})
+        positions, mappings = self._reject_missing(positions, mappings, errors, 'place_id', owners, "Place not found")
+        users = self.user_repo.existing_ids(mapping['user_id'] for mapping in mappings)
+        positions, mappings = self._reject_missing(positions, mappings, errors, 'user_id', users, "User not found")
+        reviewed = self._reviewed_pairs({(mapping['user_id'], mapping['place_id']) for mapping in mappings})
+        kept_positions, kept = [], []
+        for index, mapping in zip(positions, mappings):
+            pair = (mapping['user_id'], mapping['place_id'])
+            if owners[mapping['place_id']] == mapping['user_id']:
+                errors.append({'index': index, 'error': "User cannot review their own place"})
+            elif pair in reviewed:
+                errors.append({'index': index, 'error': "User has already reviewed this place"})
+            else:
+                reviewed.add(pair)
+                kept_positions.append(index)
+                kept.append(mapping)
+        positions, mappings = kept_positions, kept
+        if mappings:
+            ratings = {}
+            for mapping in mappings:
+                ratings.setdefault(mapping['place_id'], []).append(mapping['rating'])
+                _record_text(('review', mapping['id']), mapping['place_id'], mapping['text'])
+            with unit_of_work():
+                self.review_repo.bulk_add(mappings)
+                for place_id, place_ratings in ratings.items():
+                    self._count_ratings(place_id, place_ratings)
+        errors.sort(key=lambda error: error['index'])
+        return [mapping['id'] for mapping in mappings], errors
+
+    @staticmethod
+    def _place_owners(place_ids, chunk_size=500):
+        """Return {place_id: owner_id} of the places that exist, querying in chunks."""
+        place_ids = list(place_ids)
+        owners = {}
+        for start in range(0, len(place_ids), chunk_size):
+            chunk = place_ids[start:start + chunk_size]
+            owners.update(db.session.query(Place.id, Place.owner_id).filter(Place.id.in_(chunk)))
+        return owners
+
+    @staticmethod
+    def _reviewed_pairs(pairs, chunk_size=500):
+        """Return the (user_id, place_id) pairs that already have a review, querying in chunks."""
+        pairs = list(pairs)
+        found = set()
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start:start + chunk_size]
+            found.update(db.session.query(Review.user_id, Review.place_id).filter(
+                tuple_(Review.user_id, Review.place_id).in_(chunk)))
+        return found
+
     def get_review(self, review_id):
         # Placeholder for logic to retrieve a review by ID
         return self.review_repo.get(review_id)
@@ -104,9 +697,15 @@ class HBnBFacade:
         # Placeholder for logic to retrieve all reviews
         return self.review_repo.get_all()
 
+    def stream_reviews(self, after_id=None, batch_size=1000):
+        return self.review_repo.stream(after_id, batch_size=batch_size)
+
+    def get_reviews_page(self, after_id=None, limit=50):
+        return self.review_repo.list_page(after_id, limit)
+
     def get_reviews_by_place(self, place_id):
-        # Placeholder for logic to retrieve all reviews for a specific place
-        return self.review_repo.get(place_id)
+        # Served by the index on reviews.place_id
+        return self.review_repo.get_all_by_attribute('place_id', place_id)
     
     def get_review_by_user_and_place(self, user_id, place_id):
         return Review.query.filter_by(user_id=user_id, place_id=place_id).first()
@@ -118,12 +717,21 @@ class HBnBFacade:
         if not review:
             raise ValueError("Review not found")
 
-        self.review_repo.update(review_id, review_data)
+        if 'rating' in review_data and review_data['rating'] not in range(1, 6):
+            raise ValueError("Rating must be between 1 and 5")
+        old_place_id, old_rating = review.place_id, review.rating
+        with unit_of_work():
+            self.review_repo.update(review_id, review_data)
+            if (review.place_id, review.rating) != (old_place_id, old_rating):
+                self._count_ratings(old_place_id, [old_rating], -1)
+                self._count_ratings(review.place_id, [review.rating])
         return self.get_review(review_id)
 
     def delete_review(self, review_id):
         # Placeholder for logic to delete a review
         review = self.review_repo.get(review_id)
         if review:
-            self.review_repo.delete(review_id)
+            with unit_of_work():
+                self.review_repo.delete(review_id)
+                self._count_ratings(review.place_id, [review.rating], -1)
             return {'message': 'Review deleted sucessfully'}
\ No newline at end of file
@@ -0,0 +1,76 @@
+import hashlib
+import time
+from flask import current_app
+from flask_jwt_extended import JWTManager
+from app.persistence.cache import LocalCache
+
+# Key of the per-application ClaimsCache in app.extensions
+CLAIMS_CACHE_KEY = 'hbnb_jwt_claims'
+
+
+class ClaimsCache:
+    """
+    Bounded LRU of verified token claims, each kept until the token's exp.
+
+    Entries are keyed by the SHA-256 digest of the encoded token: any
+    change to the token, signature included, is a miss and goes through
+    full verification. Tokens without exp are kept until evicted.
+    """
+
+    def __init__(self, maxsize=1024, clock=time.time):
+        self._clock = clock
+        self._entries = LocalCache(maxsize, clock=clock)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(encoded_token):
+        return hashlib.sha256(encoded_token.encode('utf-8')).digest()
+
+    def get(self, encoded_token):
+        claims = self._entries.get(self.key(encoded_token))
+        if claims is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Callers may add to the claims they get
+        return dict(claims)
+
+    def put(self, encoded_token, claims):
+        expires = claims.get('exp')
+        if expires is None:
+            self._entries.set(self.key(encoded_token), dict(claims))
+        elif expires > self._clock():
+            self._entries.set(self.key(encoded_token), dict(claims), ex=expires - self._clock())
+
+
+def claims_cache():
+    """Return the application's ClaimsCache, built from its configuration on first use."""
+    cache = current_app.extensions.get(CLAIMS_CACHE_KEY)
+    if cache is None:
+        cache = ClaimsCache(current_app.config.get('JWT_CLAIMS_CACHE_SIZE', 1024))
+        current_app.extensions[CLAIMS_CACHE_KEY] = cache
+    return cache
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager verifying each token once until it expires.
+
+    A client sends the same token with every request: the signature check
+    and the three JSON decodings of flask-jwt-extended run on its first
+    request only, later ones get the claims from the application's
+    ClaimsCache. Blocklist and claims checks made after decoding still run
+    on every request. Decoding expired tokens or CSRF-protected cookies
+    always goes through full verification.
+    """
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        if allow_expired or csrf_value or not current_app.config.get('JWT_CLAIMS_CACHE_ENABLED', True):
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        cache = claims_cache()
+        claims = cache.get(encoded_token)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token)
+            cache.put(encoded_token, claims)
+        return claims
@@ -0,0 +1,75 @@
+#Part4/benchmarks/bench_denylist.py
+"""
+Benchmark the per-request revocation check against the number of revoked
+tokens.
+
+Usage (from Part4/):
+    python -m benchmarks.bench_denylist [sizes...]
+
+Each size is a number of revoked, still valid tokens. The time of one
+lookup is measured for a token that is not revoked (every normal request)
+and for one that is, through the blocklist callback flask-jwt-extended
+calls on each request.
+
+The last column repeats the lookup of tokens that are not revoked with a
+shared backend, which every one of them reaches. The backend is an
+in-process LocalCache, so that column is the floor of the code path; set
+HBNB_BENCH_REDIS_URL (and install redis) to measure a real Redis, where
+the network round trip dominates.
+"""
+
+import os
+import sys
+import time
+import uuid
+from app import create_app
+from app.persistence.cache import LocalCache
+from app.revocation import DENYLIST_KEY, Denylist, _token_revoked
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+LOOKUPS = 200_000
+
+
+def per_lookup(payloads):
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        _token_revoked(None, payloads[i % len(payloads)])
+    return (time.perf_counter() - start) / LOOKUPS
+
+
+def make_backend():
+    url = os.environ.get('HBNB_BENCH_REDIS_URL')
+    if url:
+        import redis
+        return redis.Redis.from_url(url)
+    return LocalCache(maxsize=1 << 22)
+
+
+def main(sizes):
+    app = create_app("config.TestingConfig")
+    with app.app_context():
+        print(f"{'revoked':>10} {'revoke (s)':>11} {'valid (ns)':>11} {'revoked (ns)':>13} "
+              f"{'backend (ns)':>13}")
+        for count in sizes:
+            denylist = app.extensions[DENYLIST_KEY] = Denylist()
+            expires = time.time() + 3600
+            jtis = [str(uuid.uuid4()) for _ in range(count)]
+            start = time.perf_counter()
+            for jti in jtis:
+                denylist.revoke(jti, expires)
+            revoke_time = time.perf_counter() - start
+            unknown = [{'jti': str(uuid.uuid4())} for _ in range(1000)]
+            valid = per_lookup(unknown)
+            revoked = per_lookup([{'jti': jti} for jti in jtis[:1000]])
+
+            shared = Denylist(make_backend())
+            for jti in jtis:
+                shared.revoke(jti, expires)
+            app.extensions[DENYLIST_KEY] = shared
+            backend = per_lookup(unknown)
+            print(f"{count:>10} {revoke_time:>11.2f} {valid * 1e9:>11.0f} {revoked * 1e9:>13.0f} "
+                  f"{backend * 1e9:>13.0f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,70 @@
+#Part4/benchmarks/bench_jwt.py
+"""
+Benchmark the authentication overhead of a @jwt_required() request, per
+signing profile, with and without the verified-claims cache.
+
+Usage (from Part4/):
+    python -m benchmarks.bench_jwt [sizes...]
+
+Each size is a number of distinct tokens (clients) sending requests in
+turn; only verify_jwt_in_request() is timed, inside a request context.
+Past JWT_CLAIMS_CACHE_SIZE clients the cache keeps missing. EdDSA is
+skipped when the cryptography package is not installed.
+"""
+
+import sys
+import time
+from flask_jwt_extended import create_access_token, verify_jwt_in_request
+from app import create_app
+
+DEFAULT_SIZES = (1, 100, 2_000)
+REQUESTS = 5_000
+
+
+def eddsa_keys():
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+    except ImportError:
+        return None
+    key = Ed25519PrivateKey.generate()
+    private = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                serialization.NoEncryption())
+    public = key.public_key().public_bytes(serialization.Encoding.PEM,
+                                           serialization.PublicFormat.SubjectPublicKeyInfo)
+    return {'JWT_PRIVATE_KEY': private.decode(), 'JWT_PUBLIC_KEY': public.decode()}
+
+
+def per_request(profile, clients, cached):
+    app = create_app("config.TestingConfig")
+    app.config.update(profile, JWT_CLAIMS_CACHE_ENABLED=cached)
+    with app.app_context():
+        tokens = [create_access_token(identity={'id': f"user-{i}", 'is_admin': False}) for i in range(clients)]
+    contexts = [app.test_request_context(headers={'Authorization': f"Bearer {token}"}) for token in tokens]
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        with contexts[i % clients]:
+            verify_jwt_in_request()
+    return (time.perf_counter() - start) / REQUESTS
+
+
+def main(sizes):
+    profiles = {
+        'HS256': {'JWT_ALGORITHM': 'HS256', 'JWT_DECODE_ALGORITHMS': ['HS256']},
+        'HS512': {'JWT_ALGORITHM': 'HS512', 'JWT_DECODE_ALGORITHMS': ['HS512']},
+    }
+    keys = eddsa_keys()
+    if keys is None:
+        print("EdDSA skipped: cryptography is not installed")
+    else:
+        profiles['EdDSA'] = dict(keys, JWT_ALGORITHM='EdDSA', JWT_DECODE_ALGORITHMS=['EdDSA'])
+    print(f"{'profile':>8} {'clients':>8} {'uncached (us)':>14} {'cached (us)':>12} {'speedup':>8}")
+    for name, profile in profiles.items():
+        for clients in sizes:
+            before = per_request(profile, clients, cached=False)
+            after = per_request(profile, clients, cached=True)
+            print(f"{name:>8} {clients:>8} {before * 1e6:>14.1f} {after * 1e6:>12.1f} {before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,57 @@
+#Part4/benchmarks/bench_login_throttle.py
+"""
+Benchmark a brute-force replay against the login endpoint, with and
+without the login throttle (per email and address pair, per address,
+per email).
+
+Usage (from Part4/):
+    python -m benchmarks.bench_login_throttle [sizes...]
+
+Each size is a number of attempts from one address: wrong passwords for
+a known email, interleaved with guesses at other emails. bcrypt runs in
+the request thread (PASSWORD_POOL_WORKERS = 0) so that its CPU time is
+counted by time.process_time(). Without the throttle, CPU grows with the
+attempts; with it, it stays bounded by the limits of one window.
+"""
+
+import sys
+import time
+from app import create_app, db
+from app.services import facade
+
+DEFAULT_SIZES = (50, 200, 500)
+# Lower than production's 12 to keep the unthrottled runs short
+BCRYPT_ROUNDS = 8
+
+
+def replay(attempts, throttled):
+    app = create_app("config.TestingConfig")
+    app.config.update(BCRYPT_LOG_ROUNDS=BCRYPT_ROUNDS, LOGIN_LIMIT_ENABLED=throttled)
+    client = app.test_client()
+    with app.app_context():
+        db.create_all()
+        facade.create_user({'first_name': "Victim", 'last_name': "One",
+                            'email': "victim@example.com", 'password': "correct horse"})
+        statuses = {}
+        start = time.process_time()
+        for i in range(attempts):
+            email = "victim@example.com" if i % 2 else f"guess{i}@example.com"
+            response = client.post('/api/v1/auth/login', json={'email': email, 'password': f"guess {i}"})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        elapsed = time.process_time() - start
+        db.session.remove()
+        db.drop_all()
+    return elapsed, statuses
+
+
+def main(sizes):
+    print(f"bcrypt rounds: {BCRYPT_ROUNDS}")
+    print(f"{'attempts':>8} {'cpu off (s)':>12} {'cpu on (s)':>11} {'checked':>8} {'refused':>8}")
+    for attempts in sizes:
+        off, _ = replay(attempts, throttled=False)
+        on, statuses = replay(attempts, throttled=True)
+        print(f"{attempts:>8} {off:>12.2f} {on:>11.2f} {statuses.get(401, 0):>8} {statuses.get(429, 0):>8}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,73 @@
+#Part4/benchmarks/bench_price.py
+"""
+Benchmark price range pages on InMemoryRepository's sorted price index,
+the in-memory counterpart of GET /places?min_price=&max_price=&sort=price.
+
+Usage (from Part4/):
+    python -m benchmarks.bench_price [sizes...]
+
+With the sorted index a page costs two bisections plus the page itself,
+so it stays flat as listings grow, while the unindexed repository sorts
+every stored listing on each call.
+"""
+
+import random
+import sys
+import time
+from app.persistence.repository import InMemoryRepository
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+QUERIES = 1_000
+SCAN_QUERIES = 5
+PAGE_SIZE = 50
+
+
+class Listing:
+    __slots__ = ('id', 'price')
+
+    def __init__(self, obj_id, price):
+        self.id = obj_id
+        self.price = price
+
+
+def time_queries(search, ranges):
+    start = time.perf_counter()
+    for lower, upper in ranges:
+        search(lower, upper)
+    return (time.perf_counter() - start) / len(ranges)
+
+
+def main(sizes):
+    rng = random.Random(42)
+    print(f"{'listings':>10} {'page (us)':>10} {'next (us)':>10} {'scan (us)':>12}")
+    for count in sizes:
+        indexed = InMemoryRepository()
+        indexed.add_sorted_index('price')
+        scanned = InMemoryRepository()
+        for i in range(count):
+            listing = Listing(str(i), round(rng.uniform(10, 1000), 2))
+            indexed.add(listing)
+            scanned.add(listing)
+
+        ranges = []
+        for _ in range(QUERIES):
+            lower = rng.uniform(10, 900)
+            ranges.append((lower, lower + rng.uniform(10, 100)))
+        cursors = {bounds: indexed.list_page(limit=PAGE_SIZE, order_by='price', lower=bounds[0],
+                                             upper=bounds[1])[1] for bounds in ranges}
+
+        page_time = time_queries(
+            lambda lower, upper: indexed.list_page(limit=PAGE_SIZE, order_by='price', lower=lower, upper=upper),
+            ranges)
+        next_time = time_queries(
+            lambda lower, upper: indexed.list_page(after_id=cursors[(lower, upper)], limit=PAGE_SIZE,
+                                                   order_by='price', lower=lower, upper=upper),
+            ranges)
+        scan_time = time_queries(
+            lambda lower, upper: scanned.list_page(limit=PAGE_SIZE, order_by='price', lower=lower, upper=upper),
+            ranges[:SCAN_QUERIES])
+        print(f"{count:>10} {page_time * 1e6:>10.2f} {next_time * 1e6:>10.2f} {scan_time * 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
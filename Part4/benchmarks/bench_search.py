@@ -0,0 +1,71 @@
+#Part4/benchmarks/bench_search.py
+"""
+Benchmark top-20 full-text queries on the in-memory BM25 InvertedIndex
+and on an SQLite FTS5 table holding the same review texts.
+
+Usage (from Part4/):
+    python -m benchmarks.bench_search [sizes...]
+
+Reviews are drawn from a Zipf-like vocabulary, so common words have long
+posting lists and rare ones short lists. Queries mix one common and one
+rare word, like "quiet" or "pool" next to a neighbourhood name.
+"""
+
+import random
+import sqlite3
+import sys
+import time
+from app.persistence.search import InvertedIndex, fts_match_expression
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+VOCABULARY = 20_000
+WORDS_PER_REVIEW = 12
+PLACES_PER_REVIEW = 10
+QUERIES = 200
+LIMIT = 20
+
+
+def build_reviews(count, rng):
+    words = [f"w{rank}" for rank in range(VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY)]
+    return [(str(i), str(i // PLACES_PER_REVIEW), ' '.join(rng.choices(words, weights, k=WORDS_PER_REVIEW)))
+            for i in range(count)]
+
+
+def build_fts(reviews):
+    connection = sqlite3.connect(':memory:')
+    connection.execute("CREATE VIRTUAL TABLE reviews_fts USING fts5(place_id UNINDEXED, text)")
+    connection.executemany("INSERT INTO reviews_fts(place_id, text) VALUES (?, ?)",
+                           ((place_id, value) for _, place_id, value in reviews))
+    return connection
+
+
+def time_queries(search, queries):
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main(sizes):
+    rng = random.Random(42)
+    print(f"{'reviews':>10} {'memory (ms)':>12} {'fts5 (ms)':>12}")
+    for count in sizes:
+        reviews = build_reviews(count, rng)
+        index = InvertedIndex()
+        for review_id, place_id, value in reviews:
+            index.set_part(review_id, place_id, value)
+        connection = build_fts(reviews)
+        queries = [f"w{rng.randrange(50)} w{rng.randrange(1_000, VOCABULARY)}" for _ in range(QUERIES)]
+
+        memory_time = time_queries(lambda query: index.search(query, LIMIT), queries)
+        fts_time = time_queries(lambda query: connection.execute(
+            "WITH hits AS MATERIALIZED (SELECT place_id, bm25(reviews_fts) AS score "
+            "FROM reviews_fts WHERE reviews_fts MATCH ?) "
+            "SELECT place_id, SUM(score) AS score FROM hits GROUP BY place_id ORDER BY score LIMIT ?", (fts_match_expression(query), LIMIT)).fetchall(), queries)
+        print(f"{count:>10} {memory_time * 1e3:>12.2f} {fts_time * 1e3:>12.2f}")
+        connection.close()
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
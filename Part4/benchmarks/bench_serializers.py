@@ -0,0 +1,83 @@
+#Part4/benchmarks/bench_serializers.py
+"""
+Benchmark serializing a page of places to JSON: the hand-built dicts and
+flask-restx's standard library encoding the resources used before, against
+the compiled ModelSerializer functions and the fast encoder.
+
+Usage (from Part4/):
+    python -m benchmarks.bench_serializers [sizes...]
+
+Places are loaded from an in-memory SQLite database first, like a list
+endpoint does, and only the serialization is timed. The "sparse" column
+uses ?fields=id,title,price.
+"""
+
+import json
+import sys
+import time
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.api.v1.places import place_to_dict
+from app.api.v1.serializers import dumps, orjson
+
+DEFAULT_SIZES = (500, 5_000, 50_000)
+ROUNDS = 5
+
+
+def hand_built(place):
+    # What PlaceList.get built before the serializers
+    return {
+        "id": place.id,
+        "title": place.title,
+        "description": place.description,
+        "price": place.price,
+        "latitude": place.latitude,
+        "longitude": place.longitude,
+        "owner_id": place.owner_id,
+        "rating": place.rating_avg,
+        "review_count": place.review_count
+    }
+
+
+def best_time(function, rounds=ROUNDS):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    app = create_app("config.TestingConfig")
+    with app.app_context():
+        db.create_all()
+        owner = User("Bench", "Owner", "bench@example.com", password="secret")
+        db.session.add(owner)
+        db.session.commit()
+        compiled = place_to_dict()
+        sparse = place_to_dict(fields='id,title,price')
+        print(f"encoder: {'orjson' if orjson else 'json'}")
+        print(f"{'places':>8} {'hand-built (ms)':>16} {'compiled (ms)':>14} {'sparse (ms)':>12} {'speedup':>8}")
+        stored = 0
+        for count in sizes:
+            db.session.bulk_insert_mappings(Place, [
+                Place.bulk_mapping({'title': f"Place {i}", 'description': "A nice place to stay",
+                                    'price': 50 + i % 200, 'latitude': 48.8, 'longitude': 2.3,
+                                    'owner_id': owner.id})
+                for i in range(stored, count)])
+            db.session.commit()
+            stored = max(stored, count)
+            db.session.expunge_all()
+            places = Place.query.limit(count).all()
+
+            before = best_time(lambda: json.dumps({'data': [hand_built(place) for place in places]}))
+            after = best_time(lambda: dumps({'data': [compiled(place) for place in places]}))
+            sparse_time = best_time(lambda: dumps({'data': [sparse(place) for place in places]}))
+            print(f"{count:>8} {before * 1e3:>16.2f} {after * 1e3:>14.2f} {sparse_time * 1e3:>12.2f} "
+                  f"{before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
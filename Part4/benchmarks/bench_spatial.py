@@ -0,0 +1,70 @@
+#Part4/benchmarks/bench_spatial.py
+"""
+Benchmark radius and bounding-box searches on InMemoryRepository's grid index,
+and k-nearest-neighbour searches on the KDTree used by /places/nearest.
+
+Usage (from Part4/):
+    python -m benchmarks.bench_spatial [sizes...]
+
+Listings are spread uniformly over Europe. With the grid index a 5 km
+radius search stays well under a millisecond at a million listings,
+while the unindexed scan grows with the number of stored listings.
+"""
+
+import random
+import sys
+import time
+from app.persistence.repository import InMemoryRepository
+from app.persistence.spatial import KDTree
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+QUERIES = 1_000
+SCAN_QUERIES = 5
+RADIUS_KM = 5
+K = 10
+
+
+class Listing:
+    __slots__ = ('id', 'latitude', 'longitude')
+
+    def __init__(self, obj_id, latitude, longitude):
+        self.id = obj_id
+        self.latitude = latitude
+        self.longitude = longitude
+
+
+def build_listings(count, rng):
+    return [Listing(str(i), rng.uniform(36, 60), rng.uniform(-10, 30)) for i in range(count)]
+
+
+def time_queries(search, points):
+    start = time.perf_counter()
+    for lat, lon in points:
+        search(lat, lon)
+    return (time.perf_counter() - start) / len(points)
+
+
+def main(sizes):
+    rng = random.Random(42)
+    print(f"{'listings':>10} {'near (us)':>10} {'bbox (us)':>10} {'knn (us)':>10} {'scan (us)':>12}")
+    for count in sizes:
+        indexed = InMemoryRepository()
+        indexed.add_spatial_index()
+        scanned = InMemoryRepository()
+        listings = build_listings(count, rng)
+        for listing in listings:
+            indexed.add(listing)
+            scanned.add(listing)
+        tree = KDTree((listing.id, listing.latitude, listing.longitude) for listing in listings)
+
+        points = [(rng.uniform(37, 59), rng.uniform(-9, 29)) for _ in range(QUERIES)]
+        near_time = time_queries(lambda lat, lon: indexed.find_near(lat, lon, RADIUS_KM), points)
+        bbox_time = time_queries(lambda lat, lon: indexed.find_in_bbox(lat, lon, lat + 0.1, lon + 0.1), points)
+        knn_time = time_queries(lambda lat, lon: tree.nearest(lat, lon, K), points)
+        scan_time = time_queries(lambda lat, lon: scanned.find_near(lat, lon, RADIUS_KM), points[:SCAN_QUERIES])
+        print(f"{count:>10} {near_time * 1e6:>10.2f} {bbox_time * 1e6:>10.2f} {knn_time * 1e6:>10.2f} "
+              f"{scan_time * 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -17,8 +17,57 @@ class Config:
     DEBUG = False
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', '_Mickael_Chauvin_123_')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
-    JWT_ALGORITHM = 'HS512'
-    JWT_DECODE_ALGORITHMS = ['HS512']
+    # HS256/HS512 sign with JWT_SECRET_KEY; EdDSA signs with the Ed25519 PEM key in
+    # JWT_PRIVATE_KEY and verifies with JWT_PUBLIC_KEY (needs the cryptography package)
+    JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS512')
+    JWT_DECODE_ALGORITHMS = [JWT_ALGORITHM]
+    JWT_PRIVATE_KEY = os.getenv('JWT_PRIVATE_KEY')
+    JWT_PUBLIC_KEY = os.getenv('JWT_PUBLIC_KEY')
+    # The identity is a dict ({'id', 'is_admin'}), which PyJWT refuses as "sub" by default
+    JWT_VERIFY_SUB = False
+    # Claims of verified tokens are kept until they expire, so a token is verified once
+    JWT_CLAIMS_CACHE_ENABLED = True
+    JWT_CLAIMS_CACHE_SIZE = 1024
+    # Revoked tokens (POST /api/v1/auth/logout) are kept in process until they expire;
+    # JWT_DENYLIST_BACKEND takes a Redis client to share revocations between workers
+    JWT_DENYLIST_BACKEND = None
+    # 'fts5' uses the SQLite full-text tables (a LIKE scan on other databases), 'like'
+    # always scans, 'memory' keeps a BM25 index in every worker, reloaded after others write
+    SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'fts5')
+    # Read-through cache of users (without their password), places and amenities;
+    # OBJECT_CACHE_BACKEND takes any client with Redis' get/set/delete (e.g. redis.Redis).
+    # With OBJECT_CACHE_ENABLED None the cache is only on with such a shared backend.
+    # The in-process LRU used if the backend is None only sees its own process' writes:
+    # set OBJECT_CACHE_ENABLED = True to use it, in single-process deployments only
+    OBJECT_CACHE_ENABLED = None
+    OBJECT_CACHE_BACKEND = None
+    OBJECT_CACHE_SIZE = 1024
+    OBJECT_CACHE_TTL = 300
+    # Responses of at least COMPRESS_MIN_SIZE bytes are gzip/brotli encoded when accepted
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 6
+    # 'flask build-assets' writes hashed, precompressed copies of the frontend
+    # into FRONTEND_BUILD_DIR (relative to Part4), served under FRONTEND_URL_PREFIX
+    FRONTEND_SOURCE_DIR = 'frontend_files'
+    FRONTEND_BUILD_DIR = os.path.join('build', 'frontend')
+    FRONTEND_URL_PREFIX = '/app'
+    # bcrypt runs in PASSWORD_POOL_WORKERS processes (0: in the request thread); past
+    # PASSWORD_POOL_MAX_PENDING running or queued calls, logins get a 429. Hashes made
+    # with another BCRYPT_LOG_ROUNDS are upgraded on the next successful login
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    PASSWORD_POOL_WORKERS = int(os.getenv('PASSWORD_POOL_WORKERS', 2))
+    PASSWORD_POOL_MAX_PENDING = int(os.getenv('PASSWORD_POOL_MAX_PENDING', 16))
+    # Login attempts allowed per (email, client address) pair, per address and per
+    # email in a sliding LOGIN_LIMIT_WINDOW (seconds). The per-email ceiling is loose so
+    # that nobody can lock a user out from their own address; LOGIN_LIMIT_BACKEND takes
+    # a Redis client to share the counters between workers, in-process counters if None
+    LOGIN_LIMIT_ENABLED = True
+    LOGIN_LIMIT_BACKEND = None
+    LOGIN_LIMIT_SIZE = 10_000
+    LOGIN_LIMIT_PER_PAIR = 5
+    LOGIN_LIMIT_PER_ADDRESS = 20
+    LOGIN_LIMIT_PER_EMAIL = 100
+    LOGIN_LIMIT_WINDOW = 60
 
 
 class DevelopmentConfig(Config):
@@ -27,8 +76,17 @@ class DevelopmentConfig(Config):
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
 
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    BCRYPT_LOG_ROUNDS = 4
+    PASSWORD_POOL_WORKERS = 0
+
+
 config = {
     'development': DevelopmentConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig,
     'admin': DefaultAdmin
 }
\ No newline at end of file
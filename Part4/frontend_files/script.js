@@ -50,17 +50,22 @@ document.addEventListener('DOMContentLoaded', () => {
             document.getElementById('login-link').style.display = currentToken ? 'none' : 'block';
         };
 
-        const fetchPlaces = async () => {
+        const PAGE_SIZE = 24;
+
+        // Load one page of places; `after` is the cursor returned by the previous page
+        const fetchPlaces = async (after = null) => {
             try {
-                const response = await fetch(`${API_BASE}/places`, {
+                const params = new URLSearchParams({ limit: PAGE_SIZE });
+                if (after) params.set('after', after);
+                const response = await fetch(`${API_BASE}/places?${params}`, {
                     headers: { 'Authorization': `Bearer ${currentToken}` }
                 });
                 
                 if (!response.ok) return handleApiError(response);
                 
-                const places = await response.json();
+                const page = await response.json();
                 const container = document.getElementById('places-list');
-                container.innerHTML = places.map(place => `
+                const cards = page.data.map(place => `
                     <div class="place-card">
                         <h3>${place.name}</h3>
                         <p>Price: $${place.price_per_night}/night</p>
@@ -70,6 +75,21 @@ document.addEventListener('DOMContentLoaded', () => {
                         </button>
                     </div>
                 `).join('');
+                if (after) {
+                    document.getElementById('load-more')?.remove();
+                    container.insertAdjacentHTML('beforeend', cards);
+                } else {
+                    container.innerHTML = cards;
+                }
+
+                if (page.next) {
+                    const loadMore = document.createElement('button');
+                    loadMore.id = 'load-more';
+                    loadMore.className = 'details-button';
+                    loadMore.textContent = 'Load more';
+                    loadMore.addEventListener('click', () => fetchPlaces(page.next));
+                    container.appendChild(loadMore);
+                }
             } catch (error) {
                 alert(`Failed to load places: ${error.message}`);
             }
@@ -0,0 +1,27 @@
+-- Ajout des agrégats de notes sur places (review_count, rating_sum, histogramme, moyenne)
+-- Compatible SQLite et MySQL. Équivalent applicatif : flask --app run repair-ratings
+
+ALTER TABLE places ADD COLUMN review_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_sum INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_1 INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_2 INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_3 INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_4 INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_5 INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE places ADD COLUMN rating_avg FLOAT NOT NULL DEFAULT 0;
+
+CREATE INDEX idx_places_rating_avg ON places (rating_avg, id);
+
+-- Calcul initial à partir des avis existants
+UPDATE places SET
+    rating_1 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND reviews.rating = 1),
+    rating_2 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND reviews.rating = 2),
+    rating_3 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND reviews.rating = 3),
+    rating_4 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND reviews.rating = 4),
+    rating_5 = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id AND reviews.rating = 5);
+
+UPDATE places SET
+    review_count = rating_1 + rating_2 + rating_3 + rating_4 + rating_5,
+    rating_sum = rating_1 + 2 * rating_2 + 3 * rating_3 + 4 * rating_4 + 5 * rating_5;
+
+UPDATE places SET rating_avg = CASE WHEN review_count > 0 THEN 1.0 * rating_sum / review_count ELSE 0 END;
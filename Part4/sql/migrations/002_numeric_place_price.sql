@@ -0,0 +1,50 @@
+-- Conversion de places._price (VARCHAR(120) UNIQUE) en NUMERIC(10, 2) indexé
+-- Pour la base SQLite créée par l'application (development.db), après 001.
+-- SQLite ne sait pas modifier le type d'une colonne : la table est reconstruite.
+-- MySQL (schema.sql) a déjà DECIMAL(10,2) : seul l'index idx_places_price est à créer.
+
+-- Les prix non numériques deviendraient 0 ; à vérifier avant de lancer la migration :
+-- SELECT id, _price FROM places WHERE CAST(TRIM(_price) AS REAL) = 0 AND TRIM(_price) NOT IN ('0', '0.0', '0.00');
+
+PRAGMA foreign_keys = OFF;
+BEGIN TRANSACTION;
+
+CREATE TABLE places_new (
+    id VARCHAR(36) NOT NULL,
+    _title VARCHAR(50) NOT NULL,
+    _description VARCHAR(50) NOT NULL,
+    _price NUMERIC(10, 2) NOT NULL,
+    latitude FLOAT,
+    longitude FLOAT NOT NULL,
+    created_at DATETIME,
+    updated_at DATETIME,
+    owner_id VARCHAR(36) NOT NULL,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0,
+    rating_avg FLOAT NOT NULL DEFAULT 0,
+    PRIMARY KEY (id),
+    FOREIGN KEY (owner_id) REFERENCES users (id)
+);
+
+INSERT INTO places_new (id, _title, _description, _price, latitude, longitude, created_at, updated_at,
+                        owner_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4,
+                        rating_5, rating_avg)
+SELECT id, _title, _description, ROUND(CAST(TRIM(_price) AS REAL), 2), latitude, longitude, created_at,
+       updated_at, owner_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5,
+       rating_avg
+FROM places;
+
+DROP TABLE places;
+ALTER TABLE places_new RENAME TO places;
+
+CREATE INDEX idx_places_lat_lon ON places (latitude, longitude);
+CREATE INDEX idx_places_rating_avg ON places (rating_avg, id);
+CREATE INDEX idx_places_price ON places (_price, id);
+
+COMMIT;
+PRAGMA foreign_keys = ON;
@@ -0,0 +1,44 @@
+-- Recherche plein texte (SQLite FTS5) sur les lieux et les avis
+-- Tables FTS à contenu externe : le texte reste dans places/reviews, les triggers
+-- tiennent l'index à jour. Avec SEARCH_BACKEND=memory, l'index est construit en mémoire.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(
+    _title, _description, content='places', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS places_fts_insert AFTER INSERT ON places BEGIN
+    INSERT INTO places_fts(rowid, _title, _description) VALUES (new.rowid, new._title, new._description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS places_fts_delete AFTER DELETE ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, _title, _description)
+    VALUES ('delete', old.rowid, old._title, old._description);
+END;
+
+-- Les mises à jour de notes ou de coordonnées ne touchent pas l'index
+CREATE TRIGGER IF NOT EXISTS places_fts_update AFTER UPDATE OF _title, _description ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, _title, _description)
+    VALUES ('delete', old.rowid, old._title, old._description);
+    INSERT INTO places_fts(rowid, _title, _description) VALUES (new.rowid, new._title, new._description);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+    text, content='reviews', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+    INSERT INTO reviews_fts(rowid, text) VALUES (new.rowid, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF text ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+    INSERT INTO reviews_fts(rowid, text) VALUES (new.rowid, new.text);
+END;
+
+-- Indexation initiale des lignes existantes
+INSERT INTO places_fts(places_fts) VALUES ('rebuild');
+INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild');
@@ -0,0 +1,12 @@
+-- Compteurs de version par table, partagés par tous les workers
+-- Incrémentés dans la transaction qui écrit la table ; les ETag des listes en dépendent.
+-- Compatible SQLite et MySQL.
+
+CREATE TABLE IF NOT EXISTS collection_versions (
+    table_name VARCHAR(64) NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (table_name)
+);
+
+INSERT INTO collection_versions (table_name, version) VALUES
+    ('users', 0), ('places', 0), ('amenities', 0), ('reviews', 0), ('place_amenity', 0);
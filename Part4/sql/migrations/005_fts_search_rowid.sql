@@ -0,0 +1,66 @@
+-- Clé entière explicite pour les tables FTS (SQLite)
+-- Le rowid implicite d'une table à clé primaire texte peut changer lors d'un VACUUM :
+-- les tables FTS sont désormais indexées sur search_rowid, numéroté par le trigger d'insertion.
+
+DROP TRIGGER IF EXISTS places_fts_insert;
+DROP TRIGGER IF EXISTS places_fts_delete;
+DROP TRIGGER IF EXISTS places_fts_update;
+DROP TRIGGER IF EXISTS reviews_fts_insert;
+DROP TRIGGER IF EXISTS reviews_fts_delete;
+DROP TRIGGER IF EXISTS reviews_fts_update;
+DROP TABLE IF EXISTS places_fts;
+DROP TABLE IF EXISTS reviews_fts;
+
+ALTER TABLE places ADD COLUMN search_rowid INTEGER;
+UPDATE places SET search_rowid = rowid;
+CREATE UNIQUE INDEX IF NOT EXISTS ix_places_search_rowid ON places (search_rowid);
+
+ALTER TABLE reviews ADD COLUMN search_rowid INTEGER;
+UPDATE reviews SET search_rowid = rowid;
+CREATE UNIQUE INDEX IF NOT EXISTS ix_reviews_search_rowid ON reviews (search_rowid);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(
+    _title, _description, content='places', content_rowid='search_rowid'
+);
+
+-- Numéro suivant le plus grand existant : jamais réutilisé, même après un VACUUM
+CREATE TRIGGER IF NOT EXISTS places_fts_insert AFTER INSERT ON places BEGIN
+    UPDATE places SET search_rowid = (SELECT COALESCE(MAX(search_rowid), 0) + 1 FROM places)
+    WHERE id = new.id;
+    INSERT INTO places_fts(rowid, _title, _description)
+    SELECT search_rowid, _title, _description FROM places WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS places_fts_delete AFTER DELETE ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, _title, _description)
+    VALUES ('delete', old.search_rowid, old._title, old._description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS places_fts_update AFTER UPDATE OF _title, _description ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, _title, _description)
+    VALUES ('delete', old.search_rowid, old._title, old._description);
+    INSERT INTO places_fts(rowid, _title, _description) VALUES (new.search_rowid, new._title, new._description);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+    text, content='reviews', content_rowid='search_rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+    UPDATE reviews SET search_rowid = (SELECT COALESCE(MAX(search_rowid), 0) + 1 FROM reviews)
+    WHERE id = new.id;
+    INSERT INTO reviews_fts(rowid, text) SELECT search_rowid, text FROM reviews WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.search_rowid, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF text ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.search_rowid, old.text);
+    INSERT INTO reviews_fts(rowid, text) VALUES (new.search_rowid, new.text);
+END;
+
+-- Réindexation des lignes existantes sur la nouvelle clé
+INSERT INTO places_fts(places_fts) VALUES ('rebuild');
+INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild');
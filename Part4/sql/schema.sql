@@ -23,9 +23,21 @@ CREATE TABLE IF NOT EXISTS places (
     latitude FLOAT NOT NULL,
     longitude FLOAT NOT NULL,
     owner_id VARCHAR(36) NOT NULL,
+    -- Agrégats des notes, mis à jour à chaque écriture d'avis
+    review_count INT NOT NULL DEFAULT 0,
+    rating_sum INT NOT NULL DEFAULT 0,
+    rating_1 INT NOT NULL DEFAULT 0,
+    rating_2 INT NOT NULL DEFAULT 0,
+    rating_3 INT NOT NULL DEFAULT 0,
+    rating_4 INT NOT NULL DEFAULT 0,
+    rating_5 INT NOT NULL DEFAULT 0,
+    rating_avg FLOAT NOT NULL DEFAULT 0,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
+    FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_places_lat_lon (latitude, longitude),
+    INDEX idx_places_rating_avg (rating_avg, id),
+    INDEX idx_places_price (price, id)
 );
 
 -- Table amenities
@@ -46,7 +58,8 @@ CREATE TABLE IF NOT EXISTS reviews (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
-    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_reviews_place_id (place_id)
 );
 
 -- Table de relation place_amenity (Many-to-Many)
@@ -56,4 +69,12 @@ CREATE TABLE IF NOT EXISTS place_amenity (
     PRIMARY KEY (place_id, amenity_id),
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     FOREIGN KEY (amenity_id) REFERENCES amenities(id) ON DELETE CASCADE
-); 
\ No newline at end of file
+); 
+-- Compteurs de version par table (ETag des listes), incrémentés par chaque écriture
+CREATE TABLE IF NOT EXISTS collection_versions (
+    table_name VARCHAR(64) PRIMARY KEY,
+    version INT NOT NULL DEFAULT 0
+);
+
+INSERT IGNORE INTO collection_versions (table_name, version) VALUES
+    ('users', 0), ('places', 0), ('amenities', 0), ('reviews', 0), ('place_amenity', 0);
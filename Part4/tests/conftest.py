@@ -0,0 +1,50 @@
+#Part4/tests/conftest.py
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app import create_app, db
+
+
+@pytest.fixture
+def testing_app(request):
+    """
+    Create a TestingConfig app with an empty in-memory database.
+
+    Test classes opt in with @pytest.mark.usefixtures('testing_app') and find
+    the app, its test client and its pushed app context as self.app,
+    self.client and self.ctx. The fixture runs before setUp, so setUp only
+    adds its own rows and config overrides.
+    """
+    app = create_app("config.TestingConfig")
+    ctx = app.app_context()
+    ctx.push()
+    db.create_all()
+    if request.instance is not None:
+        request.instance.app = app
+        request.instance.client = app.test_client()
+        request.instance.ctx = ctx
+    yield app
+    db.session.remove()
+    db.drop_all()
+    ctx.pop()
+
+
+@pytest.fixture
+def statements(request):
+    """
+    Record the SQL statements run during a test, in order.
+
+    Test classes opt in with @pytest.mark.usefixtures('statements') and read
+    the list as self.statements. The listener is attached before setUp, so
+    setUp clears the list once its fixtures are stored.
+    """
+    recorded = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', count)
+    if request.instance is not None:
+        request.instance.statements = recorded
+    yield recorded
+    event.remove(Engine, 'before_cursor_execute', count)
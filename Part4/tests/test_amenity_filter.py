@@ -0,0 +1,123 @@
+#Part4/tests/test_amenity_filter.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
+from app.persistence.bitmap import BitmapIndex, CHUNK_BITS
+from app.persistence.versions import CollectionVersions
+from app.services import facade
+
+
+class TestBitmapIndex(unittest.TestCase):
+    def test_intersection_pages_across_chunks(self):
+        """Test AND of keys with pagination spanning several bitset chunks."""
+        index = BitmapIndex()
+        count = 2 * CHUNK_BITS + 10
+        for i in range(count):
+            if i % 2 == 0:
+                index.add('wifi', str(i))
+            if i % 3 == 0:
+                index.add('pool', str(i))
+        expected = sorted(str(i) for i in range(count) if i % 6 == 0)
+
+        found, after = [], None
+        while True:
+            page, after = index.page(['wifi', 'pool'], after, limit=5000)
+            found.extend(page)
+            if after is None:
+                break
+        self.assertEqual(found, expected)
+        self.assertEqual(index.page(['wifi', 'sauna'])[0], [])
+
+    def test_discard_and_remove(self):
+        index = BitmapIndex()
+        for obj_id in ('c', 'a', 'b'):
+            index.add('wifi', obj_id)
+        index.add('pool', 'c')
+        index.discard('wifi', 'a')
+        self.assertEqual(index.page(['wifi']), (['b', 'c'], None))
+        index.remove('c')
+        self.assertNotIn('c', index)
+        self.assertEqual(index.page(['wifi']), (['b'], None))
+        self.assertEqual(index.page(['pool']), ([], None))
+
+    def test_pages_follow_ids_not_ordinals(self):
+        """Test that a cursor resumes at the same id whatever order the index was filled in."""
+        first, second = BitmapIndex(), BitmapIndex()
+        for obj_id in ('d', 'b', 'a', 'c'):
+            first.add('wifi', obj_id)
+        for obj_id in ('a', 'b', 'c', 'd'):
+            second.add('wifi', obj_id)
+        page, after = first.page(['wifi'], limit=2)
+        self.assertEqual((page, after), (['a', 'b'], 'b'))
+        self.assertEqual(second.page(['wifi'], after, limit=2), (['c', 'd'], None))
+        self.assertEqual(second.page(['wifi'], 'bb', limit=2), (['c', 'd'], None))
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestAmenityFilterEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.owner = User("Owner", "One", "owner@example.com", password="secret")
+        self.wifi, self.pool = Amenity("WiFi"), Amenity("Pool")
+        db.session.add_all([self.owner, self.wifi, self.pool])
+        db.session.commit()
+
+    def create_place(self, title, price, amenities):
+        return facade.create_place({'title': title, 'description': "", 'price': price, 'latitude': 0,
+                                    'longitude': 0, 'owner_id': self.owner.id,
+                                    'amenities': [amenity.id for amenity in amenities]})
+
+    def titles(self, query):
+        response = self.client.get('/api/v1/places/?amenities=' + query)
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual([place['id'] for place in data], sorted(place['id'] for place in data))
+        return sorted(place['title'] for place in data)
+
+    def test_filter_follows_links(self):
+        """Test that the bitmaps follow places created before and after they are loaded."""
+        self.create_place("Loft", 1, [self.wifi])
+        both = self.create_place("Villa", 2, [self.wifi, self.pool])
+        self.assertEqual(self.titles(self.wifi.id), ["Loft", "Villa"])
+        self.assertEqual(self.titles(f"{self.wifi.id},{self.pool.id}"), ["Villa"])
+
+        self.create_place("Resort", 3, [self.pool, self.wifi])
+        both.amenities.remove(self.pool)
+        db.session.commit()
+        self.assertEqual(self.titles(f"{self.wifi.id},{self.pool.id}"), ["Resort"])
+
+    def test_writes_of_other_workers_are_seen(self):
+        """Test that links written without this process' ORM events reach the bitmaps."""
+        place = self.create_place("Loft", 1, [self.wifi])
+        self.assertEqual(self.titles(self.pool.id), [])
+        # Another worker's write: only the database and its collection versions change
+        with db.engine.begin() as connection:
+            connection.execute(place_amenity.insert().values(place_id=place.id, amenity_id=self.pool.id))
+            CollectionVersions().bump([place_amenity.name], connection)
+        self.assertEqual(self.titles(self.pool.id), ["Loft"])
+
+    def test_deleted_places_leave_the_bitmaps(self):
+        place = self.create_place("Loft", 1, [self.wifi])
+        self.assertEqual(self.titles(self.wifi.id), ["Loft"])
+        db.session.delete(db.session.get(Place, place.id))
+        db.session.commit()
+        self.assertEqual(self.titles(self.wifi.id), [])
+        self.assertNotIn(place.id, facade._amenity_bitmaps())
+
+    def test_rolled_back_links_are_ignored(self):
+        place = self.create_place("Loft", 1, [self.wifi])
+        self.titles(self.wifi.id)
+        place.amenities.append(self.pool)
+        db.session.rollback()
+        self.assertEqual(self.titles(self.pool.id), [])
+
+    def test_unknown_amenity_is_rejected_on_create(self):
+        with self.assertRaises(ValueError):
+            facade.create_place({'title': "Loft", 'description': "", 'price': 1, 'latitude': 0,
+                                 'longitude': 0, 'owner_id': self.owner.id, 'amenities': ["missing"]})
+
+
+if __name__ == '__main__':
+    unittest.main()
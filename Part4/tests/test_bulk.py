@@ -0,0 +1,125 @@
+#Part4/tests/test_bulk.py
+import json
+import unittest
+import pytest
+from unittest import mock
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.models.review import Review
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestBulkEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.owner = User("Owner", "One", "owner@example.com", password="secret")
+        self.guest = User("Guest", "Two", "guest@example.com", password="secret")
+        self.wifi = Amenity("WiFi")
+        db.session.add_all([self.owner, self.guest, self.wifi])
+        db.session.commit()
+        self.place = Place("Loft", "", 100, 0, 0, self.owner.id)
+        db.session.add(self.place)
+        db.session.commit()
+
+    def headers(self, user, is_admin=False):
+        token = create_access_token(identity={'id': user.id, 'is_admin': is_admin})
+        return {'Authorization': f"Bearer {token}"}
+
+    def test_valid_items_are_created_and_invalid_ones_reported(self):
+        response = self.client.post('/api/v1/amenities/bulk', headers=self.headers(self.owner, True),
+                                    json=[{'name': "Pool"}, {'name': ""}, "not an object", {'name': "Sauna"}])
+        self.assertEqual(response.status_code, 201)
+        body = response.get_json()
+        self.assertEqual(body['created'], 2)
+        self.assertEqual([error['index'] for error in body['errors']], [1, 2])
+        self.assertEqual(sorted(amenity.name for amenity in Amenity.query), ["Pool", "Sauna", "WiFi"])
+
+    def test_no_valid_item_answers_400(self):
+        response = self.client.post('/api/v1/amenities/bulk', headers=self.headers(self.owner, True),
+                                    json=[{'name': ""}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['created'], 0)
+        response = self.client.post('/api/v1/amenities/bulk', headers=self.headers(self.owner, True),
+                                    json={'name': "Pool"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_amenity_and_review_imports_need_an_admin(self):
+        for url in ('/api/v1/amenities/bulk', '/api/v1/reviews/bulk'):
+            self.assertEqual(self.client.post(url, headers=self.headers(self.owner), json=[]).status_code, 403)
+
+    def test_ndjson_lines_are_indexed_like_array_items(self):
+        body = '\n'.join([json.dumps({'name': "Pool"}), '{broken', '', json.dumps({'name': "Sauna"})])
+        response = self.client.post('/api/v1/amenities/bulk', headers=self.headers(self.owner, True),
+                                    data=body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 201)
+        body = response.get_json()
+        self.assertEqual(body['created'], 2)
+        self.assertEqual([error['index'] for error in body['errors']], [1])
+        self.assertTrue(body['errors'][0]['error'].startswith("Invalid JSON"))
+
+    def test_too_many_items_answers_413(self):
+        with mock.patch('app.api.v1.bulk.MAX_BULK_ITEMS', 2):
+            response = self.client.post('/api/v1/amenities/bulk', headers=self.headers(self.owner, True),
+                                        json=[{'name': "A"}, {'name': "B"}, {'name': "C"}])
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(Amenity.query.count(), 1)
+
+    def test_reviews_of_missing_places_or_users_are_rejected(self):
+        """Test that unknown place and user ids are reported per item and the rest imported."""
+        items = [
+            {'text': "Great", 'rating': 5, 'place_id': self.place.id, 'user_id': self.guest.id},
+            {'text': "Lost", 'rating': 4, 'place_id': "missing", 'user_id': self.guest.id},
+            {'text': "Ghost", 'rating': 3, 'place_id': self.place.id, 'user_id': "missing"},
+            {'text': "Bad", 'rating': 9, 'place_id': self.place.id, 'user_id': self.guest.id},
+            {'text': "Fine", 'rating': 3, 'place_id': self.place.id, 'user_id': self.owner.id},
+        ]
+        response = self.client.post('/api/v1/reviews/bulk', headers=self.headers(self.owner, True), json=items)
+        self.assertEqual(response.status_code, 201)
+        body = response.get_json()
+        self.assertEqual(body['created'], 1)
+        self.assertEqual([(error['index'], error['error']) for error in body['errors']], [
+            (1, "Place not found"), (2, "User not found"), (3, "Rating must be between 1 and 5"),
+            (4, "User cannot review their own place")])
+        db.session.expire_all()
+        self.assertEqual(Review.query.count(), 1)
+        self.assertEqual((self.place.review_count, self.place.rating_sum), (1, 5))
+
+    def test_reviews_follow_the_one_review_per_place_rule(self):
+        """Test that stored reviews and earlier items of the batch both count as a user's review."""
+        other = Place("Cabin", "", 80, 1, 1, self.owner.id)
+        db.session.add(other)
+        db.session.add(Review("Nice", 4, self.place.id, self.guest.id))
+        db.session.commit()
+        items = [
+            {'text': "Again", 'rating': 5, 'place_id': self.place.id, 'user_id': self.guest.id},
+            {'text': "Cosy", 'rating': 4, 'place_id': other.id, 'user_id': self.guest.id},
+            {'text': "Twice", 'rating': 2, 'place_id': other.id, 'user_id': self.guest.id},
+        ]
+        response = self.client.post('/api/v1/reviews/bulk', headers=self.headers(self.owner, True), json=items)
+        body = response.get_json()
+        self.assertEqual(body['created'], 1)
+        self.assertEqual([(error['index'], error['error']) for error in body['errors']], [
+            (0, "User has already reviewed this place"), (2, "User has already reviewed this place")])
+
+    def test_places_of_non_admins_belong_to_them(self):
+        items = [
+            {'title': "Villa", 'description': "", 'price': 200, 'latitude': 1, 'longitude': 1,
+             'owner_id': self.guest.id, 'amenities': [self.wifi.id]},
+            {'title': "Cabin", 'description': "", 'price': 90, 'latitude': 1, 'longitude': 1,
+             'owner_id': self.guest.id, 'amenities': ["missing"]},
+        ]
+        response = self.client.post('/api/v1/places/bulk', headers=self.headers(self.owner), json=items)
+        self.assertEqual(response.status_code, 201)
+        body = response.get_json()
+        self.assertEqual(body['created'], 1)
+        self.assertEqual(body['errors'][0]['index'], 1)
+        self.assertIn("Invalid amenities", body['errors'][0]['error'])
+        villa = db.session.get(Place, body['ids'][0])
+        self.assertEqual(villa.owner_id, self.owner.id)
+        self.assertEqual([amenity.id for amenity in villa.amenities], [self.wifi.id])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#Part4/tests/test_compression.py
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import pytest
+from app import create_app
+from app.assets import IMMUTABLE, build_assets
+from app.services import facade
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        for i in range(40):
+            facade.create_amenity({'name': f"Amenity {i}"})
+
+    def test_large_json_is_gzipped(self):
+        plain = self.client.get('/api/v1/amenities/?per_page=100')
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.headers['Vary'])
+
+        packed = self.client.get('/api/v1/amenities/?per_page=100', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(packed.headers['Content-Encoding'], 'gzip')
+        self.assertLess(len(packed.data), len(plain.data))
+        self.assertEqual(json.loads(gzip.decompress(packed.data)), plain.get_json())
+
+    def test_small_body_is_sent_as_is(self):
+        self.app.config['COMPRESS_MIN_SIZE'] = 1 << 20
+        response = self.client.get('/api/v1/amenities/?per_page=100', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_compressed_etag_still_validates(self):
+        url = '/api/v1/amenities/?per_page=100'
+        packed = self.client.get(url, headers={'Accept-Encoding': 'gzip'})
+        etag = packed.headers['ETag']
+        self.assertTrue(etag.endswith('-gzip"'))
+        cached = self.client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.headers['ETag'], etag)
+
+
+class TestStaticAssets(unittest.TestCase):
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.target = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.source, 'images'))
+        with open(os.path.join(self.source, 'images', 'logo.png'), 'wb') as f:
+            f.write(b'\x89PNG fake image')
+        with open(os.path.join(self.source, 'styles.css'), 'w') as f:
+            f.write("header { background: url(images/logo.png); }\n" * 50)
+        with open(os.path.join(self.source, 'index.html'), 'w') as f:
+            f.write('<link rel="stylesheet" href="styles.css">\n<img src="images/logo.png">\n'
+                    + '<p>HBnB</p>\n' * 50)
+        self.manifest = build_assets(self.source, self.target)
+        self.app = create_app("config.TestingConfig")
+        self.app.config['FRONTEND_BUILD_DIR'] = self.target
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        shutil.rmtree(self.source)
+        shutil.rmtree(self.target)
+
+    def read(self, path):
+        with open(os.path.join(self.target, path)) as f:
+            return f.read()
+
+    def test_build_hashes_and_rewrites(self):
+        css, logo = self.manifest['styles.css'], self.manifest['images/logo.png']
+        self.assertEqual(self.manifest['index.html'], 'index.html')
+        self.assertRegex(css, r'^styles\.[0-9a-f]{12}\.css$')
+        self.assertIn(f'href="{css}"', self.read('index.html'))
+        self.assertIn(f'src="{logo}"', self.read('index.html'))
+        self.assertIn(f'url({os.path.basename(logo)})', self.read(css).replace('images/', ''))
+        self.assertTrue(os.path.isfile(os.path.join(self.target, css + '.gz')))
+        self.assertFalse(os.path.isfile(os.path.join(self.target, logo + '.gz')))
+
+    def test_serves_precompressed_immutable_files(self):
+        css = self.manifest['styles.css']
+        response = self.client.get(f'/app/{css}', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.headers['Cache-Control'], IMMUTABLE)
+        self.assertEqual(response.mimetype, 'text/css')
+        self.assertEqual(gzip.decompress(response.data).decode(), self.read(css))
+        response.close()
+
+        page = self.client.get('/app/')
+        self.assertEqual(page.headers['Cache-Control'], 'no-cache')
+        self.assertNotIn('Content-Encoding', page.headers)
+        page.close()
+        self.assertEqual(self.client.get('/app/missing.js').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
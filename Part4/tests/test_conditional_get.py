@@ -0,0 +1,92 @@
+#Part4/tests/test_conditional_get.py
+import unittest
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import update
+from werkzeug.http import http_date, parse_date
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.persistence.versions import COLLECTION_VERSIONS_KEY, collection_versions, collection_versions_table
+from app.services import facade
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestConditionalGet(unittest.TestCase):
+    def setUp(self):
+        self.amenity = facade.create_amenity({'name': "WiFi"})
+
+    def test_resource_etag_round_trip(self):
+        url = f'/api/v1/amenities/{self.amenity.id}'
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+
+        cached = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+        self.assertEqual(cached.headers['ETag'], etag)
+
+        facade.update_amenity(self.amenity.id, {'name': "Fibre"})
+        changed = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.get_json()['name'], "Fibre")
+        self.assertNotEqual(changed.headers['ETag'], etag)
+
+    def test_if_modified_since(self):
+        url = f'/api/v1/amenities/{self.amenity.id}'
+        last_modified = parse_date(self.client.get(url).headers['Last-Modified'])
+        # updated_at is stamped in UTC, as the header says
+        self.assertLess(abs(last_modified - datetime.now(timezone.utc)), timedelta(minutes=1))
+        later = http_date(datetime.utcnow() + timedelta(days=1))
+        earlier = http_date(datetime.utcnow() - timedelta(days=1))
+        self.assertEqual(self.client.get(url, headers={'If-Modified-Since': later}).status_code, 304)
+        self.assertEqual(self.client.get(url, headers={'If-Modified-Since': earlier}).status_code, 200)
+        self.assertEqual(self.client.get('/api/v1/amenities/unknown',
+                                         headers={'If-None-Match': '*'}).status_code, 404)
+
+    def test_collection_version_bumped_on_commit(self):
+        """Test that list ETags follow the table versions, including bulk and relationship writes."""
+        etag = self.client.get('/api/v1/places/').headers['ETag']
+        self.assertEqual(self.client.get('/api/v1/places/', headers={'If-None-Match': etag}).status_code, 304)
+        self.assertNotEqual(self.client.get('/api/v1/places/?limit=1').headers['ETag'], etag)
+
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        db.session.add(owner)
+        db.session.commit()
+        before = collection_versions().get('places')
+        facade.create_places_bulk([{'title': "Loft", 'price': 100, 'latitude': 1, 'longitude': 1,
+                                    'owner_id': owner.id, 'amenities': [self.amenity.id]}])
+        self.assertEqual(collection_versions().get('places'), before + 1)
+        self.assertEqual(collection_versions().get('place_amenity'), 1)
+        self.assertEqual(self.client.get('/api/v1/places/', headers={'If-None-Match': etag}).status_code, 200)
+
+        place = Place("Cabin", "", 80, 2, 2, owner.id)
+        db.session.add(place)
+        db.session.commit()
+        version = collection_versions().get('places')
+        place.amenities.append(self.amenity)
+        db.session.commit()
+        self.assertEqual(collection_versions().get('places'), version + 1)
+
+    def test_versions_are_shared_between_workers(self):
+        """Test that list validators come from the database, not from the process."""
+        etag = self.client.get('/api/v1/amenities/').headers['ETag']
+        # A new worker reads the same versions
+        self.app.extensions.pop(COLLECTION_VERSIONS_KEY)
+        self.assertEqual(self.client.get('/api/v1/amenities/', headers={'If-None-Match': etag}).status_code, 304)
+        # A write committed by another worker changes them
+        db.session.execute(update(collection_versions_table).where(
+            collection_versions_table.c.table_name == 'amenities').values(version=5))
+        db.session.commit()
+        self.assertEqual(self.client.get('/api/v1/amenities/', headers={'If-None-Match': etag}).status_code, 200)
+
+    def test_rolled_back_write_keeps_version(self):
+        facade.get_amenity(self.amenity.id).name = "Draft"
+        db.session.flush()
+        db.session.rollback()
+        self.assertEqual(collection_versions().get('amenities'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
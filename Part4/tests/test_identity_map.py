@@ -0,0 +1,52 @@
+#Part4/tests/test_identity_map.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.services import facade
+
+
+@pytest.mark.usefixtures('testing_app', 'statements')
+class TestRequestIdentityMap(unittest.TestCase):
+    def setUp(self):
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        place = Place("Loft", "", 100, 1, 1, owner.id)
+        db.session.add_all([owner, place])
+        db.session.commit()
+        self.owner_id, self.place_id = owner.id, place.id
+        # Start from an empty session, like a new request
+        db.session.remove()
+        self.statements.clear()
+
+    def selects(self):
+        return [statement for statement in self.statements if statement.lstrip().startswith('SELECT')]
+
+    def test_update_place_loads_the_place_once(self):
+        """Test that the route's lookup, update_place and the repository share one loaded place."""
+        place = facade.get_place(self.place_id)
+        updated = facade.update_place(self.place_id, {'title': "Sunny loft", 'price': 120})
+        self.assertIs(updated, place)
+        self.assertEqual((updated.title, updated.price), ("Sunny loft", 120))
+        self.assertEqual(len(self.selects()), 1)
+
+        db.session.remove()
+        self.assertEqual(facade.get_place(self.place_id).title, "Sunny loft")
+
+    def test_objects_stay_loaded_across_commits(self):
+        place = facade.get_place(self.place_id)
+        facade.create_amenity({'name': "WiFi"})
+        self.statements.clear()
+        self.assertIs(facade.get_place(self.place_id), place)
+        self.assertEqual(place.title, "Loft")
+        self.assertEqual(self.statements, [])
+
+    def test_locked_lookup_reads_the_row_again(self):
+        place = facade.get_place(self.place_id)
+        db.session.execute(Place.__table__.update().values(review_count=7))
+        self.assertEqual(facade.place_repo.get(self.place_id, lock=True).review_count, 7)
+        self.assertEqual(place.review_count, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#Part4/tests/test_jwt_cache.py
+import unittest
+from unittest import mock
+import jwt as pyjwt
+import pytest
+from flask_jwt_extended import create_access_token
+from flask_jwt_extended.tokens import _decode_jwt
+from app.tokens import ClaimsCache, claims_cache
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestClaimsCache(unittest.TestCase):
+    def test_entries_expire_with_the_token(self):
+        clock = FakeClock()
+        cache = ClaimsCache(clock=clock)
+        cache.put("token", {'sub': "a", 'exp': clock.now + 10})
+        self.assertEqual(cache.get("token")['sub'], "a")
+        clock.now += 11
+        self.assertIsNone(cache.get("token"))
+        cache.put("expired", {'sub': "a", 'exp': clock.now - 1})
+        self.assertIsNone(cache.get("expired"))
+
+    def test_bounded(self):
+        cache = ClaimsCache(maxsize=2)
+        for token in ("a", "b", "c"):
+            cache.put(token, {'sub': token})
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), {'sub': "c"})
+
+    def test_returns_copies(self):
+        cache = ClaimsCache()
+        cache.put("token", {'sub': "a"})
+        cache.get("token")['sub'] = "b"
+        self.assertEqual(cache.get("token")['sub'], "a")
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestCachedVerification(unittest.TestCase):
+    def get(self, token):
+        return self.client.get('/api/v1/auth/protected', headers={'Authorization': f"Bearer {token}"})
+
+    def test_token_verified_once(self):
+        token = create_access_token(identity={'id': "user-1", 'is_admin': False})
+        with mock.patch('flask_jwt_extended.jwt_manager._decode_jwt', wraps=_decode_jwt) as decode:
+            for _ in range(3):
+                response = self.get(token)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.get_json()['message'], "Hello, user user-1")
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual((claims_cache().hits, claims_cache().misses), (2, 1))
+
+    def test_tampered_token_is_rejected(self):
+        token = create_access_token(identity={'id': "user-1", 'is_admin': False})
+        self.assertEqual(self.get(token).status_code, 200)
+        header, payload, signature = token.split('.')
+        forged = '.'.join((header, payload, signature[:-2] + ('AA' if signature[-2:] != 'AA' else 'BB')))
+        self.assertEqual(self.get(forged).status_code, 422)
+
+    def test_hs256_profile(self):
+        self.app.config.update(JWT_ALGORITHM='HS256', JWT_DECODE_ALGORITHMS=['HS256'])
+        token = create_access_token(identity={'id': "user-1", 'is_admin': False})
+        self.assertEqual(pyjwt.get_unverified_header(token)['alg'], 'HS256')
+        self.assertEqual(self.get(token).status_code, 200)
+
+    def test_cache_disabled(self):
+        self.app.config['JWT_CLAIMS_CACHE_ENABLED'] = False
+        token = create_access_token(identity={'id': "user-1", 'is_admin': False})
+        self.assertEqual(self.get(token).status_code, 200)
+        self.assertEqual(self.get(token).status_code, 200)
+        self.assertEqual(claims_cache().hits + claims_cache().misses, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#Part4/tests/test_object_cache.py
+import json
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.persistence.cache import LocalCache, object_cache
+from app.services import facade
+from app.services.facade import HBnBFacade
+
+
+class StubRedis:
+    """Stands in for redis.Redis: bytes values, set(name, value, ex) and delete(*names)."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, ex=None):
+        if not isinstance(value, bytes):
+            raise TypeError("Redis only stores bytes")
+        self.data[name] = value
+        self.expiry[name] = ex
+        return True
+
+    def delete(self, *names):
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+
+class TestLocalCache(unittest.TestCase):
+    def test_lru_eviction_and_ttl(self):
+        now = [0.0]
+        cache = LocalCache(maxsize=2, clock=lambda: now[0])
+        cache.set('a', b'1', ex=10)
+        cache.set('b', b'2')
+        cache.get('a')
+        cache.set('c', b'3')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c')), (b'1', b'3'))
+        now[0] = 10.0
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('c'), b'3')
+        self.assertEqual(cache.delete('c', 'missing'), 1)
+
+
+@pytest.mark.usefixtures('testing_app', 'statements')
+class TestCachedRepository(unittest.TestCase):
+    def setUp(self):
+        self.redis = StubRedis()
+        self.app.config['OBJECT_CACHE_BACKEND'] = self.redis
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        place = Place("Loft", "", 100, 1, 1, owner.id)
+        db.session.add_all([owner, place])
+        db.session.commit()
+        self.owner_id, self.place_id = owner.id, place.id
+        db.session.remove()
+        self.statements.clear()
+
+    def test_read_through(self):
+        """Test that a later request reads the place from the cache without a query."""
+        self.assertEqual(facade.get_place(self.place_id).title, "Loft")
+        self.assertIn(f"hbnb:places:{self.place_id}", self.redis.data)
+        self.assertEqual(self.redis.expiry[f"hbnb:places:{self.place_id}"], 300)
+        db.session.remove()
+        self.statements.clear()
+
+        place = facade.get_place(self.place_id)
+        self.assertEqual((place.title, place.price), ("Loft", 100))
+        self.assertEqual(self.statements, [])
+        self.assertEqual(place.owner.email, "owner@example.com")
+        self.assertEqual(object_cache().stats()['hits'], 1)
+
+    def test_off_without_shared_backend(self):
+        """Test that by default the process-local cache stays off, so every read queries."""
+        self.app.config['OBJECT_CACHE_BACKEND'] = None
+        facade.get_place(self.place_id)
+        db.session.remove()
+        self.statements.clear()
+
+        facade.get_place(self.place_id)
+        self.assertNotEqual(self.statements, [])
+        self.assertEqual(self.redis.data, {})
+
+    def test_writes_invalidate_exactly(self):
+        facade.get_place(self.place_id)
+        facade.get_user(self.owner_id)
+        db.session.remove()
+
+        facade.update_place(self.place_id, {'title': "Sunny loft"})
+        self.assertNotIn(f"hbnb:places:{self.place_id}", self.redis.data)
+        self.assertIn(f"hbnb:users:{self.owner_id}", self.redis.data)
+        db.session.remove()
+        self.assertEqual(facade.get_place(self.place_id).title, "Sunny loft")
+
+    def test_user_entry_leaves_out_password(self):
+        """Test that cached users carry no password hash, which loads on first access instead."""
+        password_hash = facade.get_user(self.owner_id).password
+        entry = json.loads(self.redis.data[f"hbnb:users:{self.owner_id}"])
+        self.assertEqual(entry['email'], "owner@example.com")
+        self.assertNotIn('password', entry)
+        self.assertNotIn(password_hash.encode(), self.redis.data[f"hbnb:users:{self.owner_id}"])
+        db.session.remove()
+        self.statements.clear()
+
+        user = facade.get_user(self.owner_id)
+        self.assertEqual(user.first_name, "Owner")
+        self.assertEqual(self.statements, [])
+        self.assertTrue(user.verify_password("secret"))
+        self.assertEqual(len(self.statements), 1)
+
+    def test_entries_are_json_and_keep_column_types(self):
+        """Test that entries hold JSON data and load back with their datetimes."""
+        created_at = facade.get_place(self.place_id).created_at
+        entry = json.loads(self.redis.data[f"hbnb:places:{self.place_id}"])
+        self.assertEqual(entry['created_at'], created_at.isoformat())
+        db.session.remove()
+        self.assertEqual(facade.get_place(self.place_id).created_at, created_at)
+
+    def test_new_facades_add_no_listeners(self):
+        """Test that building repositories does not register mapper listeners again."""
+        listeners = len(Place.__mapper__.dispatch.after_update)
+        for _ in range(3):
+            HBnBFacade()
+        self.assertEqual(len(Place.__mapper__.dispatch.after_update), listeners)
+
+    def test_rolled_back_write_keeps_entry(self):
+        facade.get_place(self.place_id)
+        db.session.remove()
+        place = facade.get_place(self.place_id)
+        place.title = "Draft"
+        db.session.flush()
+        db.session.rollback()
+        self.assertIn(f"hbnb:places:{self.place_id}", self.redis.data)
+
+    def test_review_updates_cached_place_aggregates(self):
+        facade.get_place(self.place_id)
+        db.session.remove()
+        guest = User("Guest", "Two", "guest@example.com", password="secret")
+        db.session.add(guest)
+        db.session.commit()
+        facade.create_review({'text': "Nice", 'rating': 4, 'place_id': self.place_id, 'user_id': guest.id})
+        db.session.remove()
+        self.assertEqual(facade.get_place(self.place_id).review_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
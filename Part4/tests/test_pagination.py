@@ -0,0 +1,94 @@
+#Part4/tests/test_pagination.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.api.v1.pagination import MAX_PAGE_SIZE
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestKeysetPagination(unittest.TestCase):
+    def setUp(self):
+        self.owner = User("Owner", "One", "owner@example.com", password="secret")
+        db.session.add(self.owner)
+        db.session.commit()
+
+    def walk(self, url, limit):
+        """Follow the next cursors from the first page; return the pages' item lists."""
+        pages, after = [], None
+        while True:
+            query = f'{url}?limit={limit}' + (f'&after={after}' if after else '')
+            response = self.client.get(query)
+            self.assertEqual(response.status_code, 200)
+            body = response.get_json()
+            pages.append(body['data'])
+            after = body['next']
+            if after is None:
+                return pages
+
+    def test_cursors_walk_every_row_once_in_id_order(self):
+        amenities = [Amenity(f"Amenity {i}") for i in range(7)]
+        db.session.add_all(amenities)
+        db.session.commit()
+        pages = self.walk('/api/v1/amenities/', 3)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        ids = [item['id'] for page in pages for item in page]
+        self.assertEqual(ids, sorted(amenity.id for amenity in amenities))
+
+    def test_full_last_page_has_no_cursor(self):
+        db.session.add_all([Amenity(f"Amenity {i}") for i in range(4)])
+        db.session.commit()
+        self.assertEqual([len(page) for page in self.walk('/api/v1/amenities/', 2)], [2, 2])
+
+    def test_cursor_is_not_shifted_by_rows_inserted_before_it(self):
+        """Test that a row created between two pages neither repeats nor hides later rows."""
+        amenities = [Amenity(f"Amenity {i}") for i in range(4)]
+        db.session.add_all(amenities)
+        db.session.commit()
+        first = self.client.get('/api/v1/amenities/?limit=2').get_json()
+        early = Amenity("Early")
+        early.id = '0' * 8 + first['next'][8:]
+        db.session.add(early)
+        db.session.commit()
+        second = self.client.get(f"/api/v1/amenities/?limit=2&after={first['next']}").get_json()
+        seen = [item['id'] for item in first['data'] + second['data']]
+        self.assertEqual(seen, sorted(amenity.id for amenity in amenities))
+
+    def test_limit_is_clamped(self):
+        db.session.add_all([Amenity(f"Amenity {i}") for i in range(3)])
+        db.session.commit()
+        self.assertEqual(len(self.client.get('/api/v1/amenities/?limit=0').get_json()['data']), 1)
+        self.assertEqual(len(self.client.get('/api/v1/amenities/?limit=-5').get_json()['data']), 1)
+        response = self.client.get(f'/api/v1/amenities/?limit={MAX_PAGE_SIZE * 10}')
+        self.assertEqual(len(response.get_json()['data']), 3)
+
+    def test_sorted_pages_break_ties_on_id(self):
+        """Test that a price sort pages through equal prices without repeating or skipping places."""
+        places = [Place(f"Place {i}", "", price, 0, 0, self.owner.id)
+                  for i, price in enumerate([30, 10, 20, 10, 10, 20])]
+        db.session.add_all(places)
+        db.session.commit()
+        pages, after = [], None
+        while True:
+            response = self.client.get('/api/v1/places/?sort=price&limit=2' + (f'&after={after}' if after else ''))
+            body = response.get_json()
+            pages.append([(item['price'], item['id']) for item in body['data']])
+            after = body['next']
+            if after is None:
+                break
+        found = [entry for page in pages for entry in page]
+        self.assertEqual(found, sorted((place.price, place.id) for place in places))
+
+    def test_unknown_cursor_of_a_sorted_list_is_rejected(self):
+        self.assertEqual(self.client.get('/api/v1/places/?sort=price&after=missing').status_code, 400)
+
+    def test_unknown_cursor_of_an_id_list_is_rejected(self):
+        db.session.add(Amenity("Wifi"))
+        db.session.commit()
+        self.assertEqual(self.client.get('/api/v1/amenities/?after=missing').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#Part4/tests/test_passwords.py
+import os
+import threading
+import unittest
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from app import db
+from app.models.user import User
+from app.passwords import PASSWORD_HASHER_KEY, PasswordHasher, PasswordPoolBusy, hash_rounds
+from app.persistence.repository import unit_of_work
+from app.services import facade
+
+
+class TestPasswordHasher(unittest.TestCase):
+    def test_process_pool_round_trip(self):
+        hasher = PasswordHasher(workers=1, rounds=4)
+        try:
+            hashed = hasher.hash("secret")
+            self.assertEqual(hash_rounds(hashed), 4)
+            self.assertTrue(hasher.verify("secret", hashed))
+            self.assertFalse(hasher.verify("wrong", hashed))
+        finally:
+            hasher.shutdown()
+
+    def test_broken_pool_is_replaced(self):
+        """Test that a crashed worker does not break hashing for the rest of the process."""
+        hasher = PasswordHasher(workers=1, max_pending=2, rounds=4)
+        try:
+            with self.assertRaises(BrokenProcessPool):
+                hasher._run(os._exit, 1)
+            self.assertTrue(hasher.verify("secret", hasher.hash("secret")))
+        finally:
+            hasher.shutdown()
+
+    def test_pool_is_created_per_process(self):
+        """Test that a pool inherited through fork is replaced instead of used."""
+        hasher = PasswordHasher(workers=1, rounds=4)
+        self.assertIsNone(hasher._executor)
+        try:
+            inherited = hasher.start()
+            # As seen from a child forked after the pool was created
+            hasher._pid = -1
+            self.assertIsNot(hasher.start(), inherited)
+            self.assertTrue(hasher.verify("secret", hasher.hash("secret")))
+        finally:
+            hasher.shutdown()
+            inherited.shutdown()
+
+    def test_models_hash_outside_an_application(self):
+        user = User("Guest", "One", "guest@example.com", password="secret")
+        self.assertTrue(user.verify_password("secret"))
+        with self.assertRaises(ValueError):
+            User("Guest", "One", "guest@example.com")
+
+    def test_saturated_pool_refuses_work(self):
+        hasher = PasswordHasher(workers=0, max_pending=1, rounds=4)
+        release = threading.Event()
+        started = threading.Event()
+
+        def hold():
+            started.set()
+            release.wait(5)
+
+        worker = threading.Thread(target=hasher._run, args=(hold,))
+        worker.start()
+        started.wait(5)
+        with self.assertRaises(PasswordPoolBusy):
+            hasher.hash("secret")
+        release.set()
+        worker.join()
+        self.assertEqual(hash_rounds(hasher.hash("secret")), 4)
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestLogin(unittest.TestCase):
+    def setUp(self):
+        self.user = facade.create_user({'first_name': "Guest", 'last_name': "One",
+                                        'email': "guest@example.com", 'password': "secret"})
+
+    def login(self, password="secret"):
+        return self.client.post('/api/v1/auth/login', json={'email': "guest@example.com", 'password': password})
+
+    def test_login(self):
+        self.assertEqual(self.login().status_code, 200)
+        self.assertEqual(self.login("wrong").status_code, 401)
+
+    def test_saturated_pool_answers_429(self):
+        self.app.extensions[PASSWORD_HASHER_KEY] = PasswordHasher(workers=0, max_pending=0)
+        response = self.login()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '1')
+
+    def test_rehash_on_login_when_cost_changes(self):
+        old_hash = self.user.password
+        self.assertEqual(hash_rounds(old_hash), 4)
+        self.app.config['BCRYPT_LOG_ROUNDS'] = 5
+        del self.app.extensions[PASSWORD_HASHER_KEY]
+
+        self.assertIsNone(facade.authenticate("guest@example.com", "wrong"))
+        self.assertEqual(self.user.password, old_hash)
+        self.assertIs(facade.authenticate("guest@example.com", "secret"), self.user)
+        db.session.expire_all()
+        self.assertEqual(hash_rounds(facade.get_user(self.user.id).password), 5)
+        self.assertEqual(self.login().status_code, 200)
+
+    def test_rehash_joins_the_callers_transaction(self):
+        old_hash = self.user.password
+        self.app.config['BCRYPT_LOG_ROUNDS'] = 5
+        del self.app.extensions[PASSWORD_HASHER_KEY]
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                facade.authenticate("guest@example.com", "secret")
+                raise RuntimeError("abort")
+        db.session.expire_all()
+        self.assertEqual(facade.get_user(self.user.id).password, old_hash)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#Part4/tests/test_place_price.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.persistence.repository import InMemoryRepository
+
+
+class Listing:
+    def __init__(self, obj_id, price):
+        self.id = obj_id
+        self.price = price
+
+
+class TestInMemoryPriceRange(unittest.TestCase):
+    def setUp(self):
+        self.repo = InMemoryRepository()
+        self.repo.add_sorted_index('price')
+        for obj_id, price in (('a', 80), ('b', 120), ('c', 150), ('d', 150), ('e', 300)):
+            self.repo.add(Listing(obj_id, price))
+
+    def ids(self, page):
+        return [obj.id for obj in page[0]]
+
+    def test_range_with_cursor(self):
+        """Test inclusive price bounds paged through the sorted index."""
+        page = self.repo.list_page(limit=2, order_by='price', lower=100, upper=150)
+        self.assertEqual((self.ids(page), page[1]), (['b', 'c'], 'c'))
+        page = self.repo.list_page(after_id='c', limit=2, order_by='price', lower=100, upper=150)
+        self.assertEqual((self.ids(page), page[1]), (['d'], None))
+
+    def test_descending_range(self):
+        page = self.repo.list_page(limit=10, order_by='-price', upper=150)
+        self.assertEqual(self.ids(page), ['d', 'c', 'b', 'a'])
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestPlacePriceEndpoint(unittest.TestCase):
+    def setUp(self):
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        db.session.add(owner)
+        # Same price twice, and prices that would sort differently as strings
+        for title, price in (("Tent", 9.5), ("Room", 150), ("Flat", 150), ("Loft", 1000), ("Villa", 99.99)):
+            db.session.add(Place(title, "", price, 0, 0, owner.id))
+        db.session.commit()
+
+    def get(self, query):
+        response = self.client.get('/api/v1/places/' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_price_range_sorted_by_price(self):
+        page = self.get('?min_price=50&max_price=150&limit=2')
+        self.assertEqual([place['price'] for place in page['data']], [99.99, 150])
+        page = self.get('?min_price=50&max_price=150&limit=2&after=' + page['next'])
+        self.assertEqual([place['price'] for place in page['data']], [150])
+        self.assertIsNone(page['next'])
+
+    def test_sort_by_price(self):
+        prices = [place['price'] for place in self.get('?sort=price')['data']]
+        self.assertEqual(prices, [9.5, 99.99, 150, 150, 1000])
+
+    def test_price_filter_with_other_sort_is_rejected(self):
+        self.assertEqual(self.client.get('/api/v1/places/?sort=rating&max_price=100').status_code, 400)
+
+    def test_price_must_be_numeric(self):
+        with self.assertRaises(TypeError):
+            Place("Tent", "", "cheap", 0, 0, "owner")
+
+
+if __name__ == '__main__':
+    unittest.main()
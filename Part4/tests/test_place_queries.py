@@ -0,0 +1,61 @@
+#Part4/tests/test_place_queries.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.models.review import Review
+
+
+@pytest.mark.usefixtures('testing_app', 'statements')
+class TestPlaceListQueries(unittest.TestCase):
+    def setUp(self):
+        self.statements.clear()
+
+    def _seed(self, count, batch):
+        amenities = [Amenity(f"Amenity {i}") for i in range(3)]
+        db.session.add_all(amenities)
+        for i in range(count):
+            owner = User("Owner", str(i), f"owner{batch}.{i}@example.com", password="secret")
+            place = Place(f"Place {i}", "Nice place", batch * 100 + i, 10.0, 20.0, owner.id)
+            place.amenities.extend(amenities)
+            db.session.add_all([owner, place])
+            db.session.add(Review("Great", 5, place.id, owner.id))
+        db.session.commit()
+        db.session.expunge_all()
+
+    def _list_statements(self, query_string):
+        self.statements.clear()
+        response = self.client.get('/api/v1/places/' + query_string)
+        self.assertEqual(response.status_code, 200)
+        # The ETag's read of the collection versions is not a place query
+        queries = [statement for statement in self.statements if 'collection_versions' not in statement]
+        return response.get_json()['data'], len(queries)
+
+    def test_expanded_list_runs_fixed_number_of_statements(self):
+        """Test that nesting owner, amenities and reviews does not add a query per place."""
+        self._seed(5, 1)
+        small, small_count = self._list_statements('?expand=true')
+        self._seed(20, 2)
+        large, large_count = self._list_statements('?expand=true')
+
+        self.assertEqual(len(small), 5)
+        self.assertEqual(len(large), 25)
+        self.assertEqual(small_count, large_count)
+        # places + owners (joined), amenities and reviews (selectin)
+        self.assertEqual(large_count, 3)
+        self.assertTrue(all(len(place['amenities']) == 3 for place in large))
+        self.assertTrue(all(len(place['reviews']) == 1 and place['owner'] for place in large))
+
+    def test_summary_list_runs_single_statement(self):
+        """Test that the default list only selects the places."""
+        self._seed(10, 1)
+        places, count = self._list_statements('')
+        self.assertEqual(len(places), 10)
+        self.assertNotIn('owner', places[0])
+        self.assertEqual(count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#Part4/tests/test_place_ratings.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.services import facade
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestPlaceRatingAggregates(unittest.TestCase):
+    def setUp(self):
+        self.user = User("Guest", "One", "guest@example.com", password="secret")
+        self.beach = Place("Beach", "", 100, 0, 0, self.user.id)
+        self.cabin = Place("Cabin", "", 80, 1, 1, self.user.id)
+        db.session.add_all([self.user, self.beach, self.cabin])
+        db.session.commit()
+
+    def review(self, place, rating):
+        return facade.create_review({'text': "Review", 'rating': rating,
+                                     'place_id': place.id, 'user_id': self.user.id})
+
+    def test_review_writes_update_aggregates(self):
+        """Test that create, update and delete keep count, sum, histogram and average in sync."""
+        first = self.review(self.beach, 5)
+        self.review(self.beach, 2)
+        self.assertEqual((self.beach.review_count, self.beach.rating_sum, self.beach.rating_avg), (2, 7, 3.5))
+        self.assertEqual(self.beach.rating_histogram, [0, 1, 0, 0, 1])
+
+        facade.update_review(first.id, {'rating': 4})
+        self.assertEqual(self.beach.rating_histogram, [0, 1, 0, 1, 0])
+        self.assertEqual(self.beach.rating_avg, 3.0)
+
+        facade.delete_review(first.id)
+        self.assertEqual((self.beach.review_count, self.beach.rating_avg), (1, 2.0))
+        with self.assertRaises(ValueError):
+            facade.update_review(self.beach.reviews[0].id, {'rating': 9})
+        self.assertEqual(self.beach.rating_histogram, [0, 1, 0, 0, 0])
+
+    def test_bulk_reviews_update_aggregates(self):
+        # Reviewers other than the owner, one review each, as the bulk import requires
+        reviewers = [User("Guest", "Two", "two@example.com", password="secret"),
+                     User("Guest", "Three", "three@example.com", password="secret")]
+        db.session.add_all(reviewers)
+        db.session.commit()
+        created, errors = facade.create_reviews_bulk([
+            {'text': "A", 'rating': 3, 'place_id': self.cabin.id, 'user_id': reviewers[0].id},
+            {'text': "B", 'rating': 5, 'place_id': self.cabin.id, 'user_id': reviewers[1].id},
+        ])
+        self.assertEqual((len(created), errors), (2, []))
+        self.assertEqual((self.cabin.review_count, self.cabin.rating_avg), (2, 4.0))
+
+    def test_sort_by_rating(self):
+        self.review(self.beach, 3)
+        self.review(self.cabin, 5)
+        response = self.client.get('/api/v1/places/?sort=rating&limit=1')
+        page = response.get_json()
+        self.assertEqual([place['title'] for place in page['data']], ['Cabin'])
+        response = self.client.get('/api/v1/places/?sort=rating&limit=1&after=' + page['next'])
+        self.assertEqual([place['title'] for place in response.get_json()['data']], ['Beach'])
+
+    def test_repair_command(self):
+        """Test that repair-ratings recomputes aggregates that drifted from the reviews."""
+        self.review(self.beach, 4)
+        self.beach.set_rating_aggregates([9, 0, 0, 0, 0])
+        self.cabin.rating_avg = 2.5
+        db.session.commit()
+
+        result = self.app.test_cli_runner().invoke(args=['repair-ratings'])
+        self.assertIn("2 place(s)", result.output)
+        self.assertEqual((self.beach.review_count, self.beach.rating_avg), (1, 4.0))
+        self.assertEqual(self.cabin.rating_avg, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
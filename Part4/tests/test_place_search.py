@@ -0,0 +1,88 @@
+#Part4/tests/test_place_search.py
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.persistence.bitmap import BitmapIndex
+from app.services import facade
+
+
+class TestBitmapCounts(unittest.TestCase):
+    def test_count_filter_and_counts(self):
+        index = BitmapIndex()
+        for obj_id in 'abcd':
+            index.add('wifi', obj_id)
+        index.add('pool', 'b')
+        index.add('pool', 'd')
+        self.assertEqual(index.count(['wifi', 'pool']), 2)
+        self.assertEqual(index.filter(['pool'], ['d', 'a', 'b', 'x']), ['d', 'b'])
+        self.assertEqual(index.filter(['sauna'], ['a']), [])
+        self.assertEqual(index.counts(['a', 'b']), {'wifi': 2, 'pool': 1})
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestPlaceSearchEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.owner = User("Owner", "One", "owner@example.com", password="secret")
+        self.wifi, self.pool = Amenity("WiFi"), Amenity("Pool")
+        db.session.add_all([self.owner, self.wifi, self.pool])
+        db.session.commit()
+        # Paris-area listings, and one in Lyon
+        self.create_place("Marais", 80, 48.857, 2.362, [self.wifi.id])
+        self.create_place("Bastille", 140, 48.853, 2.369, [self.wifi.id, self.pool.id])
+        self.create_place("Louvre", 260, 48.861, 2.336, [self.wifi.id, self.pool.id])
+        self.create_place("Lyon", 120, 45.764, 4.835, [self.pool.id])
+
+    def create_place(self, title, price, latitude, longitude, amenities):
+        return facade.create_place({'title': title, 'description': "", 'price': price, 'latitude': latitude,
+                                    'longitude': longitude, 'owner_id': self.owner.id,
+                                    'amenities': amenities})
+
+    def search(self, query):
+        response = self.client.get('/api/v1/places/search?' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_combined_filters_and_facets(self):
+        result = self.search(f"near=48.857,2.352&radius_km=5&max_price=200&amenities={self.wifi.id}"
+                             "&price_bucket=100")
+        self.assertEqual(sorted(place['title'] for place in result['data']), ["Bastille", "Marais"])
+        self.assertEqual(result['total'], 2)
+        self.assertEqual(result['facets']['price'], [{'min': 0, 'max': 100, 'count': 1},
+                                                     {'min': 100, 'max': 200, 'count': 1}])
+        counts = {facet['id']: facet['count'] for facet in result['facets']['amenities']}
+        self.assertEqual(counts, {self.wifi.id: 2, self.pool.id: 1})
+        self.assertEqual(set(result['plan']), {'geo', 'price', 'amenities'})
+
+    def test_most_selective_predicate_drives(self):
+        """Test that the plan starts with the predicate keeping the fewest places."""
+        self.assertEqual(self.search(f"amenities={self.wifi.id},{self.pool.id}&min_price=50")['plan'],
+                         ['amenities', 'price'])
+        result = self.search(f"min_price=200&amenities={self.wifi.id}")
+        self.assertEqual(result['plan'], ['price', 'amenities'])
+        self.assertEqual([place['title'] for place in result['data']], ["Louvre"])
+
+    def test_rating_filter_and_pagination(self):
+        review_user = User("Guest", "Two", "guest@example.com", password="secret")
+        db.session.add(review_user)
+        db.session.commit()
+        places = {place.title: place for place in facade.get_all_places()}
+        for title in ("Marais", "Lyon"):
+            facade.create_review({'text': "Nice", 'rating': 5, 'place_id': places[title].id,
+                                  'user_id': review_user.id})
+        first = self.search("min_rating=4&limit=1")
+        self.assertEqual(first['total'], 2)
+        second = self.search("min_rating=4&limit=1&after=" + first['next'])
+        self.assertIsNone(second['next'])
+        self.assertEqual(sorted(page['data'][0]['title'] for page in (first, second)), ["Lyon", "Marais"])
+
+    def test_invalid_filters(self):
+        self.assertEqual(self.client.get('/api/v1/places/search?near=48,2').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/places/search?near=48,2&radius_km=1&bbox=0,0,1,1')
+                         .status_code, 400)
+        self.assertEqual(self.search("bbox=0,0,1,1")['total'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+#Part4/tests/test_place_update.py
+import unittest
+import pytest
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.user import User
+from app.models.place import Place
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestPlaceUpdate(unittest.TestCase):
+    def setUp(self):
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        other = User("Other", "Two", "other@example.com", password="secret")
+        place = Place("Loft", "Bright", 100, 1, 1, owner.id)
+        db.session.add_all([owner, other, place])
+        db.session.commit()
+        self.owner_id, self.other_id, self.place_id = owner.id, other.id, place.id
+        token = create_access_token(identity={'id': owner.id, 'is_admin': False})
+        self.headers = {'Authorization': f"Bearer {token}"}
+
+    def _put(self, data):
+        response = self.client.put(f'/api/v1/places/{self.place_id}', json=data, headers=self.headers)
+        db.session.remove()
+        return response, db.session.get(Place, self.place_id)
+
+    def test_owner_cannot_be_reassigned(self):
+        response, place = self._put({'title': "Sunny loft", 'owner_id': self.other_id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(place.title, "Sunny loft")
+        self.assertEqual(place.owner_id, self.owner_id)
+
+    def test_invalid_value_is_rejected_without_partial_update(self):
+        """Test that a setter error answers 400 and leaves the earlier fields unchanged."""
+        response, place = self._put({'title': "Sunny loft", 'price': -5})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.get_json())
+        self.assertEqual((place.title, place.price), ("Loft", 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#Part4/tests/test_ratelimit.py
+import threading
+import unittest
+import pytest
+from app.persistence.cache import LocalCache
+from app.ratelimit import LoginThrottle, SlidingWindowLimiter
+from app.services import facade
+
+
+class FakeClock:
+    def __init__(self, now=1_000_040.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestSlidingWindowLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.backend = LocalCache(clock=self.clock)
+        self.limiter = SlidingWindowLimiter(self.backend, limit=3, window=60, clock=self.clock)
+
+    def test_limit_within_window(self):
+        for _ in range(3):
+            self.assertEqual(self.limiter.retry_after('a'), 0)
+            self.limiter.hit('a')
+        self.assertEqual(self.limiter.retry_after('a'), 40)
+        self.assertEqual(self.limiter.retry_after('b'), 0)
+
+    def test_previous_window_decays(self):
+        for _ in range(6):
+            self.limiter.hit('a')
+        # 5s into the next window, 6 * 55/60 hits still count
+        self.clock.now += 45
+        self.assertEqual(self.limiter.retry_after('a'), 25)
+        # 30s later, 6 * 25/60 = 2.5 < 3
+        self.clock.now += 30
+        self.assertEqual(self.limiter.retry_after('a'), 0)
+
+    def test_hit_counts_before_comparing(self):
+        self.assertEqual([self.limiter.hit('a') for _ in range(4)], [0, 0, 0, 40])
+        self.limiter.release('a', self.clock.now)
+        self.assertEqual(int(self.backend.get(f"hbnb:limit:a:{int(self.clock.now // 60)}")), 3)
+
+    def test_parallel_hits_stop_at_the_limit(self):
+        """Test that a burst of concurrent hits lets exactly limit of them through."""
+        barrier = threading.Barrier(20)
+        results = []
+
+        def attempt():
+            barrier.wait()
+            results.append(self.limiter.hit('a'))
+
+        threads = [threading.Thread(target=attempt) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(0), 3)
+
+    def test_counters_expire(self):
+        self.limiter.hit('a')
+        self.assertEqual(len(self.backend), 1)
+        self.clock.now += 121
+        self.assertIsNone(self.backend.get(f"hbnb:limit:a:{int((self.clock.now - 121) // 60)}"))
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestLoginThrottle(unittest.TestCase):
+    def setUp(self):
+        self.app.config.update(LOGIN_LIMIT_PER_PAIR=3, LOGIN_LIMIT_PER_ADDRESS=5, LOGIN_LIMIT_PER_EMAIL=8)
+        facade.create_user({'first_name': "Guest", 'last_name': "One",
+                            'email': "guest@example.com", 'password': "secret"})
+
+    def login(self, email, password="wrong", address='10.0.0.1'):
+        return self.client.post('/api/v1/auth/login', json={'email': email, 'password': password},
+                                environ_base={'REMOTE_ADDR': address})
+
+    def test_per_pair_limit(self):
+        for _ in range(3):
+            self.assertEqual(self.login("guest@example.com").status_code, 401)
+        refused = self.login("Guest@Example.com ", "secret")
+        self.assertEqual(refused.status_code, 429)
+        self.assertGreater(int(refused.headers['Retry-After']), 0)
+        # The attacker's address does not lock the user out of their own
+        self.assertEqual(self.login("guest@example.com", "secret", '10.0.0.2').status_code, 200)
+
+    def test_per_email_ceiling(self):
+        for i in range(8):
+            self.assertEqual(self.login("guest@example.com", address=f"10.0.1.{i}").status_code, 401)
+        self.assertEqual(self.login("guest@example.com", "secret", '10.0.0.2').status_code, 429)
+
+    def test_invalid_payload(self):
+        for payload in ([], {'email': "guest@example.com"}, {'email': None, 'password': "secret"}):
+            self.assertEqual(self.client.post('/api/v1/auth/login', json=payload).status_code, 400)
+
+    def test_per_address_limit(self):
+        for i in range(5):
+            self.assertEqual(self.login(f"user{i}@example.com").status_code, 401)
+        self.assertEqual(self.login("guest@example.com", "secret").status_code, 429)
+
+    def test_refused_attempts_skip_verification(self):
+        clock = FakeClock()
+        backend = LocalCache(clock=clock)
+        throttle = LoginThrottle(SlidingWindowLimiter(backend, 1, clock=clock),
+                                 SlidingWindowLimiter(backend, 10, clock=clock),
+                                 SlidingWindowLimiter(backend, 10, clock=clock))
+        self.assertEqual(throttle.check("a@example.com", "10.0.0.1"), 0)
+        self.assertGreater(throttle.check("a@example.com", "10.0.0.1"), 0)
+        # The refused attempt was not counted against the address
+        self.assertEqual(int(backend.get(f"hbnb:limit:ip:10.0.0.1:{int(clock.now // 60)}")), 1)
+
+    def test_disabled(self):
+        self.app.config['LOGIN_LIMIT_ENABLED'] = False
+        for _ in range(6):
+            self.assertEqual(self.login("guest@example.com").status_code, 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#Part4/tests/test_revocation.py
+import unittest
+import pytest
+from flask_jwt_extended import create_access_token
+from app.persistence.cache import LocalCache
+from app.revocation import Denylist
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestDenylist(unittest.TestCase):
+    def test_entries_are_purged_after_expiry(self):
+        clock = FakeClock()
+        denylist = Denylist(clock=clock)
+        denylist.revoke("a", clock.now + 10)
+        denylist.revoke("forever")
+        denylist.revoke("expired", clock.now - 1)
+        self.assertTrue(denylist.is_revoked("a"))
+        self.assertFalse(denylist.is_revoked("expired"))
+        self.assertEqual(len(denylist), 2)
+
+        clock.now += 11
+        denylist.revoke("b", clock.now + 10)
+        self.assertFalse(denylist.is_revoked("a"))
+        self.assertTrue(denylist.is_revoked("forever"))
+        self.assertEqual(len(denylist), 2)
+
+    def test_shared_backend(self):
+        clock = FakeClock()
+        backend = LocalCache(clock=clock)
+        first, second = Denylist(backend, clock=clock), Denylist(backend, clock=clock)
+        first.revoke("a", clock.now + 10)
+        self.assertTrue(second.is_revoked("a"))
+        self.assertFalse(second.is_revoked("b"))
+        clock.now += 11
+        self.assertFalse(second.is_revoked("a"))
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestLogout(unittest.TestCase):
+    def headers(self, token):
+        return {'Authorization': f"Bearer {token}"}
+
+    def test_logout_revokes_only_that_token(self):
+        token = create_access_token(identity={'id': "user-1", 'is_admin': False})
+        other = create_access_token(identity={'id': "user-1", 'is_admin': False})
+        # Verified once already: the claims cache must not hide the revocation
+        self.assertEqual(self.client.get('/api/v1/auth/protected', headers=self.headers(token)).status_code, 200)
+
+        response = self.client.post('/api/v1/auth/logout', headers=self.headers(token))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get('/api/v1/auth/protected', headers=self.headers(token)).status_code, 401)
+        self.assertEqual(self.client.post('/api/v1/auth/logout', headers=self.headers(token)).status_code, 401)
+        self.assertEqual(self.client.get('/api/v1/auth/protected', headers=self.headers(other)).status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
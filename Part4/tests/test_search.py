@@ -0,0 +1,89 @@
+#Part4/tests/test_search.py
+import unittest
+import pytest
+from sqlalchemy import text
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.persistence.search import InvertedIndex
+from app.services import facade
+
+
+class TestInvertedIndex(unittest.TestCase):
+    def test_bm25_ranking_and_removal(self):
+        index = InvertedIndex()
+        index.set_part('a', 'loft', "Sunny loft near the beach")
+        index.set_part('b', 'cabin', "Cabin in the woods")
+        index.set_part('c', 'cabin', "Quiet cabin, beach at walking distance")
+        index.set_part('d', 'flat', "Flat downtown")
+        self.assertEqual([doc for doc, _ in index.search("cabin beach")], ['cabin', 'loft'])
+        index.remove_part('c')
+        self.assertEqual([doc for doc, _ in index.search("beach")], ['loft'])
+        index.set_part('a', 'loft', "Loft downtown")
+        self.assertEqual(index.search("beach"), [])
+        self.assertEqual(len(index), 3)
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestFullTextSearch(unittest.TestCase):
+    backend = 'fts5'
+
+    def setUp(self):
+        self.app.config['SEARCH_BACKEND'] = self.backend
+        self.user = User("Guest", "One", "guest@example.com", password="secret")
+        self.loft = Place("Sunny loft", "Bright loft with a terrace", 120, 0, 0, self.user.id)
+        self.cabin = Place("Mountain cabin", "Wood stove and hiking trails", 90, 1, 1, self.user.id)
+        db.session.add_all([self.user, self.loft, self.cabin])
+        db.session.commit()
+
+    def search(self, query):
+        response = self.client.get('/api/v1/search/?q=' + query)
+        self.assertEqual(response.status_code, 200)
+        return [place['title'] for place in response.get_json()['data']]
+
+    def test_search_titles_and_descriptions(self):
+        self.assertEqual(self.search("loft"), ["Sunny loft"])
+        self.assertEqual(sorted(self.search("HIKING terrace")), ["Mountain cabin", "Sunny loft"])
+        self.assertEqual(self.search("castle"), [])
+        self.assertEqual(self.client.get('/api/v1/search/?q=%20').status_code, 400)
+
+    def test_reviews_follow_writes(self):
+        """Test that created, edited and deleted reviews are searchable right after commit."""
+        review = facade.create_review({'text': "Great fireplace", 'rating': 5,
+                                       'place_id': self.cabin.id, 'user_id': self.user.id})
+        self.assertEqual(self.search("fireplace"), ["Mountain cabin"])
+        facade.update_review(review.id, {'text': "Great sauna"})
+        self.assertEqual(self.search("fireplace"), [])
+        self.assertEqual(self.search("sauna"), ["Mountain cabin"])
+        facade.delete_review(review.id)
+        self.assertEqual(self.search("sauna"), [])
+
+    def test_bulk_places_are_searchable(self):
+        created, errors = facade.create_places_bulk([
+            {'title': "Lake house", 'description': "Private pontoon", 'price': 200,
+             'latitude': 2, 'longitude': 2, 'owner_id': self.user.id},
+        ])
+        self.assertEqual((len(created), errors), (1, []))
+        self.assertEqual(self.search("pontoon"), ["Lake house"])
+
+
+    def test_rowid_changes_keep_matches(self):
+        """Test that the FTS rows follow the places when SQLite renumbers rowids, as VACUUM may."""
+        db.session.execute(text("UPDATE places SET rowid = rowid + 100"))
+        db.session.commit()
+        self.assertEqual(self.search("loft"), ["Sunny loft"])
+
+
+class TestLikeSearch(TestFullTextSearch):
+    backend = 'like'
+
+
+class TestInMemorySearch(TestFullTextSearch):
+    backend = 'memory'
+
+    def test_index_loads_existing_rows(self):
+        self.assertEqual(self.search("stove"), ["Mountain cabin"])
+
+
+if __name__ == '__main__':
+    unittest.main()
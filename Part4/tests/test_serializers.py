@@ -0,0 +1,66 @@
+#Part4/tests/test_serializers.py
+import unittest
+import pytest
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.api.v1.places import place_to_dict, serialize_place
+from app.api.v1.serializers import ModelSerializer
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestModelSerializer(unittest.TestCase):
+    def setUp(self):
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        self.place = Place("Loft", "Bright", 100, 1, 2, owner.id)
+        db.session.add_all([owner, self.place])
+        db.session.commit()
+
+    def test_compiled_once_per_field_set(self):
+        serializer = ModelSerializer({'id': 'id', 'title': '_title'}, {'upper': lambda place: place.title.upper()})
+        self.assertIs(serializer.compile(('id',)), serializer.compile(('id',)))
+        self.assertEqual(serializer.compile()(self.place), {'id': self.place.id, 'title': "Loft", 'upper': "LOFT"})
+
+    def test_unloaded_columns_fall_back_to_attributes(self):
+        expected = serialize_place(self.place)
+        db.session.expire(self.place)
+        self.assertNotIn('_title', self.place.__dict__)
+        self.assertEqual(serialize_place(self.place), expected)
+        self.assertEqual(expected['title'], "Loft")
+        self.assertEqual(serialize_place(self.place, nested=True)['owner']['email'], "owner@example.com")
+
+    def test_sparse_fieldsets(self):
+        self.assertEqual(place_to_dict(fields='price, id')(self.place), {'id': self.place.id, 'price': 100})
+        with self.assertRaises(ValueError):
+            place_to_dict(fields='id,secret')
+        response = self.client.get('/api/v1/places/?fields=id,title')
+        self.assertEqual(response.get_json()['data'], [{'id': self.place.id, 'title': "Loft"}])
+        self.assertEqual(self.client.get('/api/v1/users/?fields=password').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/places/?expand=true&fields=id,owner').get_json()['data'][0]
+                         ['owner']['first_name'], "Owner")
+
+    def test_detail_and_mutation_responses_use_the_serializers(self):
+        """Test that single-object responses carry the same fields as the list pages."""
+        guest = User("Guest", "Two", "guest@example.com", password="secret")
+        db.session.add(guest)
+        db.session.commit()
+        headers = {'Authorization': "Bearer " + create_access_token(identity={'id': guest.id, 'is_admin': False})}
+        created = self.client.post('/api/v1/reviews/', headers=headers, json={
+            'text': "Great", 'rating': 5, 'user_id': guest.id, 'place_id': self.place.id})
+        self.assertEqual(created.status_code, 201)
+        review = created.get_json()
+        self.assertEqual(review.pop('message'), 'Review successfully created')
+        self.assertEqual(self.client.get(f"/api/v1/reviews/{review['id']}").get_json(), review)
+        self.assertEqual(self.client.get('/api/v1/reviews/').get_json()['data'], [review])
+
+        headers = {'Authorization': "Bearer " + create_access_token(
+            identity={'id': self.place.owner_id, 'is_admin': False})}
+        updated = self.client.put(f'/api/v1/places/{self.place.id}', headers=headers, json={'title': "Sunny loft"})
+        self.assertEqual(updated.status_code, 200)
+        self.assertEqual(updated.get_json(), self.client.get('/api/v1/places/').get_json()['data'][0])
+        self.assertEqual(updated.get_json()['title'], "Sunny loft")
+
+
+if __name__ == '__main__':
+    unittest.main()
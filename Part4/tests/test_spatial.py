@@ -0,0 +1,206 @@
+#Part4/tests/test_spatial.py
+import random
+import unittest
+import pytest
+from sqlalchemy import update
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.persistence.repository import InMemoryRepository, unit_of_work
+from app.persistence.spatial import KDTree, haversine_km, radius_bbox
+from app.persistence.versions import CollectionVersions
+from app.services import facade
+from app.services.facade import PLACE_TREE_KEY
+
+
+class Point:
+    def __init__(self, obj_id, latitude, longitude):
+        self.id = obj_id
+        self.latitude = latitude
+        self.longitude = longitude
+
+    def update(self, data):
+        for key, value in data.items():
+            setattr(self, key, value)
+
+
+class TestGridIndex(unittest.TestCase):
+    def setUp(self):
+        self.repo = InMemoryRepository()
+        self.repo.add_spatial_index(cell_deg=0.5)
+        self.paris = Point('paris', 48.8566, 2.3522)
+        self.versailles = Point('versailles', 48.8049, 2.1204)
+        self.london = Point('london', 51.5072, -0.1276)
+        self.fiji = Point('fiji', -17.7134, 178.0650)
+        self.samoa = Point('samoa', -13.7590, -172.1046)
+        for obj in (self.paris, self.versailles, self.london, self.fiji, self.samoa):
+            self.repo.add(obj)
+
+    def test_haversine(self):
+        """Test the distance between Paris and London (about 344 km)."""
+        self.assertAlmostEqual(haversine_km(48.8566, 2.3522, 51.5072, -0.1276), 344, delta=2)
+
+    def test_find_near_sorted_by_distance(self):
+        """Test that radius search keeps points within the radius, closest first."""
+        found = self.repo.find_near(48.85, 2.34, 50)
+        self.assertEqual([obj.id for obj, _ in found], ['paris', 'versailles'])
+        self.assertLess(found[0][1], found[1][1])
+        self.assertEqual([obj.id for obj, _ in self.repo.find_near(48.85, 2.34, 500)],
+                         ['paris', 'versailles', 'london'])
+
+    def test_find_in_bbox_across_antimeridian(self):
+        """Test that a box with min_lon > max_lon wraps around 180 degrees."""
+        found = self.repo.find_in_bbox(-20, 170, -10, -170)
+        self.assertCountEqual([obj.id for obj in found], ['fiji', 'samoa'])
+
+    def test_find_in_bbox_limit_in_id_order(self):
+        found = self.repo.find_in_bbox(40, -10, 60, 10, limit=2)
+        self.assertEqual([obj.id for obj in found], ['london', 'paris'])
+
+    def test_update_and_delete_move_grid_entries(self):
+        """Test that updates and deletes keep the grid in sync."""
+        self.repo.delete('london')
+        self.assertEqual(self.repo.find_in_bbox(50, -1, 52, 1), [])
+        self.repo.update('versailles', {'latitude': 51.5, 'longitude': -0.1})
+        self.assertEqual([obj.id for obj in self.repo.find_in_bbox(50, -1, 52, 1)], ['versailles'])
+
+    def test_radius_bbox_reaching_pole_covers_all_longitudes(self):
+        """Test that a circle around a pole does not clip longitudes."""
+        min_lat, min_lon, max_lat, max_lon = radius_bbox(89.5, 10, 200)
+        self.assertEqual((min_lon, max_lon, max_lat), (-180.0, 180.0, 90.0))
+
+
+class TestKDTree(unittest.TestCase):
+    def test_nearest_matches_brute_force(self):
+        """Test k-NN results against sorting every point, after inserts and removals."""
+        rng = random.Random(7)
+        points = {str(i): (rng.uniform(-90, 90), rng.uniform(-180, 180)) for i in range(2000)}
+        tree = KDTree((obj_id, lat, lon) for obj_id, (lat, lon) in list(points.items())[:1000])
+        for obj_id, (lat, lon) in list(points.items())[1000:]:
+            tree.insert(obj_id, lat, lon)
+        for obj_id in list(points)[::3]:
+            tree.remove(obj_id)
+            del points[obj_id]
+        # Moving a point, and many points at the same spot
+        for obj_id in list(points)[::5]:
+            points[obj_id] = (0.0, 0.0)
+            tree.insert(obj_id, 0.0, 0.0)
+        self.assertEqual(len(tree), len(points))
+
+        for _ in range(50):
+            lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+            expected = sorted(haversine_km(lat, lon, *point) for point in points.values())[:5]
+            found = tree.nearest(lat, lon, 5)
+            for (_, distance), expected_distance in zip(found, expected):
+                self.assertAlmostEqual(distance, expected_distance, places=6)
+
+    def test_nearest_across_antimeridian(self):
+        """Test that neighbours on the other side of 180 degrees are found."""
+        tree = KDTree([('fiji', -17.7, 178.0), ('samoa', -13.8, -172.1), ('sydney', -33.9, 151.2)])
+        self.assertEqual([obj_id for obj_id, _ in tree.nearest(-15, -179, 2)], ['fiji', 'samoa'])
+
+
+@pytest.mark.usefixtures('testing_app', 'statements')
+class TestPlaceSearchEndpoint(unittest.TestCase):
+    def setUp(self):
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        db.session.add(owner)
+        for price, (title, lat, lon) in enumerate((("Paris", 48.8566, 2.3522), ("Versailles", 48.8049, 2.1204),
+                                                   ("London", 51.5072, -0.1276))):
+            db.session.add(Place(title, "", price + 1, lat, lon, owner.id))
+        db.session.commit()
+
+    def test_near_returns_places_with_distance(self):
+        response = self.client.get('/api/v1/places/?near=48.85,2.34&radius_km=50')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual([place['title'] for place in data], ['Paris', 'Versailles'])
+        self.assertLess(data[0]['distance_km'], data[1]['distance_km'])
+
+    def test_near_limit_is_applied_in_sql(self):
+        """Test that the database orders by distance and returns only limit rows."""
+        self.statements.clear()
+        found = facade.find_places_near(48.85, 2.34, 500, limit=2)
+        self.assertEqual([place.title for place, _ in found], ['Paris', 'Versailles'])
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn('LIMIT', self.statements[0])
+        self.assertAlmostEqual(found[1][1], haversine_km(48.85, 2.34, 48.8049, 2.1204))
+
+    def test_bbox(self):
+        response = self.client.get('/api/v1/places/?bbox=50,-1,52,1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([place['title'] for place in response.get_json()['data']], ['London'])
+
+    def test_bbox_limit_keeps_id_order(self):
+        """Test that a limited box search returns the first rows in id order."""
+        self.statements.clear()
+        found = facade.find_places_in_bbox(48, 0, 52, 3, limit=2)
+        expected = sorted(place.id for place in facade.find_places_in_bbox(48, 0, 52, 3))[:2]
+        self.assertEqual([place.id for place in found], expected)
+        self.assertIn('ORDER BY', self.statements[0])
+
+    def test_bbox_across_antimeridian(self):
+        """Test that a box with min_lon > max_lon wraps around 180 degrees."""
+        owner_id = facade.get_places_page()[0][0].owner_id
+        for title, lat, lon in (("Fiji", -17.7134, 178.0650), ("Samoa", -13.7590, -172.1046)):
+            facade.create_place({'title': title, 'description': "", 'price': 10,
+                                 'latitude': lat, 'longitude': lon, 'owner_id': owner_id})
+        response = self.client.get('/api/v1/places/?bbox=-20,170,-10,-170')
+        self.assertCountEqual([place['title'] for place in response.get_json()['data']], ['Fiji', 'Samoa'])
+
+    def test_nearest_includes_created_places(self):
+        response = self.client.get('/api/v1/places/nearest?lat=48.85&lon=2.34&k=2')
+        self.assertEqual([place['title'] for place in response.get_json()['data']], ['Paris', 'Versailles'])
+
+        owner_id = facade.get_places_page()[0][0].owner_id
+        facade.create_place({'title': "Louvre", 'description': "", 'price': 10,
+                             'latitude': 48.8606, 'longitude': 2.3376, 'owner_id': owner_id})
+        response = self.client.get('/api/v1/places/nearest?lat=48.86&lon=2.337&k=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([place['title'] for place in response.get_json()['data']], ['Louvre', 'Paris'])
+        self.assertEqual(self.client.get('/api/v1/places/nearest?lat=91&lon=0').status_code, 400)
+
+    def test_tree_only_sees_committed_coordinates(self):
+        """Test that a rolled back place never reaches the tree and cleared coordinates leave it."""
+        paris, versailles = facade.get_nearest_places(48.85, 2.34, 2)
+        self.assertEqual([place.title for place, _ in (paris, versailles)], ['Paris', 'Versailles'])
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                louvre = facade.create_place({'title': "Louvre", 'description': "", 'price': 10,
+                                              'latitude': 48.8606, 'longitude': 2.3376,
+                                              'owner_id': paris[0].owner_id})
+                raise RuntimeError("abort")
+        tree = self.app.extensions[PLACE_TREE_KEY].value
+        self.assertNotIn(louvre.id, tree)
+
+        facade.update_place(paris[0].id, {'latitude': None})
+        self.assertNotIn(paris[0].id, tree)
+        self.assertEqual([place.title for place, _ in facade.get_nearest_places(48.85, 2.34, 1)], ['Versailles'])
+
+    def test_tree_follows_writes_of_other_workers(self):
+        """Test that coordinates changed outside this process' ORM events reach the tree."""
+        paris, _ = facade.get_nearest_places(48.85, 2.34, 2)
+        tree = self.app.extensions[PLACE_TREE_KEY].value
+        # Another worker's write: only the database and its collection versions change
+        with db.engine.begin() as connection:
+            connection.execute(update(Place).where(Place.id == paris[0].id).values(latitude=0, longitude=0))
+            CollectionVersions().bump(['places'], connection)
+        db.session.expire_all()
+        found = facade.get_nearest_places(0.1, 0.1, 1)
+        self.assertEqual([place.title for place, _ in found], ['Paris'])
+        self.assertIsNot(self.app.extensions[PLACE_TREE_KEY].value, tree)
+
+        # This process' own writes are applied in place, without a reload
+        tree = self.app.extensions[PLACE_TREE_KEY].value
+        facade.update_place(paris[0].id, {'latitude': 48.8566, 'longitude': 2.3522})
+        self.assertEqual([place.title for place, _ in facade.get_nearest_places(48.85, 2.34, 1)], ['Paris'])
+        self.assertIs(self.app.extensions[PLACE_TREE_KEY].value, tree)
+
+    def test_invalid_search_parameters(self):
+        self.assertEqual(self.client.get('/api/v1/places/?near=48.85&radius_km=5').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/places/?near=48.85,2.34').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/places/?bbox=1,2,3').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
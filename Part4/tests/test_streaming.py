@@ -0,0 +1,75 @@
+#Part4/tests/test_streaming.py
+import json
+import unittest
+import pytest
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services import facade
+
+NDJSON = {'Accept': 'application/x-ndjson'}
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestNdjsonStreaming(unittest.TestCase):
+    def setUp(self):
+        owner = User("Owner", "One", "owner@example.com", password="secret")
+        place = Place("Loft", "", 100, 1, 1, owner.id)
+        db.session.add_all([owner, place])
+        db.session.add_all(Review(f"Review {i}", 1 + i % 5, place.id, owner.id) for i in range(30))
+        db.session.commit()
+        db.session.remove()
+
+    def lines(self, response):
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_reviews_stream_every_row(self):
+        response = self.client.get('/api/v1/reviews/', headers=NDJSON)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        reviews = self.lines(response)
+        ids = [review['id'] for review in reviews]
+        self.assertEqual(len(reviews), 30)
+        self.assertEqual(ids, sorted(ids))
+
+        rest = self.lines(self.client.get('/api/v1/reviews/?after=' + ids[9], headers=NDJSON))
+        self.assertEqual([review['id'] for review in rest], ids[10:])
+
+    def test_stream_memory_is_bounded_by_batch(self):
+        """Test that the session never holds more than one batch of streamed rows."""
+        seen, largest = 0, 0
+        for _ in facade.stream_reviews(batch_size=7):
+            seen += 1
+            largest = max(largest, len(db.session.identity_map))
+        self.assertEqual(seen, 30)
+        self.assertLessEqual(largest, 7)
+
+    def test_stream_keeps_objects_it_did_not_load(self):
+        """Test that streaming only detaches its own batches, not the caller's objects."""
+        owner = facade.get_user_by_email("owner@example.com")
+        first = db.session.scalars(db.select(Review).order_by(Review.id)).first()
+        streamed = list(facade.stream_reviews(batch_size=7))
+        self.assertEqual(len(streamed), 30)
+        self.assertIn(owner, db.session)
+        self.assertIn(first, db.session)
+        self.assertIs(streamed[0], first)
+        self.assertNotIn(streamed[1], db.session)
+
+    def test_places_stream_and_filters(self):
+        places = self.lines(self.client.get('/api/v1/places/?expand=true', headers=NDJSON))
+        self.assertEqual([place['title'] for place in places], ["Loft"])
+        self.assertEqual(len(places[0]['reviews']), 30)
+        self.assertEqual(self.client.get('/api/v1/places/?min_price=10', headers=NDJSON).status_code, 400)
+
+    def test_json_and_ndjson_have_distinct_etags(self):
+        json_etag = self.client.get('/api/v1/reviews/').headers['ETag']
+        ndjson = self.client.get('/api/v1/reviews/', headers=NDJSON)
+        self.assertNotEqual(ndjson.headers['ETag'], json_etag)
+        self.assertEqual(ndjson.headers['Vary'], 'Accept')
+
+    def test_export_requires_token(self):
+        self.assertEqual(self.client.get('/api/v1/export/reviews').status_code, 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
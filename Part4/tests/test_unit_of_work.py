@@ -0,0 +1,75 @@
+#Part4/tests/test_unit_of_work.py
+import unittest
+import pytest
+from sqlalchemy import event
+from app import db
+from app.models.amenity import Amenity
+from app.persistence.repository import SQLAlchemyRepository, unit_of_work
+
+
+@pytest.mark.usefixtures('testing_app')
+class TestUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        self.repo = SQLAlchemyRepository(Amenity)
+        self.commits = 0
+        event.listen(db.session, 'after_commit', self.count_commit)
+
+    def tearDown(self):
+        event.remove(db.session, 'after_commit', self.count_commit)
+
+    def count_commit(self, session):
+        self.commits += 1
+
+    def names(self):
+        db.session.expire_all()
+        return sorted(amenity.name for amenity in Amenity.query)
+
+    def test_writes_outside_a_block_commit_at_once(self):
+        self.repo.add(Amenity("WiFi"))
+        self.repo.add(Amenity("Pool"))
+        self.assertEqual(self.commits, 2)
+
+    def test_block_commits_once_on_exit(self):
+        with unit_of_work():
+            self.repo.add(Amenity("WiFi"))
+            pool = Amenity("Pool")
+            self.repo.add(pool)
+            self.repo.update(pool.id, {'name': "Heated pool"})
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self.names(), ["Heated pool", "WiFi"])
+
+    def test_nested_blocks_join_the_outer_transaction(self):
+        with unit_of_work() as outer:
+            self.repo.add(Amenity("WiFi"))
+            with unit_of_work() as inner:
+                self.assertIs(inner, outer)
+                self.repo.add(Amenity("Pool"))
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self.names(), ["Pool", "WiFi"])
+
+    def test_error_in_a_nested_block_rolls_back_everything(self):
+        self.repo.add(Amenity("Sauna"))
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                self.repo.add(Amenity("WiFi"))
+                with unit_of_work():
+                    self.repo.add(Amenity("Pool"))
+                    raise RuntimeError("abort")
+        self.assertEqual(self.names(), ["Sauna"])
+
+    def test_depth_is_restored_after_an_error(self):
+        """Test that writes after a failed block commit on their own again."""
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                raise RuntimeError("abort")
+        commits = self.commits
+        self.repo.add(Amenity("WiFi"))
+        self.assertEqual(self.commits, commits + 1)
+        db.session.remove()
+        self.assertEqual(self.names(), ["WiFi"])
+
+
+if __name__ == '__main__':
+    unittest.main()